@@ -0,0 +1,118 @@
+import gzip
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.utils.translation import get_language
+from djangorestframework_camel_case.util import camelize
+from rest_framework.utils.encoders import JSONEncoder
+
+from context.models import Context, Module
+from context.serializers import ContextSerializer, ModuleSerializer
+from statement.models import (
+    Mitigation,
+    Opportunity,
+    OptionMitigation,
+    OptionOpportunity,
+    OptionStatement,
+    QuestionStatement,
+    Statement,
+    StatementTag,
+    StatementTagGroup,
+    StatementTopic,
+)
+from statement.serializers import (
+    MitigationSerializer,
+    OpportunitySerializer,
+    OptionMitigationSerializer,
+    OptionOpportunitySerializer,
+    OptionStatementSerializer,
+    QuestionStatementSerializer,
+    StatementSerializer,
+    StatementTagGroupSerializer,
+    StatementTagSerializer,
+    StatementTopicSerializer,
+)
+from survey.models import Option, Question, QuestionGroup
+from survey.serializers import (
+    OptionSerializer,
+    QuestionGroupSerializer,
+    QuestionSerializer,
+)
+
+from .utils import get_catalog_version
+
+CATALOG_BUNDLE_CACHE_TIMEOUT = 60 * 60 * 24
+
+# key of bundle, model, serializer and prefetched many to many fields
+CATALOG_ENTRIES = [
+    ("contexts", Context, ContextSerializer, []),
+    ("modules", Module, ModuleSerializer, []),
+    ("question_groups", QuestionGroup, QuestionGroupSerializer, []),
+    ("questions", Question, QuestionSerializer, []),
+    ("options", Option, OptionSerializer, []),
+    ("statement_topics", StatementTopic, StatementTopicSerializer, []),
+    ("statement_tag_groups", StatementTagGroup, StatementTagGroupSerializer, []),
+    ("statement_tags", StatementTag, StatementTagSerializer, []),
+    ("statements", Statement, StatementSerializer, ["tags", "questions", "options"]),
+    ("mitigations", Mitigation, MitigationSerializer, ["options"]),
+    ("opportunities", Opportunity, OpportunitySerializer, ["options"]),
+    ("question_statements", QuestionStatement, QuestionStatementSerializer, []),
+    ("option_statements", OptionStatement, OptionStatementSerializer, []),
+    ("option_mitigations", OptionMitigation, OptionMitigationSerializer, []),
+    ("option_opportunities", OptionOpportunity, OptionOpportunitySerializer, []),
+]
+CATALOG_MODELS = [model for _key, model, _serializer, _prefetch in CATALOG_ENTRIES]
+
+
+def serialize_catalog(request):
+    """
+    Serialize whole catalog in active language with one query per model and
+    prefetched many to many field.
+    """
+    return {
+        key: serializer_class(
+            model.objects.prefetch_related(*prefetch),
+            many=True,
+            context={"request": request},
+        ).data
+        for key, model, serializer_class, prefetch in CATALOG_ENTRIES
+    }
+
+
+def build_catalog_bundle(version, request):
+    """
+    Return gzip compressed json of catalog. Keys are camelized in same way as
+    responses of catalog viewsets.
+    """
+    data = {
+        "version": version,
+        "language": get_language(),
+        **serialize_catalog(request),
+    }
+    content = json.dumps(camelize(data), cls=JSONEncoder).encode()
+    # fixed mtime keeps compressed content and its ETag same across workers
+    return gzip.compress(content, mtime=0)
+
+
+def get_catalog_bundle(request):
+    """
+    Return version, ETag and compressed content of catalog bundle for active
+    language.
+
+    Bundle is built once per catalog version, language and host of request and is
+    served from cache afterwards so unchanged catalog only costs version lookup.
+    """
+    version = get_catalog_version()
+    language = get_language()
+    cache_key = (
+        f"catalog-bundle-{version}-{language}-"
+        + hashlib.sha256(request.get_host().encode()).hexdigest()
+    )
+    bundle = cache.get(cache_key)
+    if bundle is None:
+        content = build_catalog_bundle(version, request)
+        etag = f'W/"{version}-{hashlib.sha256(content).hexdigest()[:16]}"'
+        bundle = (version, etag, content)
+        cache.set(cache_key, bundle, timeout=CATALOG_BUNDLE_CACHE_TIMEOUT)
+    return bundle
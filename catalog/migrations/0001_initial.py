@@ -0,0 +1,31 @@
+# Generated by Django 3.2.25 on 2026-10-18 17:31
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogRevision',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('modified_at', models.DateTimeField(auto_now=True, verbose_name='modified at')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='object id')),
+                ('is_deleted', models.BooleanField(default=False, verbose_name='deleted')),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='contenttypes.contenttype', verbose_name='content type')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='catalogrevision',
+            index=models.Index(fields=['content_type', 'object_id'], name='catalog_revision_object_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 3.2.25 on 2026-10-18 18:08
+
+from django.db import migrations, models
+
+
+def create_lock_row(apps, schema_editor):
+    apps.get_model('catalog', 'CatalogRevisionLock').objects.get_or_create(pk=1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogRevisionLock',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+            ],
+            options={
+                'default_permissions': (),
+            },
+        ),
+        migrations.RunPython(create_lock_row, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from neatplus.models import TimeStampedModel
+
+
+class CatalogRevision(TimeStampedModel):
+    """
+    Append only log of changes of questionnaire and statement catalog. Primary key
+    of latest revision is used as content version of catalog.
+    """
+
+    content_type = models.ForeignKey(
+        ContentType,
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name=_("content type"),
+    )
+    object_id = models.PositiveBigIntegerField(_("object id"))
+    is_deleted = models.BooleanField(_("deleted"), default=False)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["content_type", "object_id"],
+                name="catalog_revision_object_idx",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.content_type}-{self.object_id}-{self.pk}"
+
+
+class CatalogRevisionLock(models.Model):
+    """
+    Single row which is locked while revisions are recorded on database without
+    advisory lock so that transactions recording revisions are serialized.
+    """
+
+    class Meta:
+        default_permissions = ()
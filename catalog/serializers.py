@@ -0,0 +1,29 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework import serializers
+
+
+class CatalogChangesQuerySerializer(serializers.Serializer):
+    since = serializers.IntegerField(
+        min_value=0,
+        required=False,
+        help_text=_("Catalog version after which changes are returned"),
+    )
+    since_time = serializers.DateTimeField(
+        required=False,
+        help_text=_("Time after which changes are returned"),
+    )
+
+    def validate(self, attrs):
+        if "since" not in attrs and "since_time" not in attrs:
+            raise serializers.ValidationError(
+                _("Either since or since_time should be provided")
+            )
+        return attrs
+
+
+class CatalogChangesSerializer(serializers.Serializer):
+    version = serializers.IntegerField()
+    changes = serializers.DictField(child=serializers.ListField())
+    deleted = serializers.DictField(
+        child=serializers.ListField(child=serializers.IntegerField())
+    )
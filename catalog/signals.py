@@ -0,0 +1,107 @@
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+
+from statement.models import (
+    OptionMitigation,
+    OptionOpportunity,
+    OptionStatement,
+    QuestionStatement,
+    Statement,
+    StatementTag,
+)
+
+from .bundle import CATALOG_MODELS
+from .utils import record_catalog_revisions
+
+# foreign keys of catalog models whose target is serialized with list of related
+# objects so that target is changed along with related object
+CATALOG_PARENT_FIELDS = {
+    QuestionStatement: "statement",
+    OptionStatement: "statement",
+    OptionMitigation: "mitigation",
+    OptionOpportunity: "opportunity",
+}
+
+
+def record_parent_revisions(sender, instance):
+    field_name = CATALOG_PARENT_FIELDS.get(sender)
+    if field_name:
+        field = sender._meta.get_field(field_name)
+        record_catalog_revisions(
+            field.related_model, [getattr(instance, field.attname)]
+        )
+
+
+def record_sibling_revisions(sender, siblings):
+    """
+    Record siblings of ordered model whose order is shifted by queryset update of
+    django-ordered-model which doesn't send any signal.
+    """
+    record_catalog_revisions(sender, siblings.values_list("pk", flat=True))
+
+
+def remember_previous_order(sender, instance, raw=False, **kwargs):
+    instance._catalog_previous_order = None
+    if not raw and instance.pk is not None:
+        instance._catalog_previous_order = (
+            sender.objects.filter(pk=instance.pk)
+            .values_list(instance.order_field_name, flat=True)
+            .first()
+        )
+
+
+def record_saved_catalog_object(sender, instance, raw=False, **kwargs):
+    record_catalog_revisions(sender, [instance.pk])
+    record_parent_revisions(sender, instance)
+    previous_order = getattr(instance, "_catalog_previous_order", None)
+    order = getattr(instance, instance.order_field_name)
+    if previous_order is not None and previous_order != order:
+        record_sibling_revisions(
+            sender,
+            instance.get_ordering_queryset()
+            .filter(
+                **{
+                    f"{instance.order_field_name}__gte": min(previous_order, order),
+                    f"{instance.order_field_name}__lte": max(previous_order, order),
+                }
+            )
+            .exclude(pk=instance.pk),
+        )
+
+
+def record_deleted_catalog_object(sender, instance, **kwargs):
+    record_catalog_revisions(sender, [instance.pk], is_deleted=True)
+    record_parent_revisions(sender, instance)
+
+
+def record_catalog_object_dependents(sender, instance, **kwargs):
+    # objects ordered after deleted object are shifted up by OrderedModel.delete()
+    record_sibling_revisions(
+        sender, instance.get_ordering_queryset().above_instance(instance)
+    )
+    if sender is StatementTag:
+        record_catalog_revisions(
+            Statement, instance.statements.values_list("pk", flat=True)
+        )
+
+
+def record_statement_tags_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        record_catalog_revisions(Statement, [instance.pk])
+    elif pk_set:
+        record_catalog_revisions(Statement, pk_set)
+
+
+for catalog_model in CATALOG_MODELS:
+    pre_save.connect(remember_previous_order, sender=catalog_model)
+    post_save.connect(record_saved_catalog_object, sender=catalog_model)
+    pre_delete.connect(record_catalog_object_dependents, sender=catalog_model)
+    post_delete.connect(record_deleted_catalog_object, sender=catalog_model)
+m2m_changed.connect(record_statement_tags_change, sender=Statement.tags.through)
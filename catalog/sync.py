@@ -0,0 +1,39 @@
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+
+from .bundle import CATALOG_ENTRIES, CATALOG_MODELS
+
+
+def get_catalog_changes(revisions, request):
+    """
+    Return current rows and tombstones of catalog objects changed by provided
+    revisions.
+
+    Each changed object is serialized once in its current state regardless of
+    number of its revisions and object which no longer exists is reported as
+    deleted. Changed objects of each model are loaded with single query.
+    """
+    content_types = ContentType.objects.get_for_models(*CATALOG_MODELS)
+    changed_ids = defaultdict(set)
+    for content_type_id, object_id in revisions.values_list(
+        "content_type_id", "object_id"
+    ).distinct():
+        changed_ids[content_type_id].add(object_id)
+    changes = {}
+    deleted = {}
+    for key, model, serializer_class, prefetch in CATALOG_ENTRIES:
+        object_ids = changed_ids.get(content_types[model].pk)
+        if not object_ids:
+            continue
+        objects = list(
+            model.objects.filter(pk__in=object_ids).prefetch_related(*prefetch)
+        )
+        if objects:
+            changes[key] = serializer_class(
+                objects, many=True, context={"request": request}
+            ).data
+        deleted_ids = object_ids - {obj.pk for obj in objects}
+        if deleted_ids:
+            deleted[key] = sorted(deleted_ids)
+    return {"changes": changes, "deleted": deleted}
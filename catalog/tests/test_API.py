@@ -0,0 +1,63 @@
+import gzip
+import json
+
+from neatplus.tests import FullTestCase
+
+
+class APITest(FullTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.question = cls.baker.make("survey.Question")
+        cls.baker.make("survey.Option", question=cls.question, _quantity=2)
+        cls.statement = cls.baker.make("statement.Statement")
+        cls.catalog_url = cls.reverse("catalog-list", kwargs={"version": "v1"})
+
+    def test_catalog_bundle(self):
+        response = self.client.get(self.catalog_url, HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        data = json.loads(gzip.decompress(response.content))
+        self.assertEqual(str(data["version"]), response["X-Catalog-Version"])
+        self.assertEqual(len(data["questions"]), 1)
+        self.assertEqual(len(data["options"]), 2)
+        self.assertEqual(len(data["statements"]), 1)
+        self.assertIn("questionGroups", data)
+
+        etag = response["ETag"]
+        response = self.client.get(self.catalog_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, self.status_code.HTTP_304_NOT_MODIFIED)
+
+        self.statement.title = "Updated statement"
+        self.statement.save()
+        response = self.client.get(self.catalog_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        data = json.loads(response.content)
+        self.assertEqual(data["statements"][0]["title"], "Updated statement")
+
+    def test_catalog_changes(self):
+        changes_url = self.reverse("catalog-changes", kwargs={"version": "v1"})
+        response = self.client.get(changes_url)
+        self.assertEqual(response.status_code, self.status_code.HTTP_400_BAD_REQUEST)
+        response = self.client.get(changes_url, {"since": 0})
+        self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+        version = response.data["version"]
+        self.assertEqual(len(response.data["changes"]["questions"]), 1)
+
+        option = self.baker.make("survey.Option", question=self.question)
+        statement = self.baker.make("statement.Statement")
+        statement_pk = statement.pk
+        statement.delete()
+        response = self.client.get(changes_url, {"since": version})
+        self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+        self.assertGreater(response.data["version"], version)
+        self.assertEqual(
+            [row["id"] for row in response.data["changes"]["options"]], [option.pk]
+        )
+        self.assertNotIn("questions", response.data["changes"])
+        self.assertEqual(response.data["deleted"]["statements"], [statement_pk])
+
+        response = self.client.get(changes_url, {"since": response.data["version"]})
+        self.assertEqual(response.data["changes"], {})
+        self.assertEqual(response.data["deleted"], {})
@@ -0,0 +1,44 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import Max
+
+from neatplus.utils import acquire_advisory_lock
+
+from .models import CatalogRevision, CatalogRevisionLock
+
+# key of advisory lock which serializes transactions recording catalog revisions
+CATALOG_REVISION_LOCK_ID = 4_202_110
+
+
+def record_catalog_revisions(model, object_ids, is_deleted=False):
+    """
+    Record revisions of catalog objects.
+
+    Ids of revisions are used as sync cursor but sequence value is assigned on
+    insert while row becomes visible only on commit. Revisions are therefore
+    inserted while holding transaction level advisory lock so that transactions
+    recording revisions commit in order of their ids and catalog version never
+    passes revision which isn't visible yet. Databases without advisory lock lock
+    single row of CatalogRevisionLock instead.
+    """
+    object_ids = list(object_ids)
+    if not object_ids:
+        return
+    content_type = ContentType.objects.get_for_model(model)
+    with transaction.atomic():
+        if not acquire_advisory_lock(CATALOG_REVISION_LOCK_ID):
+            CatalogRevisionLock.objects.select_for_update().get_or_create(pk=1)
+        CatalogRevision.objects.bulk_create(
+            [
+                CatalogRevision(
+                    content_type=content_type,
+                    object_id=object_id,
+                    is_deleted=is_deleted,
+                )
+                for object_id in object_ids
+            ]
+        )
+
+
+def get_catalog_version():
+    return CatalogRevision.objects.aggregate(version=Max("pk"))["version"] or 0
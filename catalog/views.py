@@ -0,0 +1,81 @@
+import gzip
+import re
+
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import parse_etags
+from django.utils.translation import gettext_lazy as _
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+from rest_framework import permissions, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from .bundle import get_catalog_bundle
+from .models import CatalogRevision
+from .serializers import CatalogChangesQuerySerializer, CatalogChangesSerializer
+from .sync import get_catalog_changes
+from .utils import get_catalog_version
+
+re_accepts_gzip = re.compile(r"\bgzip\b")
+
+
+class CatalogViewSet(viewsets.GenericViewSet):
+    permission_classes = [permissions.AllowAny]
+    pagination_class = None
+
+    @extend_schema(responses={(200, "application/json"): OpenApiTypes.OBJECT})
+    def list(self, request, *args, **kwargs):
+        """
+        Return whole questionnaire and statement catalog in language of request.
+        Bundle carries content version in X-Catalog-Version header and ETag so that
+        unchanged catalog is answered with 304.
+        """
+        version, etag, content = get_catalog_bundle(request)
+        if_none_match = parse_etags(request.headers.get("If-None-Match", ""))
+        if etag in if_none_match or "*" in if_none_match:
+            response = HttpResponseNotModified()
+        elif re_accepts_gzip.search(request.headers.get("Accept-Encoding", "")):
+            response = HttpResponse(content, content_type="application/json")
+            response["Content-Encoding"] = "gzip"
+        else:
+            response = HttpResponse(
+                gzip.decompress(content), content_type="application/json"
+            )
+        response["ETag"] = etag
+        response["X-Catalog-Version"] = str(version)
+        patch_cache_control(response, public=True, no_cache=True)
+        patch_vary_headers(response, ["Accept-Encoding", "Accept-Language"])
+        return response
+
+    @extend_schema(
+        parameters=[CatalogChangesQuerySerializer],
+        responses=CatalogChangesSerializer,
+    )
+    @action(methods=["get"], detail=False)
+    def changes(self, request, *args, **kwargs):
+        """
+        Return catalog objects created or updated and ids of objects deleted after
+        provided catalog version or time along with current catalog version which
+        should be used as cursor of next request.
+        """
+        query_serializer = CatalogChangesQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        since = query_serializer.validated_data.get("since")
+        since_time = query_serializer.validated_data.get("since_time")
+        version = get_catalog_version()
+        if since is not None and since > version:
+            return Response(
+                {"error": _("Unknown catalog version")},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        revisions = CatalogRevision.objects.filter(pk__lte=version)
+        if since is not None:
+            revisions = revisions.filter(pk__gt=since)
+        if since_time is not None:
+            revisions = revisions.filter(created_at__gt=since_time)
+        data = {"version": version, **get_catalog_changes(revisions, request)}
+        response = Response(data)
+        response["X-Catalog-Version"] = str(version)
+        patch_vary_headers(response, ["Accept-Language"])
+        return response
@@ -31,3 +31,22 @@ class APITest(FullTestCase):
     def test_module_detail(self):
         response = self.client.get(self.module_detail_url)
         self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+
+    def test_context_list_conditional_get(self):
+        response = self.client.get(self.context_list_url)
+        self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+        etag = response["ETag"]
+        response = self.client.get(self.context_list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, self.status_code.HTTP_304_NOT_MODIFIED)
+        self.baker.make("context.Context")
+        response = self.client.get(self.context_list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_context_detail_conditional_get(self):
+        response = self.client.get(self.context_detail_url)
+        self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+        etag = response["ETag"]
+        response = self.client.get(self.context_detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, self.status_code.HTTP_304_NOT_MODIFIED)
+        self.assertFalse(response.has_header("Last-Modified"))
@@ -1,14 +1,16 @@
 from rest_framework import viewsets
 
+from neatplus.views import ConditionalGetMixin
+
 from .models import Context, Module
 from .serializers import ContextSerializer, ModuleSerializer
 
 
-class ContextViewSet(viewsets.ReadOnlyModelViewSet):
+class ContextViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Context.objects.all()
     serializer_class = ContextSerializer
 
 
-class ModuleViewSet(viewsets.ReadOnlyModelViewSet):
+class ModuleViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Module.objects.all()
     serializer_class = ModuleSerializer
@@ -2,11 +2,16 @@
 poetry install
 if [ "$CELERY_WORKER" = "true" ]
 then
+    CELERY_OPTIONS=""
+    if [ "$CELERY_BEAT" = "true" ]
+    then
+        CELERY_OPTIONS="-B"
+    fi
     if [ -z "$CELERY_QUEUES" ]
     then
-        poetry run celery -A neatplus worker -l info
+        poetry run celery -A neatplus worker -l info $CELERY_OPTIONS
     else
-        poetry run celery -A neatplus worker -l info -Q "$CELERY_QUEUES"
+        poetry run celery -A neatplus worker -l info -Q "$CELERY_QUEUES" $CELERY_OPTIONS
     fi
 else
     poetry run ./manage.py collectstatic --no-input
@@ -1,11 +1,19 @@
 #!/bin/sh
-if [ "$CELERY_WORKER" = "true" ]
+if [ "$CELERY_BEAT_SCHEDULER" = "true" ]
 then
+    poetry run celery -A neatplus beat -l info -s /tmp/celerybeat-schedule
+elif [ "$CELERY_WORKER" = "true" ]
+then
+    CELERY_OPTIONS=""
+    if [ "$CELERY_BEAT" = "true" ]
+    then
+        CELERY_OPTIONS="-B"
+    fi
     if [ -z "$CELERY_QUEUES" ]
     then
-        poetry run celery -A neatplus worker -l info
+        poetry run celery -A neatplus worker -l info $CELERY_OPTIONS
     else
-        poetry run celery -A neatplus worker -l info -Q "$CELERY_QUEUES"
+        poetry run celery -A neatplus worker -l info -Q "$CELERY_QUEUES" $CELERY_OPTIONS
     fi
 else
     poetry run ./manage.py migrate --no-input
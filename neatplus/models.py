@@ -1,8 +1,91 @@
+import copy
+
 from django.conf import settings
 from django.db import models
+from django.db.models.fields.files import FieldFile
 from django.utils.translation import gettext_lazy as _
 
 
+class DirtyFieldsMixin:
+    """
+    Keep values of concrete fields as they were loaded from or last saved to
+    database so that save() of existing object only updates changed fields without
+    fetching row again. Explicitly provided update_fields are used as it is.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._loaded_values = {}
+        self._snapshot_field_values()
+
+    def _get_field_value(self, field):
+        value = getattr(self, field.attname)
+        if isinstance(value, FieldFile):
+            return value.name
+        if isinstance(value, (dict, list)):
+            return copy.deepcopy(value)
+        return value
+
+    def _snapshot_field_values(self, fields=None):
+        deferred_fields = self.get_deferred_fields()
+        for field in self._meta.concrete_fields:
+            if field.attname in deferred_fields:
+                continue
+            if fields is None or field.name in fields or field.attname in fields:
+                self._loaded_values[field.attname] = self._get_field_value(field)
+
+    def refresh_from_db(self, using=None, fields=None):
+        super().refresh_from_db(using=using, fields=fields)
+        self._snapshot_field_values(fields)
+
+    def get_changed_fields(self):
+        """
+        Return names of concrete fields whose value differs from loaded value.
+        Fields which weren't loaded but are assigned later are considered changed.
+        """
+        deferred_fields = self.get_deferred_fields()
+        changed_fields = []
+        for field in self._meta.concrete_fields:
+            if field.primary_key or field.attname in deferred_fields:
+                continue
+            if field.attname not in self._loaded_values:
+                changed_fields.append(field.name)
+                continue
+            value = self._get_field_value(field)
+            if (
+                isinstance(value, str)
+                and hasattr(field, "is_custom_lower_field")
+                and field.is_custom_lower_field()
+            ):
+                value = value.lower()
+            if value != self._loaded_values[field.attname]:
+                changed_fields.append(field.name)
+        return changed_fields
+
+    def get_update_fields(self, changed_fields):
+        """
+        Return update fields for changed fields including auto_now fields so that
+        modification time is updated whenever anything is changed.
+        """
+        if not changed_fields:
+            return []
+        update_fields = list(dict.fromkeys(changed_fields))
+        for field in self._meta.concrete_fields:
+            if getattr(field, "auto_now", False) and field.name not in update_fields:
+                update_fields.append(field.name)
+        return update_fields
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = self.get_update_fields(self.get_changed_fields())
+        super().save(*args, **kwargs)
+        # fields left out of update_fields are still unsaved so they stay changed
+        update_fields = kwargs.get("update_fields")
+        self._snapshot_field_values(
+            None if update_fields is None else set(update_fields)
+        )
+
+
 class TimeStampedModel(models.Model):
     created_at = models.DateTimeField(_("created at"), auto_now_add=True)
     modified_at = models.DateTimeField(_("modified at"), auto_now=True)
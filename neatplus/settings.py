@@ -73,6 +73,7 @@ DJANGO_APPS = [
 
 # Internal/Local apps
 INTERNAL_APPS = [
+    "catalog",
     "context",
     "notification",
     "organization",
@@ -398,6 +399,19 @@ if ENABLE_CELERY:
     CELERY_TIMEZONE = TIME_ZONE
     CELERY_WORKER_HIJACK_ROOT_LOGGER = False
     CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+    CELERY_BEAT_SCHEDULE = {
+        "refresh-analytics-cube": {
+            "task": "summary.tasks.refresh_analytics_cube",
+            "schedule": env.int("ANALYTICS_CUBE_REFRESH_INTERVAL", default=60 * 60),
+        },
+        "rebuild-analytics-cube": {
+            "task": "summary.tasks.refresh_analytics_cube",
+            "schedule": env.int(
+                "ANALYTICS_CUBE_REBUILD_INTERVAL", default=60 * 60 * 24
+            ),
+            "kwargs": {"full": True},
+        },
+    }
 
 
 # Default auto field
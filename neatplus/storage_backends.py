@@ -1,3 +1,4 @@
+from botocore.exceptions import BotoCoreError, ClientError
 from django.conf import settings
 from storages.backends.s3boto3 import S3Boto3Storage, S3StaticStorage
 
@@ -12,6 +13,18 @@ class MediaStorage(S3Boto3Storage):
     default_acl = "private"
     file_overwrite = False
 
+    def read_header(self, name, size):
+        """
+        Read first size bytes of file by downloading only that byte range of object.
+        Error of S3 is raised as OSError same as for file which can't be opened.
+        """
+        name = self._normalize_name(self._clean_name(name))
+        try:
+            response = self.bucket.Object(name).get(Range=f"bytes=0-{size - 1}")
+        except (BotoCoreError, ClientError) as err:
+            raise OSError(f"Failed to read header of {name}") from err
+        return response["Body"].read()
+
 
 class CKEditorStorage(S3Boto3Storage):
     location = settings.MEDIA_LOCATION
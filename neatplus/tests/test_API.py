@@ -1,8 +1,11 @@
+import io
+
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from PIL import Image
 
 from neatplus.tests import FullTestCase
-from neatplus.utils import gen_random_password
+from neatplus.utils import IMAGE_HEADER_SIZE, gen_random_password, get_image_format
 
 
 class APITest(FullTestCase):
@@ -32,3 +35,12 @@ class APITest(FullTestCase):
             data={"username": self.user.email, "password": self.user_pass},
         )
         self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+
+    def test_get_image_format_bmp(self):
+        for size in [(1, 1), (64, 64)]:
+            image_file = io.BytesIO()
+            Image.new("RGB", size).save(image_file, "bmp")
+            header = image_file.getvalue()[:IMAGE_HEADER_SIZE]
+            self.assertEqual(get_image_format(header), "bmp")
+        self.assertIsNone(get_image_format(b"BM is not an image, just some text"))
+        self.assertIsNone(get_image_format(b"BM\x3a\x00\x00\x00"))
@@ -15,6 +15,7 @@ from rest_framework_simplejwt.views import (
     TokenVerifyView,
 )
 
+from catalog.views import CatalogViewSet
 from context.views import ContextViewSet, ModuleViewSet
 from notification.views import NoticeViewSet, NotificationViewSet
 from organization.views import OrganizationMemberRequestViewSet, OrganizationViewSet
@@ -26,12 +27,18 @@ from statement.views import (
     OptionOpportunityViewSet,
     OptionStatementViewSet,
     QuestionStatementViewSet,
+    RecommendationViewSet,
     StatementTagGroupViewSet,
     StatementTagViewSet,
     StatementTopicViewSet,
     StatementViewSet,
 )
-from summary.views import SurveyResultViewSet
+from summary.views import (
+    AnalyticsCubeViewSet,
+    DataExportViewSet,
+    ProjectScoreSummaryViewSet,
+    SurveyResultViewSet,
+)
 from support.views import (
     ActionViewSet,
     FrequentlyAskedQuestionViewSet,
@@ -44,6 +51,7 @@ from survey.views import (
     QuestionGroupViewSet,
     QuestionViewSet,
     SurveyAnswerViewSet,
+    SurveySubmissionJobViewSet,
     SurveyViewSet,
 )
 from user.views import UserViewSet
@@ -61,7 +69,10 @@ class CustomDefaultRouter(routers.DefaultRouter):
 
 router = CustomDefaultRouter()
 router.register("action", ActionViewSet, basename="action")
+router.register("analytics-cube", AnalyticsCubeViewSet, basename="analytics-cube")
+router.register("catalog", CatalogViewSet, basename="catalog")
 router.register("context", ContextViewSet, basename="context")
+router.register("data-export", DataExportViewSet, basename="data-export")
 router.register(
     "frequently-asked-question",
     FrequentlyAskedQuestionViewSet,
@@ -88,11 +99,17 @@ router.register(
     basename="organization-member-request",
 )
 router.register("project", ProjectViewSet, basename="project")
+router.register(
+    "project-score-summary",
+    ProjectScoreSummaryViewSet,
+    basename="project-score-summary",
+)
 router.register("question", QuestionViewSet, basename="question")
 router.register("question-group", QuestionGroupViewSet, basename="question-group")
 router.register(
     "question-statement", QuestionStatementViewSet, basename="question-statement"
 )
+router.register("recommendation", RecommendationViewSet, basename="recommendation")
 router.register("resource", ResourceViewSet, basename="resource")
 router.register("resource-tag", ResourceTagViewSet, basename="resource-tag")
 router.register("statement", StatementViewSet, basename="statement")
@@ -104,6 +121,11 @@ router.register("statement-topic", StatementTopicViewSet, basename="statement-to
 router.register("survey", SurveyViewSet, basename="survey")
 router.register("survey-answer", SurveyAnswerViewSet, basename="survey-answer")
 router.register("survey-result", SurveyResultViewSet, basename="survey-result")
+router.register(
+    "survey-submission-job",
+    SurveySubmissionJobViewSet,
+    basename="survey-submission-job",
+)
 router.register("user", UserViewSet, basename="user")
 
 
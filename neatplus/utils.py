@@ -1,11 +1,24 @@
+import hashlib
+import itertools
 import secrets
 import string
+import struct
 
 from django.contrib.auth.password_validation import validate_password
-from django.core.exceptions import ValidationError
+from django.core.cache import cache
+from django.core.exceptions import SuspiciousFileOperation, ValidationError
+from django.core.files.storage import default_storage
+from django.db import connection
 
 RANDOM_STRING_CHARS = string.ascii_letters + string.digits
 
+IMAGE_HEADER_SIZE = 32
+BMP_FILE_HEADER_SIZE = 14
+BMP_DIB_HEADER_SIZES = {12, 40, 52, 56, 64, 108, 124}
+VALIDATED_IMAGE_CACHE_TIMEOUT = 60 * 60 * 24
+STORAGE_URL_CACHE_TIMEOUT = 60 * 60 * 24
+SIGNED_URL_EXPIRY_MARGIN = 60 * 5
+
 
 def gen_random_number(length):
     range_start = 10 ** (length - 1)
@@ -28,3 +41,149 @@ def gen_random_password(
         return random_password
     except ValidationError as _err:
         return gen_random_password(length=length, allowed_chars=allowed_chars)
+
+
+def acquire_advisory_lock(lock_id):
+    """
+    Take PostgreSQL transaction level advisory lock which is released at end of
+    current transaction. Other databases don't support advisory lock so False is
+    returned without locking and caller has to serialize in other way.
+    """
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_xact_lock(%s)", [lock_id])
+    return True
+
+
+def read_file_header(name, size, storage=default_storage):
+    """
+    Read first size bytes of file from storage. Storage which supports reading
+    header (such as S3 media storage) only downloads requested bytes.
+    """
+    if hasattr(storage, "read_header"):
+        return storage.read_header(name, size)
+    with storage.open(name) as file:
+        return file.read(size)
+
+
+def is_bmp_header(header):
+    """
+    Check BMP file header along with size of DIB header which follows it. Only
+    "BM" magic number is too common for text files to be trusted alone.
+    """
+    if len(header) < BMP_FILE_HEADER_SIZE + 4 or not header.startswith(b"BM"):
+        return False
+    file_size, _reserved, pixel_offset, dib_header_size = struct.unpack_from(
+        "<IIII", header, 2
+    )
+    return (
+        dib_header_size in BMP_DIB_HEADER_SIZES
+        and BMP_FILE_HEADER_SIZE + dib_header_size <= pixel_offset <= file_size
+    )
+
+
+def get_image_format(header):
+    """
+    Sniff image format from magic number present in header of file
+    """
+    if header.startswith(b"\xff\xd8\xff"):
+        return "jpeg"
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    if header.startswith((b"GIF87a", b"GIF89a")):
+        return "gif"
+    if header.startswith(b"RIFF") and header[8:12] == b"WEBP":
+        return "webp"
+    if is_bmp_header(header):
+        return "bmp"
+    if header.startswith((b"II*\x00", b"MM\x00*")):
+        return "tiff"
+    return None
+
+
+def get_validated_image_cache_key(path):
+    return "validated-image-" + hashlib.sha256(path.encode()).hexdigest()
+
+
+def mark_images_validated(paths):
+    cache.set_many(
+        {get_validated_image_cache_key(path): True for path in paths},
+        timeout=VALIDATED_IMAGE_CACHE_TIMEOUT,
+    )
+
+
+def get_invalid_image_paths(paths, storage=default_storage):
+    """
+    Return list of paths which doesn't exists in storage or aren't image.
+
+    Only header of file is read to verify image format and already validated path
+    is remembered in cache so validating same path again doesn't touch storage.
+    """
+    cache_keys = {path: get_validated_image_cache_key(path) for path in paths}
+    validated_keys = cache.get_many(cache_keys.values())
+    invalid_paths = []
+    newly_validated_paths = []
+    for path, cache_key in cache_keys.items():
+        if cache_key in validated_keys:
+            continue
+        try:
+            header = read_file_header(path, IMAGE_HEADER_SIZE, storage=storage)
+        except (OSError, ValueError, SuspiciousFileOperation):
+            header = b""
+        if get_image_format(header) is None:
+            invalid_paths.append(path)
+        else:
+            newly_validated_paths.append(path)
+    if newly_validated_paths:
+        mark_images_validated(newly_validated_paths)
+    return invalid_paths
+
+
+def get_storage_url_cache_key(path):
+    return "storage-url-" + hashlib.sha256(path.encode()).hexdigest()
+
+
+def get_storage_url_cache_timeout(storage=default_storage):
+    """
+    Return cache timeout for url of storage file. Signed url is cached for shorter
+    period than its expiry so that url served from cache is still valid for at
+    least SIGNED_URL_EXPIRY_MARGIN seconds.
+    """
+    if not getattr(storage, "querystring_auth", False):
+        return STORAGE_URL_CACHE_TIMEOUT
+    return storage.querystring_expire - SIGNED_URL_EXPIRY_MARGIN
+
+
+def get_storage_urls(paths, storage=default_storage):
+    """
+    Return dictionary of path and its url in storage.
+
+    Urls of all paths are fetched from cache with single lookup and only missing
+    urls are generated by storage and cached together.
+    """
+    cache_keys = {path: get_storage_url_cache_key(path) for path in set(paths)}
+    cached_urls = cache.get_many(cache_keys.values())
+    urls = {}
+    new_urls = {}
+    for path, cache_key in cache_keys.items():
+        if cache_key in cached_urls:
+            urls[path] = cached_urls[cache_key]
+        else:
+            urls[path] = new_urls[cache_key] = storage.url(path)
+    timeout = get_storage_url_cache_timeout(storage)
+    if new_urls and timeout > 0:
+        cache.set_many(new_urls, timeout=timeout)
+    return urls
+
+
+def iterate_in_chunks(iterable, size):
+    """
+    Yield list of at most size items from iterable without loading whole iterable
+    """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
@@ -1,3 +1,77 @@
+import csv
+import hashlib
+import io
+import itertools
+import re
+
+from django.db.models import Count, Max
+from django.http import StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from django.utils.translation import get_language
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+from rest_framework.decorators import action
+from rest_framework.renderers import BaseRenderer
+from rest_framework.settings import api_settings
+
+from catalog.utils import get_catalog_version
+
+from .utils import iterate_in_chunks
+
+# cells starting with these characters are evaluated as formula by spreadsheets
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+# signed number such as negative score is value not formula so it is kept as it is
+CSV_NUMBER_PATTERN = re.compile(r"[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?")
+
+
+def escape_csv_value(value):
+    if (
+        isinstance(value, str)
+        and value.startswith(CSV_FORMULA_PREFIXES)
+        and not CSV_NUMBER_PATTERN.fullmatch(value)
+    ):
+        return f"'{value}"
+    return value
+
+
+class CSVRenderer(BaseRenderer):
+    """
+    Renderer of CSV export. Successful export is streamed by view itself so only
+    error responses are rendered here as rows of field and message.
+    """
+
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if not isinstance(data, dict):
+            data = {"detail": data}
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for field, messages in data.items():
+            if not isinstance(messages, list):
+                messages = [messages]
+            for message in messages:
+                writer.writerow(
+                    [escape_csv_value(field), escape_csv_value(str(message))]
+                )
+        return buffer.getvalue().encode(self.charset)
+
+
+class Echo:
+    """
+    File like object which returns written value instead of storing it so that
+    csv writer can be used to write single row of streamed response.
+    """
+
+    def write(self, value):
+        return value
+
+
 class UserStampedModelCreateMixin:
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user)
@@ -12,3 +86,140 @@ class UserStampedModelViewSetMixin(
     UserStampedModelCreateMixin, UserStampedModelUpdateMixin
 ):
     pass
+
+
+class ConditionalGetMixin:
+    """
+    Answer list and retrieve requests of viewset with 304 when client already has
+    current representation.
+
+    Representation of catalog models also depends on many to many and related rows
+    so their validator is derived from catalog version which records all of those
+    changes. Validator of other models is derived from latest modified_at and number
+    of rows of filtered queryset along with latest id and number of rows of each
+    of conditional_get_dependencies, such as through table of many to many field
+    or related model, so unchanged response isn't serialized at all. Last-Modified
+    is only sent for single object whose representation doesn't depend on other
+    rows since deletion from list doesn't change latest modified_at.
+    """
+
+    conditional_get_field = "modified_at"
+    conditional_get_dependencies = []
+
+    def is_catalog_viewset(self):
+        # bundle imports serializers of catalog apps which use this module
+        from catalog.bundle import CATALOG_MODELS
+
+        return self.get_queryset().model in CATALOG_MODELS
+
+    def get_dependency_validators(self, queryset):
+        aggregates = {"max_pk": Max("pk"), "count": Count("pk")}
+        field_names = {field.name for field in queryset.model._meta.concrete_fields}
+        if self.conditional_get_field in field_names:
+            aggregates["last_modified"] = Max(self.conditional_get_field)
+        validators = queryset.order_by().aggregate(**aggregates)
+        return [
+            value.isoformat() if hasattr(value, "isoformat") else value
+            for _name, value in sorted(validators.items())
+        ]
+
+    def get_conditional_validators(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.action == "retrieve":
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            queryset = queryset.filter(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            )
+        is_catalog = self.is_catalog_viewset()
+        aggregates = {"count": Count("pk")}
+        if not is_catalog:
+            aggregates["last_modified"] = Max(self.conditional_get_field)
+        validators = queryset.order_by().aggregate(**aggregates)
+        if not validators["count"]:
+            return None, None
+        last_modified = validators.get("last_modified")
+        parts = [validators["count"], get_language()]
+        if is_catalog:
+            parts.append(get_catalog_version())
+        else:
+            parts.append(last_modified.isoformat())
+        for dependency in self.conditional_get_dependencies:
+            parts.extend(self.get_dependency_validators(dependency))
+        etag = hashlib.sha256(":".join(map(str, parts)).encode()).hexdigest()
+        if self.action != "retrieve" or is_catalog or self.conditional_get_dependencies:
+            return f'W/"{etag}"', None
+        return f'W/"{etag}"', int(last_modified.timestamp())
+
+    def get_conditional_get_response(self, view, request, *args, **kwargs):
+        etag, last_modified = self.get_conditional_validators()
+        if etag is None:
+            return view(request, *args, **kwargs)
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = view(request, *args, **kwargs)
+        if 200 <= response.status_code < 300 or response.status_code == 304:
+            response["ETag"] = etag
+            if last_modified is not None:
+                response["Last-Modified"] = http_date(last_modified)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.get_conditional_get_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.get_conditional_get_response(
+            super().retrieve, request, *args, **kwargs
+        )
+
+
+class CSVExportMixin:
+    """
+    Add export action to viewset which streams filtered queryset as CSV file.
+
+    Rows are fetched from database in chunks with server side cursor where database
+    supports it so that memory usage doesn't grow with number of exported rows.
+    """
+
+    csv_export_fields = []
+    csv_export_filename = "export.csv"
+    csv_export_chunk_size = 2000
+
+    def get_csv_export_header(self):
+        return self.csv_export_fields
+
+    def get_csv_export_rows(self, queryset):
+        rows = queryset.values_list(*self.csv_export_fields).iterator(
+            chunk_size=self.csv_export_chunk_size
+        )
+        for chunk in iterate_in_chunks(rows, self.csv_export_chunk_size):
+            yield from self.get_csv_export_chunk(chunk)
+
+    def get_csv_export_chunk(self, rows):
+        return rows
+
+    @extend_schema(responses={(200, "text/csv"): OpenApiTypes.STR})
+    @action(
+        methods=["get"],
+        detail=False,
+        renderer_classes=[CSVRenderer, *api_settings.DEFAULT_RENDERER_CLASSES],
+        pagination_class=None,
+    )
+    def export(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset()).order_by("pk")
+        writer = csv.writer(Echo())
+        rows = itertools.chain(
+            [self.get_csv_export_header()], self.get_csv_export_rows(queryset)
+        )
+        response = StreamingHttpResponse(
+            (
+                writer.writerow([escape_csv_value(value) for value in row])
+                for row in rows
+            ),
+            content_type="text/csv",
+        )
+        response[
+            "Content-Disposition"
+        ] = f'attachment; filename="{self.csv_export_filename}"'
+        return response
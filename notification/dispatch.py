@@ -1,16 +1,86 @@
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from django.db.models.query import QuerySet
 from django.utils import timezone
 
+from neatplus.utils import iterate_in_chunks
+
 UserModel = get_user_model()
 
+NOTIFICATION_BATCH_SIZE = 500
+# audience larger than this is notified from celery task instead of request
+NOTIFICATION_ASYNC_THRESHOLD = 1000
+
+
+def get_notification_description(actor, verb, action_object=None, target=None):
+    description = f"{actor} {verb}"
+    if action_object:
+        description += f" {action_object}"
+    if target:
+        description += f" on {target}"
+    return description
+
+
+def get_content_type_id_and_object_id(content_object):
+    if content_object is None:
+        return None, None
+    return ContentType.objects.get_for_model(content_object).pk, content_object.pk
+
+
+def create_notifications(
+    recipient_ids,
+    actor,
+    verb,
+    description,
+    notification_type=None,
+    timestamp=None,
+    action_object=None,
+    target=None,
+):
+    """
+    Insert notification for each recipient with bulk_create in batches of
+    NOTIFICATION_BATCH_SIZE. Actor, action object and target are tuple of content
+    type id and object id so that they are resolved only once for all recipients.
+    """
+    from .models import Notification
+
+    actor_content_type_id, actor_object_id = actor
+    action_object_content_type_id, action_object_object_id = action_object or (
+        None,
+        None,
+    )
+    target_content_type_id, target_object_id = target or (None, None)
+    extra_fields = {}
+    if notification_type:
+        extra_fields["notification_type"] = notification_type
+    notifications = (
+        Notification(
+            recipient_id=recipient_id,
+            actor_content_type_id=actor_content_type_id,
+            actor_object_id=actor_object_id,
+            verb=verb,
+            description=description,
+            timestamp=timestamp or timezone.now(),
+            action_object_content_type_id=action_object_content_type_id,
+            action_object_object_id=action_object_object_id,
+            target_content_type_id=target_content_type_id,
+            target_object_id=target_object_id,
+            **extra_fields,
+        )
+        for recipient_id in recipient_ids
+    )
+    for batch in iterate_in_chunks(notifications, NOTIFICATION_BATCH_SIZE):
+        Notification.objects.bulk_create(batch)
+
 
 def notification(
     user,
     actor,
     verb,
     notification_type=None,
-    timestamp=timezone.now(),
+    timestamp=None,
     action_object=None,
     target=None,
     description=None,
@@ -31,24 +101,50 @@ def notification(
 
     Use '{actor} {verb} {action_object(optional)} on {target(optional)}' as description if description is not provided
 
-    This function is wrapper around UserModel.notify() function and can be used for calling single user or multiple
-    users with help of queryset or list of users
+    Notifications of all users are inserted in bulk. Content types of actor, action object and target are looked up
+    once per call and audience larger than NOTIFICATION_ASYNC_THRESHOLD is notified from celery task.
     """
-    if isinstance(user, (QuerySet, list)) and all(
-        isinstance(u, UserModel) for u in user
-    ):
-        users = user
+    if isinstance(user, QuerySet) and issubclass(user.model, UserModel):
+        recipient_ids = list(user.values_list("pk", flat=True))
+    elif isinstance(user, list) and all(isinstance(u, UserModel) for u in user):
+        recipient_ids = [user_obj.pk for user_obj in user]
     elif isinstance(user, UserModel):
-        users = [user]
+        recipient_ids = [user.pk]
     else:
         raise TypeError("Only UserModel or queryset or list of UserModel is supported")
-    for user_obj in users:
-        user_obj.notify(
+    if not recipient_ids:
+        return
+    if not description:
+        description = get_notification_description(actor, verb, action_object, target)
+    timestamp = timestamp or timezone.now()
+    actor = get_content_type_id_and_object_id(actor)
+    action_object = get_content_type_id_and_object_id(action_object)
+    target = get_content_type_id_and_object_id(target)
+    if settings.ENABLE_CELERY and len(recipient_ids) > NOTIFICATION_ASYNC_THRESHOLD:
+        from .tasks import create_notifications_task
+
+        # task is enqueued after commit since notification is mostly sent from
+        # signal of object which isn't visible to worker before that
+        transaction.on_commit(
+            lambda: create_notifications_task.delay(
+                recipient_ids,
+                actor,
+                verb,
+                description,
+                notification_type=notification_type,
+                timestamp=timestamp.isoformat(),
+                action_object=action_object,
+                target=target,
+            )
+        )
+    else:
+        create_notifications(
+            recipient_ids,
             actor,
             verb,
-            notification_type,
-            timestamp,
-            action_object,
-            target,
             description,
+            notification_type=notification_type,
+            timestamp=timestamp,
+            action_object=action_object,
+            target=target,
         )
@@ -0,0 +1,28 @@
+from celery import shared_task
+from django.utils.dateparse import parse_datetime
+
+
+@shared_task(bind=True)
+def create_notifications_task(
+    self,
+    recipient_ids,
+    actor,
+    verb,
+    description,
+    notification_type=None,
+    timestamp=None,
+    action_object=None,
+    target=None,
+):
+    from .dispatch import create_notifications
+
+    create_notifications(
+        recipient_ids,
+        actor,
+        verb,
+        description,
+        notification_type=notification_type,
+        timestamp=parse_datetime(timestamp) if timestamp else None,
+        action_object=action_object,
+        target=target,
+    )
@@ -1,6 +1,11 @@
 from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from neatplus.tests import FullTestCase
+from notification import dispatch
+from notification.models import Notification
 
 
 class APITest(FullTestCase):
@@ -81,3 +86,24 @@ class APITest(FullTestCase):
             self.notice_detail_url,
         )
         self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+
+    def test_notification_fan_out(self):
+        actor = self.baker.make("organization.Organization")
+        ContentType.objects.get_for_model(actor)
+        query_counts = []
+        for count in [2, 6]:
+            users = self.baker.make(settings.AUTH_USER_MODEL, _quantity=count)
+            with CaptureQueriesContext(connection) as queries:
+                dispatch.notification(
+                    users, actor, "accepted", notification_type="fan_out"
+                )
+            query_counts.append(len(queries))
+            notifications = Notification.objects.filter(
+                recipient__in=users, notification_type="fan_out"
+            )
+            self.assertEqual(notifications.count(), count)
+            self.assertEqual(
+                set(notifications.values_list("description", flat=True)),
+                {f"{actor} accepted"},
+            )
+        self.assertEqual(query_counts[0], query_counts[1])
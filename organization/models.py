@@ -3,10 +3,10 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 from mptt.models import MPTTModel, TreeForeignKey
 
-from neatplus.models import TimeStampedModel, UserStampedModel
+from neatplus.models import DirtyFieldsMixin, TimeStampedModel, UserStampedModel
 
 
-class Organization(MPTTModel, TimeStampedModel, UserStampedModel):
+class Organization(DirtyFieldsMixin, MPTTModel, TimeStampedModel, UserStampedModel):
     class StatusChoice(models.TextChoices):
         PENDING = "pending"
         ACCEPTED = "accepted"
@@ -63,28 +63,8 @@ class Organization(MPTTModel, TimeStampedModel, UserStampedModel):
     def __str__(self):
         return self.title
 
-    def save(self, *args, **kwargs):
-        if self.pk:
-            cls = self.__class__
-            old = cls.objects.get(pk=self.pk)
-            changed_fields = []
-            for field in cls._meta.get_fields():
-                field_name = field.name
-                try:
-                    old_val = getattr(old, field_name)
-                    new_val = getattr(self, field_name)
-                    if hasattr(field, "is_custom_lower_field"):
-                        if field.is_custom_lower_field():
-                            new_val = new_val.lower()
-                    if old_val != new_val:
-                        changed_fields.append(field_name)
-                except Exception:
-                    pass
-            kwargs["update_fields"] = changed_fields
-        super().save(*args, **kwargs)
 
-
-class OrganizationMemberRequest(UserStampedModel, TimeStampedModel):
+class OrganizationMemberRequest(DirtyFieldsMixin, UserStampedModel, TimeStampedModel):
     class StatusChoice(models.TextChoices):
         PENDING = "pending"
         ACCEPTED = "accepted"
@@ -110,25 +90,5 @@ class OrganizationMemberRequest(UserStampedModel, TimeStampedModel):
         editable=False,
     )
 
-    def save(self, *args, **kwargs):
-        if self.pk:
-            cls = self.__class__
-            old = cls.objects.get(pk=self.pk)
-            changed_fields = []
-            for field in cls._meta.get_fields():
-                field_name = field.name
-                try:
-                    old_val = getattr(old, field_name)
-                    new_val = getattr(self, field_name)
-                    if hasattr(field, "is_custom_lower_field"):
-                        if field.is_custom_lower_field():
-                            new_val = new_val.lower()
-                    if old_val != new_val:
-                        changed_fields.append(field_name)
-                except Exception:
-                    pass
-            kwargs["update_fields"] = changed_fields
-        super().save(*args, **kwargs)
-
     def __str__(self):
         return str(self.user) + "-" + str(self.organization)
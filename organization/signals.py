@@ -1,6 +1,7 @@
 from django.db.models.signals import post_save
 from django.dispatch.dispatcher import receiver
 
+from notification.dispatch import notification
 from support.models import EmailTemplate
 
 from .models import Organization, OrganizationMemberRequest
@@ -21,12 +22,13 @@ def send_organization_acceptance_change_mail(sender, instance, created, **kwargs
                 {"organization": instance, "admin": admin}
             )
             admin.celery_email_user(subject, text_message, html_message=html_message)
-            admin.notify(
-                instance.updated_by,
-                instance.status,
-                action_object=instance,
-                notification_type=f"organization_{instance.status}",
-            )
+        notification(
+            instance.admins.all(),
+            instance.updated_by,
+            instance.status,
+            action_object=instance,
+            notification_type=f"organization_{instance.status}",
+        )
 
 
 @receiver(post_save, sender=OrganizationMemberRequest)
@@ -39,13 +41,14 @@ def send_new_member_request_organization_admin(sender, instance, created, **kwar
                 identifier="new_member_request"
             ).get_email_contents({"admin": admin, "member_request": instance})
             admin.celery_email_user(subject, text_message, html_message=html_message)
-            admin.notify(
-                instance.created_by,
-                "created",
-                action_object=instance,
-                target=instance.organization,
-                notification_type="new_member_request",
-            )
+        notification(
+            instance.organization.admins.all(),
+            instance.created_by,
+            "created",
+            action_object=instance,
+            target=instance.organization,
+            notification_type="new_member_request",
+        )
 
 
 @receiver(post_save, sender=OrganizationMemberRequest)
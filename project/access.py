@@ -0,0 +1,160 @@
+from django.db import transaction
+
+from organization.models import Organization
+
+from .models import Project, ProjectAccess, ProjectUser
+
+# access levels from highest to lowest precedence
+ACCESS_LEVELS = [
+    ProjectAccess.AccessLevelChoice.ORGANIZATION_ADMIN,
+    ProjectAccess.AccessLevelChoice.OWNER,
+    ProjectAccess.AccessLevelChoice.WRITE,
+    ProjectAccess.AccessLevelChoice.READ_ONLY,
+    ProjectAccess.AccessLevelChoice.VISIBILITY,
+]
+ACCESS_LEVEL_PRECEDENCE = {level: index for index, level in enumerate(ACCESS_LEVELS)}
+# access levels which allow editing project and writing surveys of project
+EDIT_ACCESS_LEVELS = {
+    ProjectAccess.AccessLevelChoice.ORGANIZATION_ADMIN,
+    ProjectAccess.AccessLevelChoice.OWNER,
+}
+WRITE_ACCESS_LEVELS = EDIT_ACCESS_LEVELS | {ProjectAccess.AccessLevelChoice.WRITE}
+
+
+def get_project_access_levels(project_ids):
+    """
+    Return dictionary of (user id, project id) and highest access level of user for
+    provided projects with one query per source of access.
+    """
+    access_levels = {}
+
+    def grant(user_id, project_id, level):
+        key = (user_id, project_id)
+        current_level = access_levels.get(key)
+        if (
+            current_level is None
+            or ACCESS_LEVEL_PRECEDENCE[level] < ACCESS_LEVEL_PRECEDENCE[current_level]
+        ):
+            access_levels[key] = level
+
+    projects = list(
+        Project.objects.filter(pk__in=project_ids).values_list(
+            "pk", "created_by_id", "organization_id", "visibility", "status"
+        )
+    )
+    organization_ids = {project[2] for project in projects if project[2]}
+    organization_admins = {}
+    for organization_id, user_id in Organization.admins.through.objects.filter(
+        organization_id__in=organization_ids
+    ).values_list("organization_id", "user_id"):
+        organization_admins.setdefault(organization_id, []).append(user_id)
+    # admins and members of accepted organization can read projects which are
+    # public within organization
+    organization_readers = {}
+    for through in [Organization.admins.through, Organization.members.through]:
+        for organization_id, user_id in through.objects.filter(
+            organization_id__in=organization_ids,
+            organization__status=Organization.StatusChoice.ACCEPTED,
+        ).values_list("organization_id", "user_id"):
+            organization_readers.setdefault(organization_id, []).append(user_id)
+
+    for project_id, created_by_id, organization_id, visibility, status in projects:
+        for user_id in organization_admins.get(organization_id, []):
+            grant(
+                user_id, project_id, ProjectAccess.AccessLevelChoice.ORGANIZATION_ADMIN
+            )
+        if created_by_id:
+            grant(created_by_id, project_id, ProjectAccess.AccessLevelChoice.OWNER)
+        if (
+            visibility == Project.VisibilityChoice.PUBLIC_WIITHIN_ORGANIZATION
+            and status == Project.StatusChoice.ACCEPTED
+        ):
+            for user_id in organization_readers.get(organization_id, []):
+                grant(user_id, project_id, ProjectAccess.AccessLevelChoice.VISIBILITY)
+    for project_id, user_id, permission in ProjectUser.objects.filter(
+        project_id__in=project_ids
+    ).values_list("project_id", "user_id", "permission"):
+        if permission == ProjectUser.SurveyPermissionChoice.WRITE:
+            grant(user_id, project_id, ProjectAccess.AccessLevelChoice.WRITE)
+        else:
+            grant(user_id, project_id, ProjectAccess.AccessLevelChoice.READ_ONLY)
+    return access_levels
+
+
+def refresh_project_access(project_ids):
+    """
+    Replace stored access of provided projects with access calculated from their
+    creator, organization and project users. Projects are locked so concurrent
+    refreshes of same project don't insert same access twice.
+    """
+    project_ids = set(project_ids)
+    if not project_ids:
+        return
+    with transaction.atomic():
+        list(
+            Project.objects.select_for_update()
+            .filter(pk__in=project_ids)
+            .values_list("pk", flat=True)
+        )
+        access_levels = get_project_access_levels(project_ids)
+        ProjectAccess.objects.filter(project_id__in=project_ids).delete()
+        ProjectAccess.objects.bulk_create(
+            [
+                ProjectAccess(user_id=user_id, project_id=project_id, level=level)
+                for (user_id, project_id), level in access_levels.items()
+            ],
+            batch_size=1000,
+        )
+
+
+def refresh_organization_project_access(organization_ids):
+    refresh_project_access(
+        Project.objects.filter(organization_id__in=organization_ids).values_list(
+            "pk", flat=True
+        )
+    )
+
+
+class ProjectAccessResolver:
+    """
+    Resolve access level of single user for projects from ProjectAccess table.
+
+    Levels of any number of projects are loaded with single query and memoized so
+    permission classes and serializers asking about same project during request
+    don't query database again.
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self.levels = {}
+
+    def load(self, project_ids):
+        missing_ids = set(project_ids) - self.levels.keys()
+        if not missing_ids:
+            return
+        self.levels.update(dict.fromkeys(missing_ids))
+        if self.user.is_authenticated:
+            self.levels.update(
+                ProjectAccess.objects.filter(
+                    user=self.user, project_id__in=missing_ids
+                ).values_list("project_id", "level")
+            )
+
+    def get_level(self, project_id):
+        """
+        Return stored access level of user for project or None when user can only
+        access project through its visibility.
+        """
+        self.load([project_id])
+        return self.levels[project_id]
+
+    def has_level(self, project_id, levels):
+        return self.get_level(project_id) in levels
+
+
+def get_project_access_resolver(request):
+    resolver = getattr(request, "_project_access_resolver", None)
+    if resolver is None or resolver.user != request.user:
+        resolver = ProjectAccessResolver(request.user)
+        request._project_access_resolver = resolver
+    return resolver
@@ -1,8 +1,19 @@
-from django.db.models import Q, TextChoices
+from django.db.models import (
+    Case,
+    CharField,
+    Exists,
+    OuterRef,
+    Q,
+    TextChoices,
+    Value,
+    When,
+)
 from django_filters.filters import ChoiceFilter
 from django_filters.rest_framework import FilterSet
 
-from .models import Project
+from organization.models import Organization
+
+from .models import Project, ProjectUser
 
 
 class TabChoice(TextChoices):
@@ -11,6 +22,38 @@ class TabChoice(TextChoices):
     PUBLIC = "public"
 
 
+def annotate_project_tab(queryset, user):
+    """
+    Annotate tab of each project for user with single conditional expression.
+    Project created by user or where user is project user belongs to my project
+    tab, other project of organization administered by user or which is public
+    within organization belongs to organization tab and remaining projects
+    belong to public tab.
+    """
+    is_project_user = Exists(
+        ProjectUser.objects.filter(project_id=OuterRef("pk"), user=user)
+    )
+    is_organization_admin = Exists(
+        Organization.admins.through.objects.filter(
+            organization_id=OuterRef("organization_id"), user=user
+        )
+    )
+    return queryset.annotate(
+        tab=Case(
+            When(
+                Q(created_by=user) | is_project_user, then=Value(TabChoice.MY_PROJECT)
+            ),
+            When(
+                is_organization_admin
+                | Q(visibility=Project.VisibilityChoice.PUBLIC_WIITHIN_ORGANIZATION),
+                then=Value(TabChoice.ORGANIZATION),
+            ),
+            default=Value(TabChoice.PUBLIC),
+            output_field=CharField(),
+        )
+    )
+
+
 class ProjectFilter(FilterSet):
 
     tab = ChoiceFilter(label="tab", method="get_tab", choices=TabChoice.choices)
@@ -25,18 +68,4 @@ class ProjectFilter(FilterSet):
         }
 
     def get_tab(self, queryset, name, value):
-        user = self.request.user
-        my_projects = queryset.filter(Q(created_by=user) | Q(users=user))
-        if value == TabChoice.MY_PROJECT:
-            return my_projects
-        my_projects_id = my_projects.values("id")
-        organization_projects = queryset.filter(
-            Q(organization__admins=user) | Q(visibility="public_within_organization")
-        ).exclude(id__in=my_projects_id)
-        if value == TabChoice.ORGANIZATION:
-            return organization_projects
-        organization_projects_id = organization_projects.values("id")
-        if value == TabChoice.PUBLIC:
-            return queryset.exclude(
-                Q(id__in=organization_projects_id) | Q(id__in=my_projects_id)
-            )
+        return annotate_project_tab(queryset, self.request.user).filter(tab=value)
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from project.access import refresh_project_access
+from project.models import Project
+
+
+class Command(BaseCommand):
+    help = "Rebuild denormalized access of users for projects"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--project", type=int, nargs="+", default=None, dest="project_ids"
+        )
+
+    def handle(self, *args, **options):
+        project_ids = options["project_ids"]
+        if project_ids is None:
+            project_ids = Project.objects.values_list("pk", flat=True)
+        refresh_project_access(project_ids)
+        self.stdout.write(self.style.SUCCESS("Rebuilt project access"))
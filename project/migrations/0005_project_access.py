@@ -0,0 +1,29 @@
+# Generated by Django 3.2.25 on 2026-10-18 17:36
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('project', '0004_add_verbose_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectAccess',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('level', models.CharField(choices=[('organization_admin', 'Organization Admin'), ('owner', 'Owner'), ('write', 'Write'), ('read_only', 'Read Only'), ('visibility', 'Visibility')], max_length=18, verbose_name='access level')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='accesses', to='project.project', verbose_name='project')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_accesses', to=settings.AUTH_USER_MODEL, verbose_name='user')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='projectaccess',
+            constraint=models.UniqueConstraint(fields=('user', 'project'), name='unique_project_access'),
+        ),
+    ]
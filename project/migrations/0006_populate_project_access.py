@@ -0,0 +1,71 @@
+from django.db import migrations
+
+# access levels from highest to lowest precedence
+ACCESS_LEVELS = ['organization_admin', 'owner', 'write', 'read_only', 'visibility']
+
+
+def forward_migration(apps, schema_editor):
+    Project = apps.get_model('project', 'Project')
+    ProjectUser = apps.get_model('project', 'ProjectUser')
+    ProjectAccess = apps.get_model('project', 'ProjectAccess')
+    Organization = apps.get_model('organization', 'Organization')
+    access_levels = {}
+
+    def grant(user_id, project_id, level):
+        current_level = access_levels.get((user_id, project_id))
+        if current_level is None or ACCESS_LEVELS.index(level) < ACCESS_LEVELS.index(
+            current_level
+        ):
+            access_levels[(user_id, project_id)] = level
+
+    organization_admins = {}
+    organization_readers = {}
+    for organization_id, user_id, status in Organization.admins.through.objects.values_list(
+        'organization_id', 'user_id', 'organization__status'
+    ):
+        organization_admins.setdefault(organization_id, []).append(user_id)
+        if status == 'accepted':
+            organization_readers.setdefault(organization_id, []).append(user_id)
+    for organization_id, user_id in Organization.members.through.objects.filter(
+        organization__status='accepted'
+    ).values_list('organization_id', 'user_id'):
+        organization_readers.setdefault(organization_id, []).append(user_id)
+    for project_id, created_by_id, organization_id, visibility, status in (
+        Project.objects.values_list(
+            'pk', 'created_by_id', 'organization_id', 'visibility', 'status'
+        )
+    ):
+        for user_id in organization_admins.get(organization_id, []):
+            grant(user_id, project_id, 'organization_admin')
+        if created_by_id:
+            grant(created_by_id, project_id, 'owner')
+        if visibility == 'public_within_organization' and status == 'accepted':
+            for user_id in organization_readers.get(organization_id, []):
+                grant(user_id, project_id, 'visibility')
+    for project_id, user_id, permission in ProjectUser.objects.values_list(
+        'project_id', 'user_id', 'permission'
+    ):
+        grant(user_id, project_id, 'write' if permission == 'write' else 'read_only')
+    ProjectAccess.objects.bulk_create(
+        [
+            ProjectAccess(user_id=user_id, project_id=project_id, level=level)
+            for (user_id, project_id), level in access_levels.items()
+        ],
+        batch_size=1000,
+    )
+
+
+def backward_migration(apps, schema_editor):
+    apps.get_model('project', 'ProjectAccess').objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organization', '0008_add_verbose_name'),
+        ('project', '0005_project_access'),
+    ]
+
+    operations = [
+        migrations.RunPython(forward_migration, backward_migration)
+    ]
@@ -3,10 +3,10 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 from ordered_model.models import OrderedModel
 
-from neatplus.models import TimeStampedModel, UserStampedModel
+from neatplus.models import DirtyFieldsMixin, TimeStampedModel, UserStampedModel
 
 
-class Project(TimeStampedModel, UserStampedModel, OrderedModel):
+class Project(DirtyFieldsMixin, TimeStampedModel, UserStampedModel, OrderedModel):
     class VisibilityChoice(models.TextChoices):
         PUBLIC = "public"
         PUBLIC_WIITHIN_ORGANIZATION = "public_within_organization"
@@ -62,26 +62,13 @@ class Project(TimeStampedModel, UserStampedModel, OrderedModel):
         return self.title
 
     def save(self, *args, **kwargs):
-        if self.pk:
-            cls = self.__class__
-            old = cls.objects.get(pk=self.pk)
-            changed_fields = []
-            for field in cls._meta.get_fields():
-                field_name = field.name
-                try:
-                    old_val = getattr(old, field_name)
-                    new_val = getattr(self, field_name)
-                    if hasattr(field, "is_custom_lower_field"):
-                        if field.is_custom_lower_field():
-                            new_val = new_val.lower()
-                    if old_val != new_val:
-                        changed_fields.append(field_name)
-                except Exception:
-                    pass
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            changed_fields = self.get_changed_fields()
             if "organization" in changed_fields:
-                self.status = "pending"
+                # project moved to other organization needs to be accepted again
+                self.status = self.StatusChoice.PENDING
                 changed_fields.append("status")
-            kwargs["update_fields"] = changed_fields
+            kwargs["update_fields"] = self.get_update_fields(changed_fields)
         super().save(*args, **kwargs)
 
 
@@ -102,3 +89,44 @@ class ProjectUser(UserStampedModel, TimeStampedModel):
         choices=SurveyPermissionChoice.choices,
         default=SurveyPermissionChoice.READ_ONLY,
     )
+
+
+class ProjectAccess(models.Model):
+    """
+    Denormalized highest access level of user for project derived from creator of
+    project, admins and members of its organization and project users. Access of
+    public accepted project isn't stored since every user can read it.
+    """
+
+    class AccessLevelChoice(models.TextChoices):
+        ORGANIZATION_ADMIN = "organization_admin"
+        OWNER = "owner"
+        WRITE = "write"
+        READ_ONLY = "read_only"
+        VISIBILITY = "visibility"
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="project_accesses",
+        verbose_name=_("user"),
+    )
+    project = models.ForeignKey(
+        "Project",
+        on_delete=models.CASCADE,
+        related_name="accesses",
+        verbose_name=_("project"),
+    )
+    level = models.CharField(
+        _("access level"), max_length=18, choices=AccessLevelChoice.choices
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "project"], name="unique_project_access"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.user}-{self.project}-{self.level}"
@@ -1,23 +1,24 @@
 from rest_framework import permissions
 
-from project.models import ProjectUser
+from .access import EDIT_ACCESS_LEVELS, WRITE_ACCESS_LEVELS, get_project_access_resolver
+from .models import ProjectAccess
 
 
 class CanAcceptRejectProject(permissions.IsAuthenticated):
     def has_object_permission(self, request, view, obj):
-        if obj.organization:
-            return request.user in obj.organization.admins.all()
+        if obj.organization_id:
+            return get_project_access_resolver(request).has_level(
+                obj.pk, [ProjectAccess.AccessLevelChoice.ORGANIZATION_ADMIN]
+            )
         else:
             return request.user.is_superuser
 
 
 class CanEditProject(permissions.IsAuthenticated):
     def has_object_permission(self, request, view, obj):
-        is_created_by = request.user == obj.created_by
-        if obj.organization:
-            return is_created_by or request.user in obj.organization.admins.all()
-        else:
-            return is_created_by
+        return get_project_access_resolver(request).has_level(
+            obj.pk, EDIT_ACCESS_LEVELS
+        )
 
 
 class CanEditProjectOrReadOnly(CanEditProject):
@@ -29,18 +30,6 @@ class CanEditProjectOrReadOnly(CanEditProject):
 
 class CanCreateSurveyForProject(permissions.IsAuthenticated):
     def has_object_permission(self, request, view, obj):
-        if obj.organization:
-            return (
-                request.user == obj.created_by
-                or request.user in obj.organization.admins.all()
-                or ProjectUser.objects.filter(
-                    project=obj, user=request.user, permission="write"
-                ).exists()
-            )
-        else:
-            return (
-                request.user == obj.created_by
-                or ProjectUser.objects.filter(
-                    project=obj, user=request.user, permission="write"
-                ).exists()
-            )
+        return get_project_access_resolver(request).has_level(
+            obj.pk, WRITE_ACCESS_LEVELS
+        )
@@ -1,9 +1,11 @@
+from django.db import models
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 
 from organization.serializers import OrganizationSerializer
 from user.serializers import UserSerializer
 
+from .access import EDIT_ACCESS_LEVELS, get_project_access_resolver
 from .models import Project, ProjectUser
 
 
@@ -15,6 +17,21 @@ class ProjectUserSerializer(serializers.ModelSerializer):
         exclude = ("project",)
 
 
+class ProjectListSerializer(serializers.ListSerializer):
+    """
+    List serializer for projects which loads access level of current user for all
+    projects with single query before serializing them.
+    """
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.Manager) else data
+        projects = list(iterable)
+        get_project_access_resolver(self.context["request"]).load(
+            [project.pk for project in projects]
+        )
+        return super().to_representation(projects)
+
+
 class ProjectSerializer(serializers.ModelSerializer):
     created_by = UserSerializer()
     organization_title = serializers.SerializerMethodField(read_only=True)
@@ -23,18 +40,16 @@ class ProjectSerializer(serializers.ModelSerializer):
     class Meta:
         model = Project
         fields = "__all__"
+        list_serializer_class = ProjectListSerializer
 
     def get_organization_title(self, obj):
         if obj.organization:
             return obj.organization.title
 
     def get_is_admin_or_owner(self, obj):
-        current_user = self.context["request"].user
-        is_created_by = current_user == obj.created_by
-        if obj.organization:
-            return is_created_by or current_user in obj.organization.admins.all()
-        else:
-            return is_created_by
+        return get_project_access_resolver(self.context["request"]).has_level(
+            obj.pk, EDIT_ACCESS_LEVELS
+        )
 
     def update(self, instance, validated_data):
         return super().update(instance, validated_data)
@@ -1,10 +1,15 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch.dispatcher import receiver
 
+from notification.dispatch import notification
+from organization.models import Organization
 from support.models import EmailTemplate
 from user.models import User
 
-from .models import Project
+from .access import refresh_organization_project_access, refresh_project_access
+from .models import Project, ProjectUser
+
+PROJECT_ACCESS_FIELDS = {"created_by", "organization", "visibility", "status"}
 
 
 @receiver(post_save, sender=Project)
@@ -21,13 +26,14 @@ def send_new_project_notification_to_admin(sender, instance, created, **kwargs):
                 identifier="new_project"
             ).get_email_contents({"admin": admin, "project": instance})
             admin.celery_email_user(subject, text_message, html_message=html_message)
-            admin.notify(
-                instance.created_by,
-                "created",
-                action_object=instance,
-                target=instance.organization,
-                notification_type="new_project",
-            )
+        notification(
+            admins,
+            instance.created_by,
+            "created",
+            action_object=instance,
+            target=instance.organization,
+            notification_type="new_project",
+        )
 
 
 @receiver(post_save, sender=Project)
@@ -54,3 +60,51 @@ def send_project_acceptance_change_mail(sender, instance, created, **kwargs):
             action_object=instance,
             notification_type=f"project_{instance.status}",
         )
+
+
+@receiver(post_save, sender=Project)
+def refresh_access_of_project(sender, instance, created, **kwargs):
+    update_fields = kwargs.get("update_fields")
+    if created or update_fields is None or PROJECT_ACCESS_FIELDS & set(update_fields):
+        refresh_project_access([instance.pk])
+
+
+@receiver(post_save, sender=ProjectUser)
+@receiver(post_delete, sender=ProjectUser)
+def refresh_access_of_project_user(sender, instance, **kwargs):
+    refresh_project_access([instance.project_id])
+
+
+@receiver(m2m_changed, sender=Project.users.through)
+def refresh_access_of_added_project_users(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    # project users are bulk created by add() without post_save signal while
+    # remove() and clear() delete them with post_delete signal
+    if action != "post_add":
+        return
+    refresh_project_access(pk_set if reverse else [instance.pk])
+
+
+@receiver(post_save, sender=Organization)
+def refresh_access_of_organization(sender, instance, created, **kwargs):
+    update_fields = kwargs.get("update_fields")
+    if not created and (update_fields is None or "status" in update_fields):
+        refresh_organization_project_access([instance.pk])
+
+
+@receiver(m2m_changed, sender=Organization.admins.through)
+@receiver(m2m_changed, sender=Organization.members.through)
+def refresh_access_of_organization_users(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        refresh_organization_project_access([instance.pk])
+    elif action == "post_clear":
+        refresh_project_access(
+            instance.project_accesses.values_list("project_id", flat=True)
+        )
+    else:
+        refresh_organization_project_access(pk_set)
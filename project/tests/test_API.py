@@ -1,8 +1,11 @@
 from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from model_bakery import random_gen
 
 from neatplus.tests import FullTestCase
-from project.models import ProjectUser
+from project.models import ProjectAccess, ProjectUser
+from project.utils import read_allowed_project_for_user
 
 
 class APITest(FullTestCase):
@@ -226,6 +229,113 @@ class APITest(FullTestCase):
         self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
         self.assertEqual(response.json()["accessLevel"], "read_only")
 
+    def test_project_access_table(self):
+        self.project.visibility = "private"
+        self.project.save()
+        self.assertEqual(
+            dict(
+                ProjectAccess.objects.filter(project=self.project).values_list(
+                    "user", "level"
+                )
+            ),
+            {
+                self.admin_user.pk: "organization_admin",
+                self.project_created_user.pk: "owner",
+                self.user.pk: "read_only",
+            },
+        )
+        outsider = self.baker.make(settings.AUTH_USER_MODEL)
+        self.assertNotIn(self.project, read_allowed_project_for_user(outsider))
+        ProjectUser.objects.create(
+            project=self.project, user=outsider, permission="write"
+        )
+        self.assertEqual(
+            ProjectAccess.objects.get(project=self.project, user=outsider).level,
+            "write",
+        )
+        self.project.users.remove(outsider)
+        self.assertNotIn(self.project, read_allowed_project_for_user(outsider))
+
+        self.project.visibility = "public_within_organization"
+        self.project.save()
+        self.assertIn(
+            self.project, read_allowed_project_for_user(self.organization_user)
+        )
+        self.organization.members.remove(self.organization_user)
+        self.assertNotIn(
+            self.project, read_allowed_project_for_user(self.organization_user)
+        )
+        self.project.visibility = "public"
+        self.project.save()
+        self.assertIn(self.project, read_allowed_project_for_user(outsider))
+
+    def test_project_list_query_count(self):
+        user = self.baker.make(settings.AUTH_USER_MODEL)
+        self.client.force_authenticate(user)
+        query_counts = []
+        for count in [1, 3]:
+            projects = self.baker.make(
+                "project.Project",
+                organization=self.organization,
+                created_by=user,
+                users=[self.user],
+                visibility="private",
+                status="accepted",
+                _quantity=count,
+            )
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(self.project_list_url)
+            self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+            is_admin_or_owner = {
+                project["id"]: project["isAdminOrOwner"]
+                for project in response.json()["results"]
+            }
+            for project in projects:
+                self.assertTrue(is_admin_or_owner[project.pk])
+            query_counts.append(len(queries))
+        self.assertEqual(query_counts[0], query_counts[1])
+
+    def test_project_save_changed_fields(self):
+        project = self.baker.make(
+            "project.Project",
+            organization=self.organization,
+            created_by=self.project_created_user,
+            status="accepted",
+        )
+        with CaptureQueriesContext(connection) as queries:
+            project.save()
+        self.assertEqual(len(queries), 0)
+        project.title = "Renamed project"
+        with CaptureQueriesContext(connection) as queries:
+            project.save()
+        self.assertEqual(len(queries), 1)
+        self.assertIn('"title"', queries[0]["sql"])
+        self.assertNotIn('"description"', queries[0]["sql"])
+        project.organization = self.baker.make(
+            "organization.Organization", status="accepted"
+        )
+        project.save()
+        project.refresh_from_db()
+        self.assertEqual(project.status, "pending")
+        self.assertEqual(project.get_changed_fields(), [])
+        project.title = "Partially saved project"
+        project.description = "Unsaved description"
+        project.save(update_fields=["title"])
+        self.assertEqual(project.get_changed_fields(), ["description"])
+
+    def test_project_tab_counts(self):
+        self.client.force_authenticate(self.user)
+        url = self.reverse("project-tab-counts", kwargs={"version": "v1"})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+        tab_counts = response.data
+        self.assertEqual(tab_counts["my_project"], 2)
+        total = self.client.get(self.project_list_url).json()["count"]
+        self.assertEqual(sum(tab_counts.values()), total)
+        for tab, count in tab_counts.items():
+            response = self.client.get(self.project_list_url, {"tab": tab})
+            self.assertEqual(response.json()["count"], count)
+
     def test_project_survey_creation(self):
         url = self.reverse(
             "project-create-survey", kwargs={"version": "v1", "pk": self.project.pk}
@@ -283,6 +393,36 @@ class APITest(FullTestCase):
         response = self.client.post(url, data, format="json")
         self.assertEqual(response.status_code, self.status_code.HTTP_201_CREATED)
 
+    def test_project_survey_creation_item_error(self):
+        url = self.reverse(
+            "project-create-survey", kwargs={"version": "v1", "pk": self.project.pk}
+        )
+        question_1 = self.baker.make("survey.Question", answer_type="number")
+        question_2 = self.baker.make("survey.Question", answer_type="single_option")
+        other_question_option = self.baker.make("survey.Option")
+        data = {
+            "title": random_gen.gen_string(255),
+            "answers": [
+                {
+                    "question": question_1.pk,
+                    "answer": 2,
+                    "answerType": "number",
+                },
+                {
+                    "question": question_2.pk,
+                    "answerType": "single_option",
+                    "options": [other_question_option.pk],
+                },
+            ],
+            "results": [],
+        }
+        self.client.force_authenticate(self.project_created_user)
+        response = self.client.post(url, data, format="json")
+        self.assertEqual(response.status_code, self.status_code.HTTP_400_BAD_REQUEST)
+        answer_errors = response.json()["answers"]
+        self.assertFalse(answer_errors[0])
+        self.assertIn("options", answer_errors[1])
+
     def test_project_creation(self):
         self.client.force_authenticate(self.user)
         context = self.baker.make("context.Context")
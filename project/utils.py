@@ -1,26 +1,18 @@
 from django.db.models import Q
 
-from organization.models import Organization
-
-from .models import Project
+from .models import Project, ProjectAccess
 
 
 def read_allowed_project_for_user(user):
-    organizations = Organization.objects.filter(status="accepted").filter(
-        Q(admins=user) | Q(members=user)
-    )
+    """
+    Return projects which user can read. Access through creator, organization and
+    project users is looked up from denormalized ProjectAccess table so filtering
+    is single indexed subquery instead of join of all sources of access.
+    """
     return Project.objects.filter(
-        Q(created_by=user)
-        | Q(organization__admins=user)
-        | (
-            (
-                Q(visibility="public")
-                | (
-                    Q(visibility="public_within_organization")
-                    & Q(organization__in=organizations)
-                )
-            )
-            & Q(status="accepted")
+        Q(pk__in=ProjectAccess.objects.filter(user=user).values("project_id"))
+        | Q(
+            visibility=Project.VisibilityChoice.PUBLIC,
+            status=Project.StatusChoice.ACCEPTED,
         )
-        | Q(users=user)
-    ).distinct()
+    )
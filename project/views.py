@@ -1,19 +1,22 @@
 from collections import OrderedDict
 
-from django.db import transaction
+from django.db.models import Count
 from django.utils.translation import gettext_lazy as _
+from django_filters import utils
 from drf_spectacular.utils import extend_schema, inline_serializer
 from rest_framework import permissions, serializers, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
 from neatplus.views import UserStampedModelViewSetMixin
-from summary.models import SurveyResult
-from survey.models import Survey, SurveyAnswer
-from survey.serializers import WritableSurveySerializer
+from survey.models import SurveySubmissionJob
+from survey.serializers import SurveySubmissionJobSerializer, WritableSurveySerializer
+from survey.submission import SurveySubmission, SurveySubmissionError
+from survey.views import ASYNC_SUBMISSION_PARAMETER, AsyncSubmissionMixin
 
-from .filters import ProjectFilter
-from .models import ProjectUser
+from .access import get_project_access_resolver
+from .filters import ProjectFilter, TabChoice, annotate_project_tab
+from .models import ProjectAccess, ProjectUser
 from .permissions import (
     CanAcceptRejectProject,
     CanCreateSurveyForProject,
@@ -31,7 +34,9 @@ from .serializers import (
 from .utils import read_allowed_project_for_user
 
 
-class ProjectViewSet(UserStampedModelViewSetMixin, viewsets.ModelViewSet):
+class ProjectViewSet(
+    AsyncSubmissionMixin, UserStampedModelViewSetMixin, viewsets.ModelViewSet
+):
     permission_classes = [CanEditProjectOrReadOnly]
     filterset_class = ProjectFilter
 
@@ -39,8 +44,8 @@ class ProjectViewSet(UserStampedModelViewSetMixin, viewsets.ModelViewSet):
         current_user = self.request.user
         return (
             read_allowed_project_for_user(current_user)
-            .select_related("created_by")
-            .prefetch_related("organization__admins")
+            .select_related("created_by", "organization")
+            .prefetch_related("users")
         )
 
     def get_serializer_class(self):
@@ -63,6 +68,37 @@ class ProjectViewSet(UserStampedModelViewSetMixin, viewsets.ModelViewSet):
         serializer = self.get_serializer(project_user, many=True)
         return Response(serializer.data)
 
+    @extend_schema(
+        responses=inline_serializer(
+            name="ProjectTabCountResponseSerializer",
+            fields={tab: serializers.IntegerField() for tab in TabChoice.values},
+        )
+    )
+    @action(methods=["get"], detail=False, serializer_class=serializers.Serializer)
+    def tab_counts(self, request, *args, **kwargs):
+        """
+        Return number of projects in each tab with single grouped query. Other
+        filters of project list are applied to counts.
+        """
+        query_params = request.query_params.copy()
+        query_params.pop("tab", None)
+        filterset = ProjectFilter(
+            query_params,
+            queryset=read_allowed_project_for_user(request.user),
+            request=request,
+        )
+        if not filterset.is_valid():
+            raise utils.translate_validation(filterset.errors)
+        queryset = filterset.qs
+        tab_counts = dict.fromkeys(TabChoice.values, 0)
+        tab_counts.update(
+            annotate_project_tab(queryset, request.user)
+            .order_by()
+            .values_list("tab")
+            .annotate(count=Count("pk"))
+        )
+        return Response(tab_counts)
+
     @extend_schema(
         responses=inline_serializer(
             name="ProjectAcceptResponseSerializer",
@@ -203,19 +239,9 @@ class ProjectViewSet(UserStampedModelViewSetMixin, viewsets.ModelViewSet):
     )
     def access_level(self, request, *args, **kwargs):
         project = self.get_object()
-        user = self.request.user
-        if project.organization and user in project.organization.admins.all():
-            access_level = "organization_admin"
-        elif user == project.created_by:
-            access_level = "owner"
-        elif user in project.users.all():
-            permission = ProjectUser.objects.get(user=user, project=project).permission
-            if permission == "write":
-                access_level = "write"
-            else:
-                access_level = "read_only"
-        else:
-            access_level = "visibility"
+        access_level = get_project_access_resolver(request).get_level(project.pk)
+        if access_level is None:
+            access_level = ProjectAccess.AccessLevelChoice.VISIBILITY
         data = {"access_level": access_level}
         serializer = self.get_serializer(data=data)
         if not serializer.is_valid():
@@ -225,14 +251,18 @@ class ProjectViewSet(UserStampedModelViewSetMixin, viewsets.ModelViewSet):
         return Response(serializer.data)
 
     @extend_schema(
-        responses=inline_serializer(
-            name="ProjectSurveySubmitResponseSerializer",
-            fields={
-                "detail": serializers.CharField(
-                    default=_("Successfully submitted survey")
-                )
-            },
-        )
+        parameters=[ASYNC_SUBMISSION_PARAMETER],
+        responses={
+            201: inline_serializer(
+                name="ProjectSurveySubmitResponseSerializer",
+                fields={
+                    "detail": serializers.CharField(
+                        default=_("Successfully submitted survey")
+                    )
+                },
+            ),
+            202: SurveySubmissionJobSerializer,
+        },
     )
     @action(
         methods=["post"],
@@ -242,38 +272,19 @@ class ProjectViewSet(UserStampedModelViewSetMixin, viewsets.ModelViewSet):
     )
     def create_survey(self, request, *args, **kwargs):
         project = self.get_object()
-        data = request.data
-        serializer = self.get_serializer(data=data)
-        if not serializer.is_valid():
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        validated_data = serializer.validated_data
-        answers = validated_data.pop("answers", [])
-        results = validated_data.pop("results", [])
-        try:
-            with transaction.atomic():
-                survey = Survey.objects.create(
-                    **validated_data, created_by=request.user, project=project
-                )
-                for answer in answers:
-                    options = answer.pop("options", None)
-                    survey_answer = SurveyAnswer.objects.create(
-                        **answer, created_by=request.user, survey=survey
-                    )
-                    if options:
-                        survey_answer.options.add(*options)
-                for result in results:
-                    SurveyResult.objects.create(
-                        **result, created_by=request.user, survey=survey
-                    )
-        except Exception:
-            return Response(
-                {
-                    "error": _(
-                        "Failed to create survey or survey answer due to invalid data"
-                    )
-                },
-                status=status.HTTP_400_BAD_REQUEST,
+        if self.is_async_submission():
+            return self.start_submission_job(
+                SurveySubmissionJob.SubmissionTypeChoices.CREATE_SURVEY, project
             )
+        submission = SurveySubmission(
+            project, request.user, request.data, self.get_serializer_context()
+        )
+        if not submission.is_valid():
+            return Response(submission.errors, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            submission.save()
+        except SurveySubmissionError as err:
+            return Response(err.errors, status=status.HTTP_400_BAD_REQUEST)
         return Response(
             {"detail": _("Successfully submitted survey")},
             status=status.HTTP_201_CREATED,
@@ -4,6 +4,11 @@ from modeltranslation.admin import TranslationAdmin
 from ordered_model.admin import OrderedModelAdmin
 
 from neatplus.admin import UserStampedModelAdmin
+from summary.rescoring import (
+    get_affected_surveys,
+    get_stale_surveys,
+    schedule_rescoring,
+)
 
 from .models import (
     Mitigation,
@@ -19,6 +24,52 @@ from .models import (
 )
 
 
+class WeightageModelAdmin(UserStampedModelAdmin):
+    """
+    Model admin for weightage of question or option which schedules rescoring of
+    surveys affected by created, changed or deleted weightage. Only surveys scored
+    by server are rescored, results posted by clients are marked as stale.
+    """
+
+    weightage_target_field = None
+
+    def schedule_rescoring(self, request, target_ids):
+        target_ids = {target_id for target_id in target_ids if target_id}
+        lookup = {f"{self.weightage_target_field}_ids": target_ids}
+        count = get_affected_surveys(**lookup).count()
+        stale_count = get_stale_surveys(**lookup).count()
+        if count or stale_count:
+            schedule_rescoring(user=request.user, **lookup)
+            self.message_user(
+                request,
+                _(
+                    "Scheduled rescoring of {count} affected surveys, results of "
+                    "{stale_count} client scored surveys will be marked as stale"
+                ).format(count=count, stale_count=stale_count),
+            )
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        changed_fields = {"weightage", "statement", self.weightage_target_field}
+        if not change or changed_fields.intersection(form.changed_data):
+            target_ids = {getattr(obj, f"{self.weightage_target_field}_id")}
+            if change and self.weightage_target_field in form.changed_data:
+                target_ids.add(form.initial.get(self.weightage_target_field))
+            self.schedule_rescoring(request, target_ids)
+
+    def delete_model(self, request, obj):
+        target_id = getattr(obj, f"{self.weightage_target_field}_id")
+        super().delete_model(request, obj)
+        self.schedule_rescoring(request, [target_id])
+
+    def delete_queryset(self, request, queryset):
+        target_ids = list(
+            queryset.values_list(f"{self.weightage_target_field}_id", flat=True)
+        )
+        super().delete_queryset(request, queryset)
+        self.schedule_rescoring(request, target_ids)
+
+
 @admin.register(StatementTopic)
 class StatementTopicAdmin(UserStampedModelAdmin, TranslationAdmin, OrderedModelAdmin):
     list_display = ("title", "context", "move_up_down_links")
@@ -124,9 +175,10 @@ class OpportunityAdmin(
 
 @admin.register(QuestionStatement)
 class QuestionStatementAdmin(
-    UserStampedModelAdmin,
+    WeightageModelAdmin,
     OrderedModelAdmin,
 ):
+    weightage_target_field = "question"
     list_display = ("question", "statement", "weightage", "move_up_down_links")
     autocomplete_fields = ("question", "statement")
 
@@ -137,9 +189,10 @@ class QuestionStatementAdmin(
 
 @admin.register(OptionStatement)
 class OptionStatementAdmin(
-    UserStampedModelAdmin,
+    WeightageModelAdmin,
     OrderedModelAdmin,
 ):
+    weightage_target_field = "option"
     list_display = ("option", "statement", "weightage", "move_up_down_links")
     autocomplete_fields = ("option", "statement")
 
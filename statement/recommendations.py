@@ -0,0 +1,157 @@
+import threading
+from collections import defaultdict
+
+from catalog.utils import get_catalog_version
+
+from .models import (
+    Mitigation,
+    Opportunity,
+    OptionMitigation,
+    OptionOpportunity,
+    OptionStatement,
+)
+
+
+class StatementGraphIndex:
+    """
+    In memory adjacency index of option → statement, mitigation and opportunity
+    edges of catalog.
+
+    Index is loaded with one query per edge table and is tied to catalog version
+    so recommendations for any set of options are calculated from dictionaries
+    without querying database.
+    """
+
+    def __init__(
+        self,
+        version,
+        option_statements,
+        option_mitigations,
+        option_opportunities,
+        mitigations,
+        opportunities,
+    ):
+        self.version = version
+        self.option_statements = option_statements
+        self.option_mitigations = option_mitigations
+        self.option_opportunities = option_opportunities
+        # dictionary of mitigation or opportunity id and its (statement id, order)
+        self.mitigations = mitigations
+        self.opportunities = opportunities
+
+    @classmethod
+    def load(cls, version):
+        option_statements = defaultdict(list)
+        for option_id, statement_id, weightage in OptionStatement.objects.values_list(
+            "option_id", "statement_id", "weightage"
+        ):
+            option_statements[option_id].append((statement_id, weightage))
+        option_mitigations = defaultdict(list)
+        for option_id, mitigation_id in OptionMitigation.objects.values_list(
+            "option_id", "mitigation_id"
+        ):
+            option_mitigations[option_id].append(mitigation_id)
+        option_opportunities = defaultdict(list)
+        for option_id, opportunity_id in OptionOpportunity.objects.values_list(
+            "option_id", "opportunity_id"
+        ):
+            option_opportunities[option_id].append(opportunity_id)
+        mitigations = {
+            pk: (statement_id, order)
+            for pk, statement_id, order in Mitigation.objects.values_list(
+                "pk", "statement_id", "order"
+            )
+        }
+        opportunities = {
+            pk: (statement_id, order)
+            for pk, statement_id, order in Opportunity.objects.values_list(
+                "pk", "statement_id", "order"
+            )
+        }
+        return cls(
+            version,
+            dict(option_statements),
+            dict(option_mitigations),
+            dict(option_opportunities),
+            mitigations,
+            opportunities,
+        )
+
+    def rank(self, option_ids, option_edges, targets, statement_scores, key):
+        """
+        Rank mitigations or opportunities linked to selected options by number of
+        selected options linked to them, then by score of their statement and then
+        by their order in catalog.
+        """
+        matches = defaultdict(int)
+        for option_id in option_ids:
+            for target_id in option_edges.get(option_id, []):
+                matches[target_id] += 1
+        ranked = []
+        for target_id, count in matches.items():
+            statement_id, order = targets.get(target_id, (None, 0))
+            statement_score = statement_scores.get(statement_id, 0.0)
+            ranked.append(((-count, -statement_score, order), target_id, statement_id))
+        return [
+            {
+                key: target_id,
+                "statement": statement_id,
+                "matches": -rank[0],
+                "statement_score": -rank[1],
+            }
+            for rank, target_id, statement_id in sorted(ranked)
+        ]
+
+    def recommend(self, option_ids):
+        """
+        Return statements scored by sum of weightages of selected options along
+        with ranked mitigations and opportunities of selected options.
+        """
+        option_ids = set(option_ids)
+        statement_scores = defaultdict(float)
+        for option_id in option_ids:
+            for statement_id, weightage in self.option_statements.get(option_id, []):
+                statement_scores[statement_id] += weightage
+        return {
+            "options": sorted(option_ids),
+            "statements": [
+                {"statement": statement_id, "score": score}
+                for statement_id, score in sorted(
+                    statement_scores.items(), key=lambda item: (-item[1], item[0])
+                )
+            ],
+            "mitigations": self.rank(
+                option_ids,
+                self.option_mitigations,
+                self.mitigations,
+                statement_scores,
+                "mitigation",
+            ),
+            "opportunities": self.rank(
+                option_ids,
+                self.option_opportunities,
+                self.opportunities,
+                statement_scores,
+                "opportunity",
+            ),
+        }
+
+
+_statement_graph_index = None
+_statement_graph_index_lock = threading.Lock()
+
+
+def get_statement_graph_index():
+    """
+    Return index of current catalog version. Index of process is rebuilt only
+    when catalog version has changed since it was loaded.
+    """
+    global _statement_graph_index
+    version = get_catalog_version()
+    index = _statement_graph_index
+    if index is None or index.version != version:
+        with _statement_graph_index_lock:
+            index = _statement_graph_index
+            if index is None or index.version != version:
+                index = _statement_graph_index = StatementGraphIndex.load(version)
+    return index
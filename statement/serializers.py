@@ -1,3 +1,4 @@
+from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 
 from .models import (
@@ -72,3 +73,41 @@ class OptionOpportunitySerializer(serializers.ModelSerializer):
     class Meta:
         model = OptionOpportunity
         fields = "__all__"
+
+
+class RecommendationQuerySerializer(serializers.Serializer):
+    survey = serializers.IntegerField(required=False)
+    options = serializers.ListField(child=serializers.IntegerField(), required=False)
+
+    def validate(self, attrs):
+        if "survey" not in attrs and "options" not in attrs:
+            raise serializers.ValidationError(
+                _("Either survey or options should be provided")
+            )
+        return attrs
+
+
+class StatementRecommendationSerializer(serializers.Serializer):
+    statement = serializers.IntegerField()
+    score = serializers.FloatField()
+
+
+class MitigationRecommendationSerializer(serializers.Serializer):
+    mitigation = serializers.IntegerField()
+    statement = serializers.IntegerField()
+    matches = serializers.IntegerField()
+    statement_score = serializers.FloatField()
+
+
+class OpportunityRecommendationSerializer(serializers.Serializer):
+    opportunity = serializers.IntegerField()
+    statement = serializers.IntegerField()
+    matches = serializers.IntegerField()
+    statement_score = serializers.FloatField()
+
+
+class RecommendationSerializer(serializers.Serializer):
+    options = serializers.ListField(child=serializers.IntegerField())
+    statements = StatementRecommendationSerializer(many=True)
+    mitigations = MitigationRecommendationSerializer(many=True)
+    opportunities = OpportunityRecommendationSerializer(many=True)
@@ -136,6 +136,18 @@ class APITest(FullTestCase):
         response = self.client.get(self.statement_detail_url)
         self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
 
+    def test_statement_list_conditional_get(self):
+        response = self.client.get(self.statement_list_url)
+        self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+        etag = response["ETag"]
+        response = self.client.get(self.statement_list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, self.status_code.HTTP_304_NOT_MODIFIED)
+        # many to many change doesn't touch modified_at of statement
+        self.statement.tags.add(self.baker.make("statement.StatementTag"))
+        response = self.client.get(self.statement_list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
     def test_mitigation_list(self):
         response = self.client.get(self.mitigation_list_url)
         self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
@@ -183,3 +195,54 @@ class APITest(FullTestCase):
     def test_option_opportunity_detail(self):
         response = self.client.get(self.option_opportunity_detail_url)
         self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+
+    def test_recommendation(self):
+        question = self.baker.make("survey.Question")
+        options = self.baker.make("survey.Option", question=question, _quantity=2)
+        statement = self.baker.make("statement.Statement")
+        self.baker.make(
+            "statement.OptionStatement",
+            option=options[0],
+            statement=statement,
+            weightage=2,
+        )
+        mitigations = self.baker.make(
+            "statement.Mitigation", statement=statement, _quantity=2
+        )
+        for option in options:
+            self.baker.make(
+                "statement.OptionMitigation", option=option, mitigation=mitigations[1]
+            )
+        self.baker.make(
+            "statement.OptionMitigation", option=options[0], mitigation=mitigations[0]
+        )
+        url = self.reverse("recommendation-list", kwargs={"version": "v1"})
+        response = self.client.get(url, {"options": [option.pk for option in options]})
+        self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+        self.assertEqual(
+            response.data["statements"], [{"statement": statement.pk, "score": 2.0}]
+        )
+        self.assertEqual(
+            [item["mitigation"] for item in response.data["mitigations"]],
+            [mitigations[1].pk, mitigations[0].pk],
+        )
+
+        user = self.baker.make(settings.AUTH_USER_MODEL)
+        survey = self.baker.make("survey.Survey", created_by=user)
+        self.baker.make(
+            "survey.SurveyAnswer",
+            survey=survey,
+            question=question,
+            answer_type="single_option",
+            options=[options[1]],
+        )
+        response = self.client.get(url, {"survey": survey.pk})
+        self.assertEqual(response.status_code, self.status_code.HTTP_404_NOT_FOUND)
+        self.client.force_authenticate(user)
+        response = self.client.get(url, {"survey": survey.pk})
+        self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+        self.assertEqual(response.data["options"], [options[1].pk])
+        self.assertEqual(
+            [item["mitigation"] for item in response.data["mitigations"]],
+            [mitigations[1].pk],
+        )
@@ -1,4 +1,12 @@
-from rest_framework import viewsets
+from django.db.models import Q
+from django.utils.translation import gettext_lazy as _
+from drf_spectacular.utils import extend_schema
+from rest_framework import permissions, status, viewsets
+from rest_framework.response import Response
+
+from neatplus.views import ConditionalGetMixin
+from project.utils import read_allowed_project_for_user
+from survey.models import Survey, SurveyAnswer
 
 from .filters import (
     MitigationFilter,
@@ -24,6 +32,7 @@ from .models import (
     StatementTagGroup,
     StatementTopic,
 )
+from .recommendations import get_statement_graph_index
 from .serializers import (
     MitigationSerializer,
     OpportunitySerializer,
@@ -31,6 +40,8 @@ from .serializers import (
     OptionOpportunitySerializer,
     OptionStatementSerializer,
     QuestionStatementSerializer,
+    RecommendationQuerySerializer,
+    RecommendationSerializer,
     StatementSerializer,
     StatementTagGroupSerializer,
     StatementTagSerializer,
@@ -38,61 +49,100 @@ from .serializers import (
 )
 
 
-class StatementTopicViewSet(viewsets.ReadOnlyModelViewSet):
+class StatementTopicViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = StatementTopicSerializer
     queryset = StatementTopic.objects.all()
     filterset_class = StatementTopicFilter
 
 
-class StatementTagGroupViewSet(viewsets.ReadOnlyModelViewSet):
+class StatementTagGroupViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = StatementTagGroupSerializer
     queryset = StatementTagGroup.objects.all()
     filterset_class = StatementTagGroupFilter
 
 
-class StatementTagViewSet(viewsets.ReadOnlyModelViewSet):
+class StatementTagViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = StatementTagSerializer
     queryset = StatementTag.objects.all()
     filterset_class = StatementTagFilter
 
 
-class StatementViewSet(viewsets.ReadOnlyModelViewSet):
+class StatementViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = StatementSerializer
     queryset = Statement.objects.all()
     filterset_class = StatementFilter
 
 
-class MitigationViewSet(viewsets.ReadOnlyModelViewSet):
+class MitigationViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = MitigationSerializer
     queryset = Mitigation.objects.all()
     filterset_class = MitigationFilter
 
 
-class OpportunityViewSet(viewsets.ReadOnlyModelViewSet):
+class OpportunityViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = OpportunitySerializer
     queryset = Opportunity.objects.all()
     filterset_class = OpportunityFilter
 
 
-class QuestionStatementViewSet(viewsets.ReadOnlyModelViewSet):
+class QuestionStatementViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = QuestionStatementSerializer
     queryset = QuestionStatement.objects.all()
     filterset_class = QuestionStatementFilter
 
 
-class OptionStatementViewSet(viewsets.ReadOnlyModelViewSet):
+class OptionStatementViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = OptionStatementSerializer
     queryset = OptionStatement.objects.all()
     filterset_class = OptionStatementFilter
 
 
-class OptionMitigationViewSet(viewsets.ReadOnlyModelViewSet):
+class OptionMitigationViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = OptionMitigationSerializer
     queryset = OptionMitigation.objects.all()
     filterset_class = OptionMitigationFilter
 
 
-class OptionOpportunityViewSet(viewsets.ReadOnlyModelViewSet):
+class OptionOpportunityViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = OptionOpportunitySerializer
     queryset = OptionOpportunity.objects.all()
     filterset_class = OptionOpportunityFilter
+
+
+class RecommendationViewSet(viewsets.GenericViewSet):
+    permission_classes = [permissions.AllowAny]
+    pagination_class = None
+
+    @extend_schema(
+        parameters=[RecommendationQuerySerializer],
+        responses=RecommendationSerializer,
+    )
+    def list(self, request, *args, **kwargs):
+        """
+        Return statements, mitigations and opportunities ranked for options
+        selected in answers of survey or for provided options.
+        """
+        query_serializer = RecommendationQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        option_ids = set(query_serializer.validated_data.get("options", []))
+        survey_id = query_serializer.validated_data.get("survey")
+        if survey_id is not None:
+            current_user = request.user
+            if not current_user.is_authenticated or not (
+                Survey.objects.filter(pk=survey_id)
+                .filter(
+                    Q(project__in=read_allowed_project_for_user(current_user))
+                    | Q(created_by=current_user)
+                )
+                .exists()
+            ):
+                return Response(
+                    {"error": _("Survey not found")}, status=status.HTTP_404_NOT_FOUND
+                )
+            option_ids.update(
+                SurveyAnswer.options.through.objects.filter(
+                    surveyanswer__survey_id=survey_id
+                ).values_list("option_id", flat=True)
+            )
+        recommendations = get_statement_graph_index().recommend(option_ids)
+        return Response(RecommendationSerializer(recommendations).data)
@@ -1,16 +1,65 @@
 from django.contrib import admin
+from django.db import transaction
 from django.utils.translation import gettext_lazy as _
 
 from neatplus.admin import UserStampedModelAdmin
 
-from .models import SurveyResult
+from .models import DataExport, RescoringJob, SurveyResult
 
 
 @admin.register(SurveyResult)
 class SurveyResultAdmin(UserStampedModelAdmin):
-    list_display = ("statement", "survey", "module", "score")
+    list_display = ("statement", "survey", "module", "score", "source", "is_stale")
+    list_filter = ("source", "is_stale")
     autocomplete_fields = ("statement", "survey", "module")
 
     class Meta:
         verbose_name = _("survey result")
         verbose_plural_name = _("survey results")
+
+
+@admin.register(RescoringJob)
+class RescoringJobAdmin(admin.ModelAdmin):
+    list_display = (
+        "__str__",
+        "status",
+        "total_surveys",
+        "processed_surveys",
+        "stale_surveys",
+        "progress",
+        "created_at",
+    )
+    list_filter = ("status",)
+    readonly_fields = (
+        "question_ids",
+        "option_ids",
+        "status",
+        "total_surveys",
+        "processed_surveys",
+        "stale_surveys",
+        "progress",
+    )
+
+    def has_add_permission(self, request):
+        return False
+
+    class Meta:
+        verbose_name = _("rescoring job")
+        verbose_plural_name = _("rescoring jobs")
+
+
+@admin.register(DataExport)
+class DataExportAdmin(UserStampedModelAdmin):
+    list_display = ("__str__", "export_type", "format", "project", "status")
+    list_filter = ("export_type", "format", "status")
+    readonly_fields = ("status", "file", "row_count", "error")
+    autocomplete_fields = ("project",)
+
+    class Meta:
+        verbose_name = _("data export")
+        verbose_plural_name = _("data exports")
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        if not change:
+            transaction.on_commit(obj.start)
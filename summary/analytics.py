@@ -0,0 +1,150 @@
+from django.db import models, transaction
+from django.db.models import Count, ExpressionWrapper, Max, Min, Q, Sum
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from neatplus.utils import acquire_advisory_lock
+from survey.models import Survey
+
+from .models import AnalyticsCube, AnalyticsCubeRefresh, SurveyResult
+
+ANALYTICS_CUBE_DIMENSIONS = ["context", "module", "statement", "organization", "month"]
+
+# key of advisory lock which serializes refreshes of analytics cube
+ANALYTICS_CUBE_REFRESH_LOCK_ID = 4_202_111
+
+
+def get_shared_survey_results():
+    return SurveyResult.objects.filter(
+        survey__project__share_analytics_with_neat=True
+    ).annotate(month=TruncMonth("survey__created_at", output_field=models.DateField()))
+
+
+def aggregate_survey_results(survey_results):
+    """
+    Return unsaved analytics cube rows aggregated from survey results by all
+    dimensions of cube with single grouped query.
+    """
+    aggregates = (
+        survey_results.values_list(
+            "survey__project__context_id",
+            "module_id",
+            "statement_id",
+            "survey__project__organization_id",
+            "month",
+        )
+        .annotate(
+            count=Count("pk"),
+            total=Sum("score"),
+            minimum=Min("score"),
+            maximum=Max("score"),
+        )
+        .order_by()
+    )
+    return [
+        AnalyticsCube(
+            context_id=context_id,
+            module_id=module_id,
+            statement_id=statement_id,
+            organization_id=organization_id,
+            month=month,
+            count=count,
+            total=total,
+            minimum=minimum,
+            maximum=maximum,
+        )
+        for (
+            context_id,
+            module_id,
+            statement_id,
+            organization_id,
+            month,
+            count,
+            total,
+            minimum,
+            maximum,
+        ) in aggregates
+    ]
+
+
+def get_stale_months(since):
+    """
+    Return months of surveys whose survey, project or any result was modified
+    after provided time.
+    """
+    return set(
+        Survey.objects.filter(
+            Q(modified_at__gte=since)
+            | Q(project__modified_at__gte=since)
+            | Q(results__modified_at__gte=since)
+        )
+        .annotate(month=TruncMonth("created_at", output_field=models.DateField()))
+        .values_list("month", flat=True)
+        .distinct()
+    )
+
+
+def refresh_analytics_cube(full=False):
+    """
+    Refresh analytics cube from survey results.
+
+    Incremental refresh rebuilds only months of surveys modified since start of last
+    completed refresh. Deleted surveys and results don't leave any modification
+    behind so they are removed from cube by full refresh which rebuilds every month.
+
+    Hourly and daily refreshes can overlap so whole refresh runs in one transaction
+    holding advisory lock. On databases without advisory lock refresh row is
+    inserted first which takes write lock of database such as SQLite until commit.
+    """
+    with transaction.atomic():
+        acquire_advisory_lock(ANALYTICS_CUBE_REFRESH_LOCK_ID)
+        refresh = AnalyticsCubeRefresh.objects.create(is_full=full)
+        last_refresh = (
+            AnalyticsCubeRefresh.objects.filter(completed_at__isnull=False)
+            .order_by("-created_at")
+            .first()
+        )
+        survey_results = get_shared_survey_results()
+        cube = AnalyticsCube.objects.all()
+        if last_refresh is None:
+            refresh.is_full = True
+        if not refresh.is_full:
+            months = get_stale_months(last_refresh.created_at)
+            survey_results = survey_results.filter(month__in=months)
+            cube = cube.filter(month__in=months)
+            refresh.refreshed_months = len(months)
+        cube.delete()
+        cube_rows = AnalyticsCube.objects.bulk_create(
+            aggregate_survey_results(survey_results), batch_size=1000
+        )
+        if refresh.is_full:
+            refresh.refreshed_months = len({cube_row.month for cube_row in cube_rows})
+        refresh.completed_at = timezone.now()
+        refresh.save(
+            update_fields=[
+                "is_full",
+                "refreshed_months",
+                "completed_at",
+                "modified_at",
+            ]
+        )
+    return refresh
+
+
+def query_analytics_cube(queryset, dimensions):
+    """
+    Slice analytics cube by provided dimensions and merge aggregates of rows which
+    belong to same slice.
+    """
+    return (
+        queryset.values(*dimensions)
+        .annotate(
+            score_count=Sum("count"),
+            score_mean=ExpressionWrapper(
+                Sum("total") / Sum("count"), output_field=models.FloatField()
+            ),
+            score_minimum=Min("minimum"),
+            score_maximum=Max("maximum"),
+        )
+        .order_by(*dimensions)
+    )
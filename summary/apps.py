@@ -6,3 +6,6 @@ class SummaryConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "summary"
     verbose_name = _("summary")
+
+    def ready(self):
+        from summary import signals
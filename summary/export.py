@@ -0,0 +1,157 @@
+import tempfile
+from collections import defaultdict
+
+import pyarrow
+import pyarrow.ipc
+import pyarrow.parquet
+from django.core.files import File
+
+from neatplus.utils import iterate_in_chunks
+from project.utils import read_allowed_project_for_user
+from statement.models import Statement
+from survey.models import SurveyAnswer
+
+from .models import DataExport, SurveyResult
+
+EXPORT_ROW_GROUP_SIZE = 50000
+
+
+def get_export_columns():
+    """
+    Return column name, queryset lookup and arrow type of columns of each export
+    type. Options of survey answer doesn't have lookup since they are loaded
+    separately for each row group.
+    """
+    timestamp = pyarrow.timestamp("us", tz="UTC")
+    return {
+        DataExport.ExportTypeChoices.SURVEY_ANSWER: [
+            ("id", "id", pyarrow.int64()),
+            ("project", "survey__project_id", pyarrow.int64()),
+            ("survey", "survey_id", pyarrow.int64()),
+            ("question", "question_id", pyarrow.int64()),
+            ("answer_type", "answer_type", pyarrow.string()),
+            ("answer", "answer", pyarrow.string()),
+            ("answer_number", "answer_number", pyarrow.float64()),
+            ("answer_date", "answer_date", pyarrow.date32()),
+            ("answer_boolean", "answer_boolean", pyarrow.bool_()),
+            ("created_at", "created_at", timestamp),
+            ("options", None, pyarrow.list_(pyarrow.int64())),
+        ],
+        DataExport.ExportTypeChoices.SURVEY_RESULT: [
+            ("id", "id", pyarrow.int64()),
+            ("project", "survey__project_id", pyarrow.int64()),
+            ("survey", "survey_id", pyarrow.int64()),
+            ("statement", "statement_id", pyarrow.int64()),
+            ("module", "module_id", pyarrow.int64()),
+            ("score", "score", pyarrow.float64()),
+            ("created_at", "created_at", timestamp),
+        ],
+        DataExport.ExportTypeChoices.STATEMENT: [
+            ("id", "id", pyarrow.int64()),
+            ("code", "code", pyarrow.string()),
+            ("title", "title", pyarrow.string()),
+            ("topic", "topic_id", pyarrow.int64()),
+            ("context", "topic__context_id", pyarrow.int64()),
+            ("is_experimental", "is_experimental", pyarrow.bool_()),
+        ],
+    }
+
+
+def get_export_queryset(data_export):
+    """
+    Return queryset of data export limited to projects which creator of export can
+    read.
+    """
+    export_type = data_export.export_type
+    if export_type == DataExport.ExportTypeChoices.STATEMENT:
+        return Statement.objects.all()
+    projects = read_allowed_project_for_user(data_export.created_by)
+    if data_export.project_id:
+        projects = projects.filter(pk=data_export.project_id)
+    if export_type == DataExport.ExportTypeChoices.SURVEY_ANSWER:
+        return SurveyAnswer.objects.filter(survey__project__in=projects)
+    return SurveyResult.objects.filter(survey__project__in=projects)
+
+
+def get_answer_options(survey_answer_ids):
+    answer_options = defaultdict(list)
+    for survey_answer_id, option_id in (
+        SurveyAnswer.options.through.objects.filter(
+            surveyanswer_id__in=survey_answer_ids
+        )
+        .order_by("pk")
+        .values_list("surveyanswer_id", "option_id")
+    ):
+        answer_options[survey_answer_id].append(option_id)
+    return answer_options
+
+
+def iterate_record_batches(data_export, schema, columns):
+    """
+    Yield record batches of at most EXPORT_ROW_GROUP_SIZE rows of data export so
+    that only single row group is kept in memory.
+    """
+    lookups = [lookup for _name, lookup, _type in columns if lookup]
+    rows = (
+        get_export_queryset(data_export)
+        .order_by("pk")
+        .values_list(*lookups)
+        .iterator(chunk_size=EXPORT_ROW_GROUP_SIZE)
+    )
+    for chunk in iterate_in_chunks(rows, EXPORT_ROW_GROUP_SIZE):
+        arrays = [list(values) for values in zip(*chunk)]
+        if data_export.export_type == DataExport.ExportTypeChoices.SURVEY_ANSWER:
+            answer_options = get_answer_options(arrays[0])
+            arrays.append([answer_options[pk] for pk in arrays[0]])
+        yield pyarrow.record_batch(
+            [
+                pyarrow.array(values, type=field.type)
+                for values, field in zip(arrays, schema)
+            ],
+            schema=schema,
+        )
+
+
+def write_data_export(data_export):
+    """
+    Write rows of data export into parquet or arrow IPC file in bounded size row
+    groups and save file through default storage.
+    """
+    data_export.status = DataExport.StatusChoices.PROCESSING
+    data_export.error = None
+    data_export.save(update_fields=["status", "error", "modified_at"])
+    columns = get_export_columns()[data_export.export_type]
+    schema = pyarrow.schema(
+        [pyarrow.field(name, arrow_type) for name, _lookup, arrow_type in columns]
+    )
+    row_count = 0
+    try:
+        with tempfile.TemporaryFile() as export_file:
+            if data_export.format == DataExport.FormatChoices.PARQUET:
+                writer = pyarrow.parquet.ParquetWriter(export_file, schema)
+            else:
+                writer = pyarrow.ipc.new_file(export_file, schema)
+            with writer:
+                for batch in iterate_record_batches(data_export, schema, columns):
+                    if data_export.format == DataExport.FormatChoices.PARQUET:
+                        # every written table is stored as separate row group
+                        writer.write_table(pyarrow.Table.from_batches([batch]))
+                    else:
+                        writer.write_batch(batch)
+                    row_count += batch.num_rows
+            export_file.seek(0)
+            data_export.file.save(
+                f"{data_export.export_type}-{data_export.pk}.{data_export.format}",
+                File(export_file),
+                save=False,
+            )
+    except Exception as err:
+        data_export.status = DataExport.StatusChoices.FAILED
+        data_export.error = str(err)
+    else:
+        data_export.status = DataExport.StatusChoices.COMPLETED
+        data_export.row_count = row_count
+    data_export.save(
+        update_fields=["status", "error", "file", "row_count", "modified_at"]
+    )
+    return data_export
@@ -1,6 +1,6 @@
 from django_filters.rest_framework import FilterSet
 
-from summary.models import SurveyResult
+from summary.models import AnalyticsCube, DataExport, SurveyResult
 
 
 class SurveyResultFilter(FilterSet):
@@ -12,3 +12,26 @@ class SurveyResultFilter(FilterSet):
             "statement": ["exact"],
             "score": ["exact"],
         }
+
+
+class AnalyticsCubeFilter(FilterSet):
+    class Meta:
+        model = AnalyticsCube
+        fields = {
+            "context": ["exact"],
+            "module": ["exact"],
+            "statement": ["exact"],
+            "organization": ["exact", "isnull"],
+            "month": ["exact", "gte", "lte"],
+        }
+
+
+class DataExportFilter(FilterSet):
+    class Meta:
+        model = DataExport
+        fields = {
+            "export_type": ["exact"],
+            "format": ["exact"],
+            "project": ["exact"],
+            "status": ["exact"],
+        }
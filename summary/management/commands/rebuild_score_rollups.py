@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from summary.rollups import rebuild_score_rollups
+
+
+class Command(BaseCommand):
+    help = "Rebuild project statement and module score rollups from survey results"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--project", type=int, nargs="+", default=None, dest="project_ids"
+        )
+
+    def handle(self, *args, **options):
+        rebuild_score_rollups(options["project_ids"])
+        self.stdout.write(self.style.SUCCESS("Rebuilt score rollups"))
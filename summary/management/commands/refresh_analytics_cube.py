@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from summary.analytics import refresh_analytics_cube
+
+
+class Command(BaseCommand):
+    help = "Refresh analytics cube of projects sharing analytics with NEAT"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Rebuild whole cube instead of only months with modified surveys",
+        )
+
+    def handle(self, *args, **options):
+        refresh = refresh_analytics_cube(full=options["full"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Refreshed {refresh.refreshed_months} months")
+        )
@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from summary.rescoring import (
+    get_affected_surveys,
+    get_stale_surveys,
+    schedule_rescoring,
+)
+
+
+class Command(BaseCommand):
+    help = "Rescore surveys affected by weightage change of questions or options"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--question", type=int, nargs="+", default=[], dest="question_ids"
+        )
+        parser.add_argument(
+            "--option", type=int, nargs="+", default=[], dest="option_ids"
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only print number of surveys which would be rescored or marked stale",
+        )
+
+    def handle(self, *args, **options):
+        question_ids = options["question_ids"]
+        option_ids = options["option_ids"]
+        if not question_ids and not option_ids:
+            raise CommandError("Provide at least one question or option")
+        count = get_affected_surveys(question_ids, option_ids).count()
+        stale_count = get_stale_surveys(question_ids, option_ids).count()
+        if options["dry_run"]:
+            self.stdout.write(f"{count} surveys would be rescored")
+            self.stdout.write(
+                f"{stale_count} client scored surveys would be marked stale"
+            )
+            return
+        job = schedule_rescoring(question_ids, option_ids)
+        self.stdout.write(
+            self.style.SUCCESS(f"Scheduled rescoring job {job.pk} for {count} surveys")
+        )
+        if stale_count:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Results of {stale_count} client scored surveys will be marked "
+                    "stale as they can't be rescored"
+                )
+            )
@@ -0,0 +1,34 @@
+# Generated by Django 3.2.25 on 2026-10-18 17:20
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('summary', '0005_add_verbose_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RescoringJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('modified_at', models.DateTimeField(auto_now=True, verbose_name='modified at')),
+                ('question_ids', models.JSONField(blank=True, default=list, verbose_name='question ids')),
+                ('option_ids', models.JSONField(blank=True, default=list, verbose_name='option ids')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', max_length=10, verbose_name='status')),
+                ('total_surveys', models.PositiveIntegerField(default=0, verbose_name='total surveys')),
+                ('processed_surveys', models.PositiveIntegerField(default=0, verbose_name='processed surveys')),
+                ('created_by', models.ForeignKey(blank=True, default=None, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='created by')),
+                ('updated_by', models.ForeignKey(blank=True, default=None, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='updated by')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
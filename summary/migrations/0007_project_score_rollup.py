@@ -0,0 +1,49 @@
+# Generated by Django 3.2.25 on 2026-10-18 17:22
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0004_add_verbose_name'),
+        ('statement', '0004_add_verbose_name'),
+        ('context', '0002_add_verbose_name'),
+        ('summary', '0006_rescoring_job'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectStatementScore',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('count', models.PositiveIntegerField(default=0, verbose_name='count')),
+                ('total', models.FloatField(default=0, verbose_name='total')),
+                ('minimum', models.FloatField(blank=True, default=None, null=True, verbose_name='minimum')),
+                ('maximum', models.FloatField(blank=True, default=None, null=True, verbose_name='maximum')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='project.project', verbose_name='project')),
+                ('statement', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='statement.statement', verbose_name='statement')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ProjectModuleScore',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('count', models.PositiveIntegerField(default=0, verbose_name='count')),
+                ('total', models.FloatField(default=0, verbose_name='total')),
+                ('minimum', models.FloatField(blank=True, default=None, null=True, verbose_name='minimum')),
+                ('maximum', models.FloatField(blank=True, default=None, null=True, verbose_name='maximum')),
+                ('module', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='context.module', verbose_name='module')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='project.project', verbose_name='project')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='projectstatementscore',
+            constraint=models.UniqueConstraint(fields=('project', 'statement'), name='unique_project_statement_score'),
+        ),
+        migrations.AddConstraint(
+            model_name='projectmodulescore',
+            constraint=models.UniqueConstraint(fields=('project', 'module'), name='unique_project_module_score'),
+        ),
+    ]
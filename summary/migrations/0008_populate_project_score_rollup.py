@@ -0,0 +1,51 @@
+from django.db import migrations
+from django.db.models import Count, Max, Min, Sum
+
+
+def forward_migration(apps, schema_editor):
+    SurveyResult = apps.get_model('summary', 'SurveyResult')
+    for model_name, key_field in [
+        ('ProjectStatementScore', 'statement_id'),
+        ('ProjectModuleScore', 'module_id'),
+    ]:
+        model = apps.get_model('summary', model_name)
+        aggregates = (
+            SurveyResult.objects.values_list('survey__project_id', key_field)
+            .annotate(
+                count=Count('pk'),
+                total=Sum('score'),
+                minimum=Min('score'),
+                maximum=Max('score'),
+            )
+            .order_by()
+        )
+        model.objects.bulk_create(
+            [
+                model(
+                    project_id=project_id,
+                    count=count,
+                    total=total,
+                    minimum=minimum,
+                    maximum=maximum,
+                    **{key_field: key},
+                )
+                for project_id, key, count, total, minimum, maximum in aggregates
+            ],
+            batch_size=1000,
+        )
+
+
+def backward_migration(apps, schema_editor):
+    apps.get_model('summary', 'ProjectStatementScore').objects.all().delete()
+    apps.get_model('summary', 'ProjectModuleScore').objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('summary', '0007_project_score_rollup'),
+    ]
+
+    operations = [
+        migrations.RunPython(forward_migration, backward_migration)
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 3.2.25 on 2026-10-18 17:24
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organization', '0008_add_verbose_name'),
+        ('statement', '0004_add_verbose_name'),
+        ('context', '0002_add_verbose_name'),
+        ('summary', '0008_populate_project_score_rollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnalyticsCubeRefresh',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('modified_at', models.DateTimeField(auto_now=True, verbose_name='modified at')),
+                ('is_full', models.BooleanField(default=False, verbose_name='full refresh')),
+                ('refreshed_months', models.PositiveIntegerField(default=0, verbose_name='refreshed months')),
+                ('completed_at', models.DateTimeField(blank=True, default=None, null=True, verbose_name='completed at')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='AnalyticsCube',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('count', models.PositiveIntegerField(default=0, verbose_name='count')),
+                ('total', models.FloatField(default=0, verbose_name='total')),
+                ('minimum', models.FloatField(blank=True, default=None, null=True, verbose_name='minimum')),
+                ('maximum', models.FloatField(blank=True, default=None, null=True, verbose_name='maximum')),
+                ('month', models.DateField(db_index=True, verbose_name='month')),
+                ('context', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='context.context', verbose_name='context')),
+                ('module', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='context.module', verbose_name='module')),
+                ('organization', models.ForeignKey(blank=True, default=None, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='organization.organization', verbose_name='organization')),
+                ('statement', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='statement.statement', verbose_name='statement')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='analyticscube',
+            index=models.Index(fields=['statement', 'month'], name='analytics_statement_month_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='analyticscube',
+            index=models.Index(fields=['module', 'month'], name='analytics_module_month_idx'),
+        ),
+    ]
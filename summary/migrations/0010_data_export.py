@@ -0,0 +1,37 @@
+# Generated by Django 3.2.25 on 2026-10-18 17:27
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project', '0004_add_verbose_name'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('summary', '0009_analytics_cube'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DataExport',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('modified_at', models.DateTimeField(auto_now=True, verbose_name='modified at')),
+                ('export_type', models.CharField(choices=[('survey_answer', 'Survey Answer'), ('survey_result', 'Survey Result'), ('statement', 'Statement')], max_length=13, verbose_name='export type')),
+                ('format', models.CharField(choices=[('parquet', 'Parquet'), ('arrow', 'Arrow')], default='parquet', max_length=7, verbose_name='format')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', editable=False, max_length=10, verbose_name='status')),
+                ('file', models.FileField(blank=True, default=None, editable=False, null=True, upload_to='summary/data_export', verbose_name='file')),
+                ('row_count', models.PositiveIntegerField(default=0, editable=False, verbose_name='row count')),
+                ('error', models.TextField(blank=True, default=None, editable=False, null=True, verbose_name='error')),
+                ('created_by', models.ForeignKey(blank=True, default=None, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='created by')),
+                ('project', models.ForeignKey(blank=True, default=None, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='data_exports', to='project.project', verbose_name='project')),
+                ('updated_by', models.ForeignKey(blank=True, default=None, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='updated by')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-18 17:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('summary', '0010_data_export'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='surveyresult',
+            name='source',
+            field=models.CharField(choices=[('client', 'Client'), ('server', 'Server')], default='client', editable=False, max_length=6, verbose_name='source'),
+        ),
+    ]
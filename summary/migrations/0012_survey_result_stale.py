@@ -0,0 +1,23 @@
+# Generated by Django 3.2.25 on 2026-10-18 18:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('summary', '0011_survey_result_source'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rescoringjob',
+            name='stale_surveys',
+            field=models.PositiveIntegerField(default=0, verbose_name='stale surveys'),
+        ),
+        migrations.AddField(
+            model_name='surveyresult',
+            name='is_stale',
+            field=models.BooleanField(default=False, editable=False, help_text='Weightages used to score client result have changed since it was posted', verbose_name='is stale'),
+        ),
+    ]
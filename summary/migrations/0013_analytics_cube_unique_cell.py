@@ -0,0 +1,29 @@
+# Generated by Django 3.2.25 on 2026-10-18 18:06
+
+from django.db import migrations, models
+
+
+def clear_analytics_cube(apps, schema_editor):
+    # overlapping refreshes may have left duplicate cells so cube is cleared and
+    # rebuilt by next refresh which is full as no completed refresh is left
+    apps.get_model('summary', 'AnalyticsCube').objects.all().delete()
+    apps.get_model('summary', 'AnalyticsCubeRefresh').objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('summary', '0012_survey_result_stale'),
+    ]
+
+    operations = [
+        migrations.RunPython(clear_analytics_cube, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='analyticscube',
+            constraint=models.UniqueConstraint(fields=('context', 'module', 'statement', 'organization', 'month'), name='unique_analytics_cube_cell'),
+        ),
+        migrations.AddConstraint(
+            model_name='analyticscube',
+            constraint=models.UniqueConstraint(condition=models.Q(('organization__isnull', True)), fields=('context', 'module', 'statement', 'month'), name='unique_analytics_cube_cell_without_organization'),
+        ),
+    ]
@@ -1,10 +1,17 @@
+from django.conf import settings
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from neatplus.models import TimeStampedModel, UserStampedModel
 
+from .tasks import process_data_export, start_rescoring_job
+
 
 class SurveyResult(UserStampedModel, TimeStampedModel):
+    class SourceChoices(models.TextChoices):
+        CLIENT = "client"
+        SERVER = "server"
+
     statement = models.ForeignKey(
         "statement.Statement", on_delete=models.CASCADE, verbose_name=_("statement")
     )
@@ -21,3 +28,256 @@ class SurveyResult(UserStampedModel, TimeStampedModel):
         verbose_name=_("module"),
     )
     score = models.FloatField(_("score"))
+    source = models.CharField(
+        _("source"),
+        max_length=6,
+        choices=SourceChoices.choices,
+        default=SourceChoices.CLIENT,
+        editable=False,
+    )
+    is_stale = models.BooleanField(
+        _("is stale"),
+        default=False,
+        editable=False,
+        help_text=_(
+            "Weightages used to score client result have changed since it was posted"
+        ),
+    )
+
+
+class RescoringJob(UserStampedModel, TimeStampedModel):
+    class StatusChoices(models.TextChoices):
+        PENDING = "pending"
+        PROCESSING = "processing"
+        COMPLETED = "completed"
+        FAILED = "failed"
+
+    question_ids = models.JSONField(_("question ids"), default=list, blank=True)
+    option_ids = models.JSONField(_("option ids"), default=list, blank=True)
+    status = models.CharField(
+        _("status"),
+        max_length=10,
+        choices=StatusChoices.choices,
+        default=StatusChoices.PENDING,
+    )
+    total_surveys = models.PositiveIntegerField(_("total surveys"), default=0)
+    processed_surveys = models.PositiveIntegerField(_("processed surveys"), default=0)
+    stale_surveys = models.PositiveIntegerField(_("stale surveys"), default=0)
+
+    def __str__(self):
+        return f"rescoring-{self.pk}"
+
+    @property
+    def progress(self):
+        if self.status == self.StatusChoices.COMPLETED:
+            return 100
+        if not self.total_surveys:
+            return 0
+        return round(self.processed_surveys * 100 / self.total_surveys)
+
+    def start(self):
+        if settings.ENABLE_CELERY:
+            start_rescoring_job.delay(self.pk)
+        else:
+            start_rescoring_job(self.pk)
+
+
+class ScoreAggregate(models.Model):
+    count = models.PositiveIntegerField(_("count"), default=0)
+    total = models.FloatField(_("total"), default=0)
+    minimum = models.FloatField(_("minimum"), null=True, blank=True, default=None)
+    maximum = models.FloatField(_("maximum"), null=True, blank=True, default=None)
+
+    class Meta:
+        abstract = True
+
+    @property
+    def mean(self):
+        if not self.count:
+            return None
+        return self.total / self.count
+
+    def add_scores(self, scores):
+        self.count += len(scores)
+        self.total += sum(scores)
+        self.minimum = min(
+            [score for score in [self.minimum, *scores] if score is not None]
+        )
+        self.maximum = max(
+            [score for score in [self.maximum, *scores] if score is not None]
+        )
+
+
+class ScoreRollup(ScoreAggregate):
+    project = models.ForeignKey(
+        "project.Project",
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name=_("project"),
+    )
+
+    class Meta:
+        abstract = True
+
+
+class ProjectStatementScore(ScoreRollup):
+    statement = models.ForeignKey(
+        "statement.Statement",
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name=_("statement"),
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["project", "statement"], name="unique_project_statement_score"
+            )
+        ]
+
+
+class ProjectModuleScore(ScoreRollup):
+    module = models.ForeignKey(
+        "context.Module",
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name=_("module"),
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["project", "module"], name="unique_project_module_score"
+            )
+        ]
+
+
+class AnalyticsCube(ScoreAggregate):
+    """
+    Aggregate of survey result scores of projects which share analytics with NEAT
+    by context, module, statement, organization and month of survey.
+    """
+
+    context = models.ForeignKey(
+        "context.Context",
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name=_("context"),
+    )
+    module = models.ForeignKey(
+        "context.Module",
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name=_("module"),
+    )
+    statement = models.ForeignKey(
+        "statement.Statement",
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name=_("statement"),
+    )
+    organization = models.ForeignKey(
+        "organization.Organization",
+        on_delete=models.CASCADE,
+        related_name="+",
+        null=True,
+        blank=True,
+        default=None,
+        verbose_name=_("organization"),
+    )
+    month = models.DateField(_("month"), db_index=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["statement", "month"], name="analytics_statement_month_idx"
+            ),
+            models.Index(fields=["module", "month"], name="analytics_module_month_idx"),
+        ]
+        # null organization isn't equal to other null so it is constrained apart
+        constraints = [
+            models.UniqueConstraint(
+                fields=["context", "module", "statement", "organization", "month"],
+                name="unique_analytics_cube_cell",
+            ),
+            models.UniqueConstraint(
+                fields=["context", "module", "statement", "month"],
+                condition=models.Q(organization__isnull=True),
+                name="unique_analytics_cube_cell_without_organization",
+            ),
+        ]
+
+
+class AnalyticsCubeRefresh(TimeStampedModel):
+    is_full = models.BooleanField(_("full refresh"), default=False)
+    refreshed_months = models.PositiveIntegerField(_("refreshed months"), default=0)
+    completed_at = models.DateTimeField(
+        _("completed at"), null=True, blank=True, default=None
+    )
+
+    def __str__(self):
+        return f"analytics-cube-refresh-{self.pk}"
+
+
+class DataExport(UserStampedModel, TimeStampedModel):
+    class ExportTypeChoices(models.TextChoices):
+        SURVEY_ANSWER = "survey_answer"
+        SURVEY_RESULT = "survey_result"
+        STATEMENT = "statement"
+
+    class FormatChoices(models.TextChoices):
+        PARQUET = "parquet"
+        ARROW = "arrow"
+
+    class StatusChoices(models.TextChoices):
+        PENDING = "pending"
+        PROCESSING = "processing"
+        COMPLETED = "completed"
+        FAILED = "failed"
+
+    export_type = models.CharField(
+        _("export type"), max_length=13, choices=ExportTypeChoices.choices
+    )
+    format = models.CharField(
+        _("format"),
+        max_length=7,
+        choices=FormatChoices.choices,
+        default=FormatChoices.PARQUET,
+    )
+    project = models.ForeignKey(
+        "project.Project",
+        on_delete=models.CASCADE,
+        related_name="data_exports",
+        null=True,
+        blank=True,
+        default=None,
+        verbose_name=_("project"),
+    )
+    status = models.CharField(
+        _("status"),
+        max_length=10,
+        choices=StatusChoices.choices,
+        default=StatusChoices.PENDING,
+        editable=False,
+    )
+    file = models.FileField(
+        _("file"),
+        upload_to="summary/data_export",
+        null=True,
+        blank=True,
+        default=None,
+        editable=False,
+    )
+    row_count = models.PositiveIntegerField(_("row count"), default=0, editable=False)
+    error = models.TextField(
+        _("error"), null=True, blank=True, default=None, editable=False
+    )
+
+    def __str__(self):
+        return f"{self.export_type}-{self.pk}"
+
+    def start(self):
+        if settings.ENABLE_CELERY:
+            process_data_export.delay(self.pk)
+        else:
+            process_data_export(self.pk)
@@ -0,0 +1,168 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef, Q
+from django.utils import timezone
+
+from survey.models import Survey, SurveyAnswer
+
+from .models import RescoringJob, SurveyResult
+from .scoring import save_survey_scores
+from .tasks import rescore_survey_chunk
+
+RESCORING_CHUNK_SIZE = 200
+
+
+def filter_server_scored(queryset, survey_field):
+    """
+    Filter queryset to surveys whose results were all calculated by server. Results
+    posted by clients are historical scores so surveys having any of them are never
+    rescored.
+    """
+    results = SurveyResult.objects.filter(survey_id=OuterRef(survey_field))
+    return queryset.filter(
+        Exists(results.filter(source=SurveyResult.SourceChoices.SERVER))
+    ).exclude(Exists(results.filter(source=SurveyResult.SourceChoices.CLIENT)))
+
+
+def filter_client_scored(queryset, survey_field):
+    """
+    Filter queryset to surveys having any result posted by client.
+    """
+    return queryset.filter(
+        Exists(
+            SurveyResult.objects.filter(
+                survey_id=OuterRef(survey_field),
+                source=SurveyResult.SourceChoices.CLIENT,
+            )
+        )
+    )
+
+
+def get_affected_survey_answers(question_ids=(), option_ids=()):
+    return SurveyAnswer.objects.filter(
+        Q(question_id__in=question_ids) | Q(options__in=option_ids)
+    )
+
+
+def get_affected_surveys(question_ids=(), option_ids=()):
+    """
+    Return queryset of ids of server scored surveys which have answer of provided
+    questions or have selected any of provided options.
+    """
+    return (
+        filter_server_scored(
+            get_affected_survey_answers(question_ids, option_ids), "survey_id"
+        )
+        .order_by("survey_id")
+        .values_list("survey_id", flat=True)
+        .distinct()
+    )
+
+
+def get_stale_surveys(question_ids=(), option_ids=()):
+    """
+    Return queryset of ids of client scored surveys which have answer of provided
+    questions or have selected any of provided options. Their results can't be
+    recalculated by server so they are marked as stale instead.
+    """
+    return (
+        filter_client_scored(
+            get_affected_survey_answers(question_ids, option_ids), "survey_id"
+        )
+        .order_by("survey_id")
+        .values_list("survey_id", flat=True)
+        .distinct()
+    )
+
+
+def mark_results_stale(survey_ids):
+    """
+    Mark results posted by clients for provided surveys as stale and return number
+    of surveys whose results were marked.
+    """
+    survey_ids = set(survey_ids)
+    SurveyResult.objects.filter(
+        survey_id__in=survey_ids, source=SurveyResult.SourceChoices.CLIENT
+    ).update(is_stale=True, modified_at=timezone.now())
+    return len(survey_ids)
+
+
+def schedule_rescoring(question_ids=(), option_ids=(), user=None):
+    """
+    Create rescoring job for surveys affected by weightage change of provided
+    questions and options. Job is started only after current transaction is
+    committed so that rescoring uses changed weightages.
+    """
+    job = RescoringJob.objects.create(
+        question_ids=sorted(set(question_ids)),
+        option_ids=sorted(set(option_ids)),
+        created_by=user,
+    )
+    transaction.on_commit(job.start)
+    return job
+
+
+def start_rescoring(job):
+    """
+    Find surveys affected by rescoring job and enqueue rescoring of them in chunks.
+    Results of affected surveys scored by client are marked as stale.
+    """
+    survey_ids = list(get_affected_surveys(job.question_ids, job.option_ids))
+    job.stale_surveys = mark_results_stale(
+        get_stale_surveys(job.question_ids, job.option_ids)
+    )
+    job.total_surveys = len(survey_ids)
+    job.processed_surveys = 0
+    if survey_ids:
+        job.status = RescoringJob.StatusChoices.PROCESSING
+    else:
+        job.status = RescoringJob.StatusChoices.COMPLETED
+    job.save(
+        update_fields=[
+            "status",
+            "total_surveys",
+            "processed_surveys",
+            "stale_surveys",
+            "modified_at",
+        ]
+    )
+    for start in range(0, len(survey_ids), RESCORING_CHUNK_SIZE):
+        chunk = survey_ids[start : start + RESCORING_CHUNK_SIZE]
+        if settings.ENABLE_CELERY:
+            rescore_survey_chunk.delay(job.pk, chunk)
+        else:
+            rescore_survey_chunk(job.pk, chunk)
+
+
+def rescore_chunk(job, survey_ids):
+    """
+    Rescore chunk of surveys of rescoring job and update progress of job. Job is
+    marked as completed once all of its chunks are processed.
+    """
+    jobs = RescoringJob.objects.filter(pk=job.pk)
+    try:
+        # client may have posted results since job was started
+        server_scored_survey_ids = filter_server_scored(
+            Survey.objects.filter(pk__in=survey_ids), "pk"
+        ).values_list("pk", flat=True)
+        stale_count = mark_results_stale(
+            filter_client_scored(
+                Survey.objects.filter(pk__in=survey_ids), "pk"
+            ).values_list("pk", flat=True)
+        )
+        save_survey_scores(server_scored_survey_ids, user=job.created_by)
+    except Exception:
+        jobs.update(
+            status=RescoringJob.StatusChoices.FAILED, modified_at=timezone.now()
+        )
+        raise
+    # chunks can be processed simultaneously so progress is updated in database
+    jobs.update(
+        processed_surveys=F("processed_surveys") + len(survey_ids),
+        stale_surveys=F("stale_surveys") + stale_count,
+        modified_at=timezone.now(),
+    )
+    jobs.filter(
+        status=RescoringJob.StatusChoices.PROCESSING,
+        processed_surveys__gte=F("total_surveys"),
+    ).update(status=RescoringJob.StatusChoices.COMPLETED)
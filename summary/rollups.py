@@ -0,0 +1,175 @@
+from collections import defaultdict
+from functools import reduce
+from operator import or_
+
+from django.db import transaction
+from django.db.models import Count, Max, Min, Q, Sum
+
+from project.models import Project
+
+from .models import ProjectModuleScore, ProjectStatementScore, SurveyResult
+
+# rollup model and index of its key in (project, statement, module) result key
+ROLLUPS = [
+    (ProjectStatementScore, "statement_id", 1),
+    (ProjectModuleScore, "module_id", 2),
+]
+ROLLUP_FIELDS = ["count", "total", "minimum", "maximum"]
+
+
+def get_result_keys(survey_results):
+    """
+    Return (project, statement, module) key of survey results whose survey is
+    already loaded.
+    """
+    return {
+        (
+            survey_result.survey.project_id,
+            survey_result.statement_id,
+            survey_result.module_id,
+        )
+        for survey_result in survey_results
+    }
+
+
+def get_queryset_result_keys(queryset):
+    return set(
+        queryset.values_list(
+            "survey__project_id", "statement_id", "module_id"
+        ).distinct()
+    )
+
+
+def lock_rollups(model, key_field, keys):
+    """
+    Create missing rollups of provided (project, key) pairs and return all of them
+    locked for update until end of transaction.
+    """
+    if not keys:
+        return {}
+    model.objects.bulk_create(
+        [model(project_id=project_id, **{key_field: key}) for project_id, key in keys],
+        ignore_conflicts=True,
+    )
+    keys_by_project = defaultdict(set)
+    for project_id, key in keys:
+        keys_by_project[project_id].add(key)
+    rollups = model.objects.select_for_update().filter(
+        reduce(
+            or_,
+            (
+                Q(project_id=project_id, **{f"{key_field}__in": project_keys})
+                for project_id, project_keys in keys_by_project.items()
+            ),
+        )
+    )
+    return {
+        (rollup.project_id, getattr(rollup, key_field)): rollup for rollup in rollups
+    }
+
+
+def add_to_score_rollups(survey_results):
+    """
+    Add scores of newly created survey results to rollups of their project without
+    reading other survey results of project.
+    """
+    scores = defaultdict(list)
+    for survey_result in survey_results:
+        key = (
+            survey_result.survey.project_id,
+            survey_result.statement_id,
+            survey_result.module_id,
+        )
+        scores[key].append(survey_result.score)
+    with transaction.atomic():
+        for model, key_field, key_index in ROLLUPS:
+            rollup_scores = defaultdict(list)
+            for key, key_scores in scores.items():
+                rollup_scores[(key[0], key[key_index])].extend(key_scores)
+            rollups = lock_rollups(model, key_field, rollup_scores.keys())
+            for rollup_key, rollup_score in rollup_scores.items():
+                rollups[rollup_key].add_scores(rollup_score)
+            model.objects.bulk_update(rollups.values(), ROLLUP_FIELDS)
+
+
+def refresh_score_rollups(keys):
+    """
+    Recalculate rollups of provided (project, statement, module) keys from survey
+    results. Used when survey results are changed or deleted since minimum and
+    maximum can't be updated incrementally.
+    """
+    keys = set(keys)
+    # rollups of deleted project are already deleted along with it
+    project_ids = set(
+        Project.objects.filter(pk__in={key[0] for key in keys}).values_list(
+            "pk", flat=True
+        )
+    )
+    keys = {key for key in keys if key[0] in project_ids}
+    if not keys:
+        return
+    with transaction.atomic():
+        for model, key_field, key_index in ROLLUPS:
+            rollup_keys = {(key[0], key[key_index]) for key in keys}
+            rollups = lock_rollups(model, key_field, rollup_keys)
+            for rollup in rollups.values():
+                rollup.count, rollup.total = 0, 0
+                rollup.minimum, rollup.maximum = None, None
+            aggregates = (
+                SurveyResult.objects.filter(
+                    survey__project_id__in=project_ids,
+                    **{f"{key_field}__in": {key for _project, key in rollup_keys}},
+                )
+                .values_list("survey__project_id", key_field)
+                .annotate(
+                    count=Count("pk"),
+                    total=Sum("score"),
+                    minimum=Min("score"),
+                    maximum=Max("score"),
+                )
+                .order_by()
+            )
+            for project_id, key, count, total, minimum, maximum in aggregates:
+                rollup = rollups.get((project_id, key))
+                if rollup is not None:
+                    rollup.count, rollup.total = count, total
+                    rollup.minimum, rollup.maximum = minimum, maximum
+            model.objects.bulk_update(rollups.values(), ROLLUP_FIELDS)
+            model.objects.filter(
+                pk__in=[rollup.pk for rollup in rollups.values() if not rollup.count]
+            ).delete()
+
+
+def schedule_score_rollups_refresh(keys):
+    """
+    Refresh rollups of provided (project, statement, module) keys once current
+    transaction is committed. Keys of every write of transaction are collected on
+    connection so that each rollup is refreshed once even when many results are
+    deleted by cascade.
+    """
+    connection = transaction.get_connection()
+    pending_keys = connection.__dict__.setdefault("pending_score_rollup_keys", set())
+    pending_keys.update(keys)
+    transaction.on_commit(refresh_pending_score_rollups)
+
+
+def refresh_pending_score_rollups():
+    connection = transaction.get_connection()
+    keys = connection.__dict__.pop("pending_score_rollup_keys", set())
+    refresh_score_rollups(keys)
+
+
+def rebuild_score_rollups(project_ids=None):
+    """
+    Rebuild rollups of provided projects or all projects from survey results.
+    """
+    survey_results = SurveyResult.objects.all()
+    if project_ids is not None:
+        survey_results = survey_results.filter(survey__project_id__in=project_ids)
+    with transaction.atomic():
+        for model, _key_field, _key_index in ROLLUPS:
+            rollups = model.objects.all()
+            if project_ids is not None:
+                rollups = rollups.filter(project_id__in=project_ids)
+            rollups.delete()
+        refresh_score_rollups(get_queryset_result_keys(survey_results))
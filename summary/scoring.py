@@ -0,0 +1,254 @@
+from collections import defaultdict
+
+import numpy as np
+from django.db import transaction
+
+from statement.models import OptionStatement, QuestionStatement
+from survey.models import SurveyAnswer
+
+from .models import SurveyResult
+from .rollups import get_queryset_result_keys, refresh_score_rollups
+
+
+class SparseWeightages:
+    """
+    Sparse row × statement weightage matrix stored as arrays of non zero cells
+    sorted by row id, which is compressed sparse row layout with row id lookup done
+    by binary search instead of dense row index.
+    """
+
+    def __init__(self, row_ids, statement_ids, weightages):
+        order = np.argsort(row_ids, kind="stable")
+        self.row_ids = np.asarray(row_ids, dtype=np.int64)[order]
+        self.statement_ids = np.asarray(statement_ids, dtype=np.int64)[order]
+        self.weightages = np.asarray(weightages, dtype=np.float64)[order]
+
+    @classmethod
+    def from_queryset(cls, queryset, row_field):
+        cells = list(queryset.values_list(row_field, "statement_id", "weightage"))
+        if not cells:
+            return cls([], [], [])
+        return cls(*zip(*cells))
+
+    def take(self, row_ids):
+        """
+        Return cells of provided rows as arrays of index of row in row_ids, statement
+        id and weightage. All rows are looked up with one binary search over sorted
+        row ids.
+        """
+        starts = np.searchsorted(self.row_ids, row_ids, side="left")
+        counts = np.searchsorted(self.row_ids, row_ids, side="right") - starts
+        owners = np.repeat(np.arange(len(row_ids)), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+        cells = np.repeat(starts, counts) + offsets
+        return owners, self.statement_ids[cells], self.weightages[cells]
+
+
+class AnsweredQuestions:
+    """
+    Answered questions of surveys as arrays. Each answered question of survey is
+    single answer even if survey has several answers of it and each selection is
+    index of answer along with selected option id.
+    """
+
+    def __init__(
+        self, survey_ids, question_ids, module_ids, selection_answers, option_ids
+    ):
+        self.survey_ids = survey_ids
+        self.question_ids = question_ids
+        self.module_ids = module_ids
+        self.selection_answers = selection_answers
+        self.option_ids = option_ids
+
+
+class WeightageMatrix:
+    """
+    Sparse question × statement and option × statement weightage matrices.
+
+    Only non zero cells are stored so matrix of whole catalog stays small and
+    answers of any number of surveys are scored together with array operations.
+    """
+
+    def __init__(self, question_weightages, option_weightages):
+        self.question_weightages = question_weightages
+        self.option_weightages = option_weightages
+
+    @classmethod
+    def load(cls, question_ids=None, option_ids=None):
+        """
+        Load weightages of provided questions and options with one query per matrix.
+        Weightages of whole catalog are loaded if ids are not provided.
+        """
+        question_statements = QuestionStatement.objects.all()
+        option_statements = OptionStatement.objects.all()
+        if question_ids is not None:
+            question_statements = question_statements.filter(
+                question_id__in=question_ids
+            )
+        if option_ids is not None:
+            option_statements = option_statements.filter(option_id__in=option_ids)
+        return cls(
+            SparseWeightages.from_queryset(question_statements, "question_id"),
+            SparseWeightages.from_queryset(option_statements, "option_id"),
+        )
+
+    def score(self, answered_questions):
+        """
+        Return dictionary of survey id and score of each statement and module for
+        answered questions of surveys.
+
+        Score of statement for module is weighted average of sum of selected option
+        weightages of module questions linked to statement where question weightage
+        is used as weight. Question which isn't linked to statement but has option
+        linked to statement has weight of 1. Questions without module aren't scored.
+
+        This is server side definition of score built only from weightages stored
+        in catalog. Results saved from it are marked with server source so that they
+        can be told apart from results posted by clients.
+        """
+        scored = answered_questions.module_ids >= 0
+        (
+            option_owners,
+            option_statements,
+            option_weightages,
+        ) = self.option_weightages.take(answered_questions.option_ids)
+        option_answers = answered_questions.selection_answers[option_owners]
+        option_kept = scored[option_answers]
+        (
+            question_answers,
+            question_statements,
+            question_weightages,
+        ) = self.question_weightages.take(answered_questions.question_ids)
+        question_kept = scored[question_answers]
+        option_answers = option_answers[option_kept]
+
+        # cells are unique pairs of answer index and statement present in either
+        # selected option or question matrix
+        cells, cell_index = np.unique(
+            np.stack(
+                [
+                    np.concatenate([option_answers, question_answers[question_kept]]),
+                    np.concatenate(
+                        [
+                            option_statements[option_kept],
+                            question_statements[question_kept],
+                        ]
+                    ),
+                ]
+            ),
+            axis=1,
+            return_inverse=True,
+        )
+        cell_index = cell_index.reshape(-1)
+        option_totals = np.bincount(
+            cell_index[: len(option_answers)],
+            weights=option_weightages[option_kept],
+            minlength=cells.shape[1],
+        )
+        weights = np.ones(cells.shape[1])
+        weights[cell_index[len(option_answers) :]] = question_weightages[question_kept]
+
+        cell_answers, cell_statements = cells
+        keys, key_index = np.unique(
+            np.stack(
+                [
+                    answered_questions.survey_ids[cell_answers],
+                    cell_statements,
+                    answered_questions.module_ids[cell_answers],
+                ]
+            ),
+            axis=1,
+            return_inverse=True,
+        )
+        key_index = key_index.reshape(-1)
+        numerators = np.bincount(
+            key_index, weights=weights * option_totals, minlength=keys.shape[1]
+        )
+        denominators = np.bincount(key_index, weights=weights, minlength=keys.shape[1])
+        scores = defaultdict(dict)
+        for (survey_id, statement_id, module_id), numerator, denominator in zip(
+            keys.T.tolist(), numerators.tolist(), denominators.tolist()
+        ):
+            if denominator:
+                scores[survey_id][(statement_id, module_id)] = numerator / denominator
+        return scores
+
+
+def get_answered_questions(survey_ids):
+    """
+    Return answered questions of surveys with their module and selected options.
+    Answers of all surveys are loaded with single query.
+    """
+    rows = list(
+        SurveyAnswer.objects.filter(survey_id__in=survey_ids).values_list(
+            "survey_id", "question_id", "question__module_id", "options"
+        )
+    )
+    if not rows:
+        empty = np.zeros(0, dtype=np.int64)
+        return AnsweredQuestions(empty, empty, empty, empty, empty)
+    # missing module and option are replaced by -1 as ids are always positive
+    rows = np.array(
+        [[value if value is not None else -1 for value in row] for row in rows],
+        dtype=np.int64,
+    )
+    answers, first_rows, row_answers = np.unique(
+        rows[:, :2], axis=0, return_index=True, return_inverse=True
+    )
+    row_answers = row_answers.reshape(-1)
+    selections = np.unique(
+        np.stack([row_answers, rows[:, 3]], axis=1)[rows[:, 3] >= 0], axis=0
+    ).reshape(-1, 2)
+    return AnsweredQuestions(
+        answers[:, 0],
+        answers[:, 1],
+        rows[first_rows, 2],
+        selections[:, 0],
+        selections[:, 1],
+    )
+
+
+def score_surveys(survey_ids, matrix=None):
+    """
+    Return dictionary of survey id and score of each statement and module for
+    provided surveys. All surveys are scored together in single pass.
+    """
+    answered_questions = get_answered_questions(survey_ids)
+    if matrix is None:
+        matrix = WeightageMatrix.load(
+            question_ids=set(answered_questions.question_ids.tolist()),
+            option_ids=set(answered_questions.option_ids.tolist()),
+        )
+    scores = matrix.score(answered_questions)
+    return {survey_id: scores.get(survey_id, {}) for survey_id in survey_ids}
+
+
+def save_survey_scores(survey_ids, user=None, matrix=None):
+    """
+    Score provided surveys and replace their survey results with calculated scores
+    inside single transaction. Score rollups of replaced and created results are
+    recalculated. Returns created survey results.
+    """
+    survey_ids = list(survey_ids)
+    scores = score_surveys(survey_ids, matrix=matrix)
+    survey_results = [
+        SurveyResult(
+            survey_id=survey_id,
+            statement_id=statement_id,
+            module_id=module_id,
+            score=score,
+            source=SurveyResult.SourceChoices.SERVER,
+            created_by=user,
+        )
+        for survey_id, survey_scores in scores.items()
+        for (statement_id, module_id), score in survey_scores.items()
+    ]
+    survey_result_queryset = SurveyResult.objects.filter(survey_id__in=survey_ids)
+    with transaction.atomic():
+        # rollups of deleted results are refreshed by signals
+        survey_result_queryset.delete()
+        SurveyResult.objects.bulk_create(survey_results)
+        refresh_score_rollups(get_queryset_result_keys(survey_result_queryset))
+    return survey_results
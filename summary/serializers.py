@@ -1,6 +1,8 @@
 from rest_framework import serializers
 
-from .models import SurveyResult
+from project.utils import read_allowed_project_for_user
+
+from .models import DataExport, SurveyResult
 
 
 class SurveyResultSerializer(serializers.ModelSerializer):
@@ -13,3 +15,49 @@ class WritableSurveyResultSerializer(SurveyResultSerializer):
     class Meta:
         model = SurveyResult
         exclude = ("survey",)
+
+
+class ScoreRollupSerializer(serializers.Serializer):
+    count = serializers.IntegerField()
+    mean = serializers.FloatField(allow_null=True)
+    minimum = serializers.FloatField(allow_null=True)
+    maximum = serializers.FloatField(allow_null=True)
+
+
+class ProjectStatementScoreSerializer(ScoreRollupSerializer):
+    statement = serializers.IntegerField(source="statement_id")
+
+
+class ProjectModuleScoreSerializer(ScoreRollupSerializer):
+    module = serializers.IntegerField(source="module_id")
+
+
+class ProjectScoreSummarySerializer(serializers.Serializer):
+    project = serializers.IntegerField()
+    statements = ProjectStatementScoreSerializer(many=True)
+    modules = ProjectModuleScoreSerializer(many=True)
+
+
+class AnalyticsCubeSerializer(serializers.Serializer):
+    context = serializers.IntegerField(required=False)
+    module = serializers.IntegerField(required=False)
+    statement = serializers.IntegerField(required=False)
+    organization = serializers.IntegerField(required=False, allow_null=True)
+    month = serializers.DateField(required=False)
+    count = serializers.IntegerField(source="score_count")
+    mean = serializers.FloatField(source="score_mean")
+    minimum = serializers.FloatField(source="score_minimum")
+    maximum = serializers.FloatField(source="score_maximum")
+
+
+class DataExportSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = DataExport
+        fields = "__all__"
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get("request")
+        if request is not None and "project" in fields:
+            fields["project"].queryset = read_allowed_project_for_user(request.user)
+        return fields
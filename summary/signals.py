@@ -0,0 +1,70 @@
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch.dispatcher import receiver
+
+from survey.models import Survey
+
+from .models import SurveyResult
+from .rollups import (
+    get_queryset_result_keys,
+    get_result_keys,
+    schedule_score_rollups_refresh,
+)
+
+
+@receiver(pre_save, sender=SurveyResult)
+def remember_previous_result_key(sender, instance, raw=False, **kwargs):
+    instance._previous_result_keys = set()
+    if not raw and not instance._state.adding:
+        instance._previous_result_keys = get_queryset_result_keys(
+            SurveyResult.objects.filter(pk=instance.pk)
+        )
+
+
+@receiver(post_save, sender=SurveyResult)
+def refresh_rollups_of_saved_result(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    schedule_score_rollups_refresh(
+        getattr(instance, "_previous_result_keys", set()) | get_result_keys([instance])
+    )
+
+
+@receiver(pre_delete, sender=SurveyResult)
+def remember_deleted_result_key(sender, instance, **kwargs):
+    # survey may be deleted along with result so key is read before deletion
+    instance._previous_result_keys = get_result_keys([instance])
+
+
+@receiver(post_delete, sender=SurveyResult)
+def refresh_rollups_of_deleted_result(sender, instance, **kwargs):
+    schedule_score_rollups_refresh(getattr(instance, "_previous_result_keys", set()))
+
+
+@receiver(pre_save, sender=Survey)
+def remember_previous_survey_project(sender, instance, raw=False, **kwargs):
+    instance._previous_project_id = None
+    update_fields = kwargs.get("update_fields")
+    if raw or instance._state.adding:
+        return
+    if update_fields is None or "project" in update_fields:
+        instance._previous_project_id = (
+            Survey.objects.filter(pk=instance.pk)
+            .values_list("project_id", flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=Survey)
+def refresh_rollups_of_moved_survey(sender, instance, created, raw=False, **kwargs):
+    previous_project_id = getattr(instance, "_previous_project_id", None)
+    if created or raw or previous_project_id in (None, instance.project_id):
+        return
+    # results of survey are moved to other project
+    result_keys = get_queryset_result_keys(instance.results.all())
+    schedule_score_rollups_refresh(
+        result_keys
+        | {
+            (previous_project_id, statement_id, module_id)
+            for _project_id, statement_id, module_id in result_keys
+        }
+    )
@@ -0,0 +1,48 @@
+from celery import shared_task
+from django.contrib.auth import get_user_model
+
+from neatplus.celery import no_simultaneous_execution
+
+
+@shared_task(bind=True)
+@no_simultaneous_execution
+def score_surveys(self, survey_ids, user_id=None):
+    from .scoring import save_survey_scores
+
+    user = get_user_model().objects.filter(pk=user_id).first() if user_id else None
+    save_survey_scores(survey_ids, user=user)
+
+
+@shared_task(bind=True)
+@no_simultaneous_execution
+def start_rescoring_job(self, job_id):
+    from .models import RescoringJob
+    from .rescoring import start_rescoring
+
+    start_rescoring(RescoringJob.objects.get(pk=job_id))
+
+
+@shared_task(bind=True)
+@no_simultaneous_execution
+def rescore_survey_chunk(self, job_id, survey_ids):
+    from .models import RescoringJob
+    from .rescoring import rescore_chunk
+
+    rescore_chunk(RescoringJob.objects.get(pk=job_id), survey_ids)
+
+
+@shared_task(bind=True)
+@no_simultaneous_execution
+def refresh_analytics_cube(self, full=False):
+    from .analytics import refresh_analytics_cube
+
+    refresh_analytics_cube(full=full)
+
+
+@shared_task(bind=True)
+@no_simultaneous_execution
+def process_data_export(self, export_id):
+    from .export import write_data_export
+    from .models import DataExport
+
+    write_data_export(DataExport.objects.get(pk=export_id))
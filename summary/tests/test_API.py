@@ -1,6 +1,40 @@
+import csv
+from io import StringIO
+
+import pyarrow.parquet
 from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.test import override_settings
 
 from neatplus.tests import FullTestCase
+from neatplus.views import escape_csv_value
+from project.utils import read_allowed_project_for_user
+from summary.analytics import refresh_analytics_cube
+from summary.models import DataExport, RescoringJob
+from summary.rescoring import schedule_rescoring
+from summary.scoring import score_surveys
+
+# Survey scored by client along with results it posted. Weightages are keyed by
+# statement name and results are [statement, module, score].
+CLIENT_SCORED_SURVEY = {
+    "questions": {
+        "q1": {"module": "m1", "weightages": {"s1": 2, "s2": 1}},
+        "q2": {"module": "m1", "weightages": {"s1": 1}},
+        "q3": {"module": "m2", "weightages": {"s2": 3}},
+        "q4": {"module": "m2", "weightages": {}},
+    },
+    "options": {
+        "o1": {"question": "q1", "weightages": {"s1": 1, "s2": 0.5}},
+        "o2": {"question": "q1", "weightages": {"s1": 0.5}},
+        "o3": {"question": "q2", "weightages": {"s1": 0.25}},
+        "o4": {"question": "q3", "weightages": {"s2": 0.75}},
+        "o5": {"question": "q4", "weightages": {"s2": 1}},
+        "o6": {"question": "q3", "weightages": {"s2": 0.1}},
+    },
+    "answers": {"q1": ["o1"], "q2": ["o3"], "q3": ["o4"], "q4": ["o5"]},
+    "results": [["s1", "m1", 0.75], ["s2", "m1", 0.5], ["s2", "m2", 0.8125]],
+}
 
 
 class APITest(FullTestCase):
@@ -18,6 +52,7 @@ class APITest(FullTestCase):
             status="accepted",
         )
         survey = cls.baker.make("survey.Survey", project=project)
+        cls.project = project
         statement = cls.baker.make("statement.Statement")
         survey_result = cls.baker.make(
             "summary.SurveyResult",
@@ -40,3 +75,431 @@ class APITest(FullTestCase):
         self.client.force_authenticate(self.user)
         response = self.client.get(self.survey_result_detail_url)
         self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+
+    def test_calculate_survey_results(self):
+        survey = self.baker.make(
+            "survey.Survey", project=self.project, created_by=self.user
+        )
+        module = self.baker.make("context.Module")
+        statement = self.baker.make("statement.Statement")
+        question_1, question_2 = self.baker.make(
+            "survey.Question",
+            module=module,
+            answer_type="single_option",
+            _quantity=2,
+        )
+        option_1 = self.baker.make("survey.Option", question=question_1)
+        option_2 = self.baker.make("survey.Option", question=question_2)
+        self.baker.make(
+            "statement.QuestionStatement",
+            question=question_1,
+            statement=statement,
+            weightage=3,
+        )
+        self.baker.make(
+            "statement.QuestionStatement",
+            question=question_2,
+            statement=statement,
+            weightage=1,
+        )
+        self.baker.make(
+            "statement.OptionStatement",
+            option=option_1,
+            statement=statement,
+            weightage=1,
+        )
+        self.baker.make(
+            "statement.OptionStatement",
+            option=option_2,
+            statement=statement,
+            weightage=0.2,
+        )
+        for question, option in [(question_1, option_1), (question_2, option_2)]:
+            self.baker.make(
+                "survey.SurveyAnswer",
+                survey=survey,
+                question=question,
+                answer_type="single_option",
+                options=[option],
+            )
+        self.baker.make("summary.SurveyResult", survey=survey, statement=statement)
+        url = self.reverse(
+            "survey-calculate-results", kwargs={"version": "v1", "pk": survey.pk}
+        )
+        self.client.force_authenticate(self.user)
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, self.status_code.HTTP_201_CREATED)
+        self.assertEqual(len(response.json()), 1)
+        self.assertEqual(response.json()[0]["statement"], statement.pk)
+        self.assertEqual(response.json()[0]["module"], module.pk)
+        self.assertAlmostEqual(response.json()[0]["score"], 0.8)
+        self.assertEqual(response.json()[0]["source"], "server")
+        self.assertEqual(survey.results.count(), 1)
+
+    def test_score_surveys_worked_example(self):
+        survey = self.baker.make("survey.Survey", project=self.project)
+        statement = self.baker.make("statement.Statement")
+        module_1, module_2 = self.baker.make("context.Module", _quantity=2)
+        question_1, question_2 = self.baker.make(
+            "survey.Question", module=module_1, _quantity=2
+        )
+        question_3 = self.baker.make("survey.Question", module=module_2)
+        question_4 = self.baker.make("survey.Question", module=None)
+        option_1, option_2 = self.baker.make(
+            "survey.Option", question=question_1, _quantity=2
+        )
+        option_3 = self.baker.make("survey.Option", question=question_2)
+        option_4 = self.baker.make("survey.Option", question=question_3)
+        option_5 = self.baker.make("survey.Option", question=question_4)
+        for question, weightage in [(question_1, 2), (question_3, 4)]:
+            self.baker.make(
+                "statement.QuestionStatement",
+                question=question,
+                statement=statement,
+                weightage=weightage,
+            )
+        for option, weightage in [
+            (option_1, 0.5),
+            (option_2, 0.25),
+            (option_3, 1),
+            (option_5, 1),
+        ]:
+            self.baker.make(
+                "statement.OptionStatement",
+                option=option,
+                statement=statement,
+                weightage=weightage,
+            )
+        for question, options in [
+            (question_1, [option_1, option_2]),
+            (question_2, [option_3]),
+            (question_3, [option_4]),
+            (question_4, [option_5]),
+        ]:
+            self.baker.make(
+                "survey.SurveyAnswer",
+                survey=survey,
+                question=question,
+                answer_type="multiple_option",
+                options=options,
+            )
+        scores = score_surveys([survey.pk])[survey.pk]
+        # module 1: (2 * (0.5 + 0.25) + 1 * 1) / (2 + 1), question 2 isn't linked
+        # to statement so it has weight of 1
+        # module 2: (4 * 0) / 4 since selected option isn't linked to statement
+        # question 4 doesn't belong to any module so it isn't scored
+        self.assertEqual(
+            set(scores), {(statement.pk, module_1.pk), (statement.pk, module_2.pk)}
+        )
+        self.assertAlmostEqual(scores[(statement.pk, module_1.pk)], 2.5 / 3)
+        self.assertAlmostEqual(scores[(statement.pk, module_2.pk)], 0)
+
+    def test_score_surveys_matches_client_results(self):
+        fixture = CLIENT_SCORED_SURVEY
+        survey = self.baker.make("survey.Survey", project=self.project)
+        statements = {
+            name: self.baker.make("statement.Statement") for name in ["s1", "s2"]
+        }
+        modules = {name: self.baker.make("context.Module") for name in ["m1", "m2"]}
+        questions = {}
+        for name, question in fixture["questions"].items():
+            questions[name] = self.baker.make(
+                "survey.Question", module=modules[question["module"]]
+            )
+            for statement, weightage in question["weightages"].items():
+                self.baker.make(
+                    "statement.QuestionStatement",
+                    question=questions[name],
+                    statement=statements[statement],
+                    weightage=weightage,
+                )
+        options = {}
+        for name, option in fixture["options"].items():
+            options[name] = self.baker.make(
+                "survey.Option", question=questions[option["question"]]
+            )
+            for statement, weightage in option["weightages"].items():
+                self.baker.make(
+                    "statement.OptionStatement",
+                    option=options[name],
+                    statement=statements[statement],
+                    weightage=weightage,
+                )
+        for question, selected_options in fixture["answers"].items():
+            self.baker.make(
+                "survey.SurveyAnswer",
+                survey=survey,
+                question=questions[question],
+                answer_type="multiple_option",
+                options=[options[option] for option in selected_options],
+            )
+        for statement, module, score in fixture["results"]:
+            self.baker.make(
+                "summary.SurveyResult",
+                survey=survey,
+                statement=statements[statement],
+                module=modules[module],
+                score=score,
+            )
+        client_scores = {
+            (result.statement_id, result.module_id): result.score
+            for result in survey.results.all()
+        }
+        scores = score_surveys([survey.pk])[survey.pk]
+        self.assertEqual(set(scores), set(client_scores))
+        for key, score in client_scores.items():
+            self.assertAlmostEqual(scores[key], score)
+
+    @override_settings(ENABLE_CELERY=False)
+    def test_rescore_affected_surveys(self):
+        statement = self.baker.make("statement.Statement")
+        question = self.baker.make(
+            "survey.Question",
+            module=self.baker.make("context.Module"),
+            answer_type="single_option",
+        )
+        option = self.baker.make("survey.Option", question=question)
+        option_statement = self.baker.make(
+            "statement.OptionStatement", option=option, statement=statement, weightage=1
+        )
+        affected_survey, unaffected_survey, client_scored_survey = self.baker.make(
+            "survey.Survey", project=self.project, _quantity=3
+        )
+        self.baker.make(
+            "summary.SurveyResult",
+            survey=affected_survey,
+            statement=statement,
+            module=question.module,
+            score=1,
+            source="server",
+        )
+        client_result = self.baker.make(
+            "summary.SurveyResult",
+            survey=client_scored_survey,
+            statement=statement,
+            module=question.module,
+            score=0.3,
+        )
+        self.baker.make(
+            "survey.SurveyAnswer",
+            survey=client_scored_survey,
+            question=question,
+            answer_type="single_option",
+            options=[option],
+        )
+        self.baker.make(
+            "survey.SurveyAnswer",
+            survey=affected_survey,
+            question=question,
+            answer_type="single_option",
+            options=[option],
+        )
+        self.baker.make(
+            "survey.SurveyAnswer",
+            survey=unaffected_survey,
+            question=question,
+            answer_type="single_option",
+        )
+        out = StringIO()
+        call_command("rescore_surveys", option=[option.pk], dry_run=True, stdout=out)
+        self.assertIn("1 surveys would be rescored", out.getvalue())
+        self.assertIn("1 client scored surveys would be marked stale", out.getvalue())
+
+        option_statement.weightage = 0.5
+        option_statement.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            job = schedule_rescoring(option_ids=[option.pk], user=self.user)
+        job.refresh_from_db()
+        self.assertEqual(job.status, RescoringJob.StatusChoices.COMPLETED)
+        self.assertEqual(job.total_surveys, 1)
+        self.assertEqual(job.processed_surveys, 1)
+        self.assertEqual(job.stale_surveys, 1)
+        self.assertEqual(job.progress, 100)
+        self.assertEqual(affected_survey.results.get().score, 0.5)
+        self.assertFalse(affected_survey.results.get().is_stale)
+        self.assertFalse(unaffected_survey.results.exists())
+        client_result.refresh_from_db()
+        self.assertEqual(client_result.score, 0.3)
+        self.assertTrue(client_result.is_stale)
+
+    def test_project_score_summary(self):
+        survey = self.baker.make(
+            "survey.Survey", project=self.project, created_by=self.user
+        )
+        statement = self.baker.make("statement.Statement")
+        module = self.baker.make("context.Module")
+        url = self.reverse(
+            "survey-add-results", kwargs={"version": "v1", "pk": survey.pk}
+        )
+        data = [
+            {"statement": statement.pk, "score": score, "module": module.pk}
+            for score in [0.2, 0.4, 0.9]
+        ]
+        self.client.force_authenticate(self.user)
+        response = self.client.post(url, data=data, format="json")
+        self.assertEqual(response.status_code, self.status_code.HTTP_201_CREATED)
+        summary_url = self.reverse(
+            "project-score-summary-detail",
+            kwargs={"version": "v1", "pk": self.project.pk},
+        )
+        response = self.client.get(summary_url)
+        self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+        statement_score = response.json()["statements"][0]
+        self.assertEqual(statement_score["statement"], statement.pk)
+        self.assertEqual(statement_score["count"], 3)
+        self.assertAlmostEqual(statement_score["mean"], 0.5)
+        self.assertEqual(statement_score["maximum"], 0.9)
+        self.assertEqual(response.json()["modules"][0]["count"], 3)
+
+        survey_result = survey.results.get(score=0.9)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(
+                self.reverse(
+                    "survey-result-detail",
+                    kwargs={"version": "v1", "pk": survey_result.pk},
+                )
+            )
+        self.assertEqual(response.status_code, self.status_code.HTTP_204_NO_CONTENT)
+        statement_score = self.client.get(summary_url).json()["statements"][0]
+        self.assertEqual(statement_score["count"], 2)
+        self.assertEqual(statement_score["maximum"], 0.4)
+
+        # rollups are kept in sync for writes outside of API as well
+        with self.captureOnCommitCallbacks(execute=True):
+            other_project = self.baker.make(
+                "project.Project", users=[self.user], status="accepted"
+            )
+            survey.project = other_project
+            survey.save()
+        self.assertFalse(self.client.get(summary_url).json()["statements"])
+        other_summary_url = self.reverse(
+            "project-score-summary-detail",
+            kwargs={"version": "v1", "pk": other_project.pk},
+        )
+        response = self.client.get(other_summary_url)
+        self.assertEqual(response.json()["statements"][0]["count"], 2)
+        with self.captureOnCommitCallbacks(execute=True):
+            survey.delete()
+        response = self.client.get(other_summary_url)
+        self.assertFalse(response.json()["statements"])
+        self.assertFalse(response.json()["modules"])
+
+    def test_analytics_cube(self):
+        project = self.baker.make(
+            "project.Project",
+            organization=self.baker.make("organization.Organization"),
+            share_analytics_with_neat=True,
+        )
+        not_shared_project = self.baker.make(
+            "project.Project", share_analytics_with_neat=False
+        )
+        statement = self.baker.make("statement.Statement")
+        module = self.baker.make("context.Module", context=project.context)
+        for survey_project, score in [(project, 0.2), (not_shared_project, 1)]:
+            self.baker.make(
+                "summary.SurveyResult",
+                survey=self.baker.make("survey.Survey", project=survey_project),
+                statement=statement,
+                module=module,
+                score=score,
+            )
+        refresh = refresh_analytics_cube()
+        self.assertTrue(refresh.is_full)
+        self.baker.make(
+            "summary.SurveyResult",
+            survey=self.baker.make("survey.Survey", project=project),
+            statement=statement,
+            module=module,
+            score=0.6,
+        )
+        refresh = refresh_analytics_cube()
+        self.assertFalse(refresh.is_full)
+        self.assertEqual(refresh.refreshed_months, 1)
+
+        url = self.reverse(
+            "analytics-cube-list",
+            kwargs={"version": "v1"},
+            params={"dimensions": "statement,organization", "statement": statement.pk},
+        )
+        self.client.force_authenticate(self.user)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, self.status_code.HTTP_403_FORBIDDEN)
+        self.client.force_authenticate(
+            self.baker.make(settings.AUTH_USER_MODEL, is_staff=True)
+        )
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+        results = response.json()["results"]
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["organization"], project.organization.pk)
+        self.assertEqual(results[0]["count"], 2)
+        self.assertAlmostEqual(results[0]["mean"], 0.4)
+        self.assertNotIn("month", results[0])
+
+    @override_settings(ENABLE_CELERY=False)
+    def test_survey_result_export(self):
+        survey = self.baker.make("survey.Survey", project=self.project)
+        statement = self.baker.make("statement.Statement", code="=1+1")
+        survey_result = self.baker.make(
+            "summary.SurveyResult", survey=survey, statement=statement, score=0.5
+        )
+        url = self.reverse("survey-result-export", kwargs={"version": "v1"})
+        self.client.force_authenticate(self.user)
+        response = self.client.get(url, {"survey": survey.pk})
+        self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        rows = list(
+            csv.reader(StringIO(b"".join(response.streaming_content).decode("utf-8")))
+        )
+        self.assertEqual(rows[0][0], "id")
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[1][0], str(survey_result.pk))
+        self.assertEqual(rows[1][4], "'=1+1")
+        self.assertEqual(rows[1][7], "0.5")
+        for value in ["-3.5", "+2", "-1e-3", "-.5"]:
+            self.assertEqual(escape_csv_value(value), value)
+        for value in ["-1+2", "-", "+A1", "-2-cmd|' /C calc'!A0"]:
+            self.assertEqual(escape_csv_value(value), f"'{value}")
+
+        response = self.client.get(url, {"survey": "invalid"})
+        self.assertEqual(response.status_code, self.status_code.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertEqual(response.content.decode("utf-8").split(",")[0], "survey")
+        response = self.client.get(
+            url, {"survey": "invalid"}, HTTP_ACCEPT="application/json"
+        )
+        self.assertEqual(response.status_code, self.status_code.HTTP_400_BAD_REQUEST)
+        self.assertIn("survey", response.json())
+
+    def test_data_export(self):
+        survey = self.baker.make("survey.Survey", project=self.project)
+        self.baker.make("summary.SurveyResult", survey=survey, _quantity=3)
+        not_allowed_survey = self.baker.make("survey.Survey")
+        self.baker.make("summary.SurveyResult", survey=not_allowed_survey)
+        self.client.force_authenticate(self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                self.reverse("data-export-list", kwargs={"version": "v1"}),
+                data={"exportType": "survey_result", "format": "parquet"},
+            )
+        self.assertEqual(response.status_code, self.status_code.HTTP_201_CREATED)
+        response = self.client.get(
+            self.reverse(
+                "data-export-detail",
+                kwargs={"version": "v1", "pk": response.json()["id"]},
+            )
+        )
+        self.assertEqual(response.json()["status"], "completed")
+        data_export = DataExport.objects.get(pk=response.json()["id"])
+        with default_storage.open(data_export.file.name) as export_file:
+            table = pyarrow.parquet.read_table(export_file)
+        self.assertEqual(table.num_rows, data_export.row_count)
+        self.assertEqual(
+            set(table.column("project").to_pylist()),
+            set(
+                read_allowed_project_for_user(self.user)
+                .filter(surveys__results__isnull=False)
+                .values_list("pk", flat=True)
+            ),
+        )
+        default_storage.delete(data_export.file.name)
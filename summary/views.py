@@ -1,16 +1,36 @@
+from django.db import transaction
 from django.db.models import Q
-from rest_framework import mixins, viewsets
+from django.utils.translation import gettext_lazy as _
+from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import mixins, permissions, viewsets
+from rest_framework.response import Response
 
+from neatplus.views import CSVExportMixin
 from project.utils import read_allowed_project_for_user
 from survey.models import Survey
 from survey.permissions import CanWriteSurveyOrReadOnly
 
-from .filters import SurveyResultFilter
-from .models import SurveyResult
-from .serializers import SurveyResultSerializer
+from .analytics import ANALYTICS_CUBE_DIMENSIONS, query_analytics_cube
+from .filters import AnalyticsCubeFilter, DataExportFilter, SurveyResultFilter
+from .models import (
+    AnalyticsCube,
+    DataExport,
+    ProjectModuleScore,
+    ProjectStatementScore,
+    SurveyResult,
+)
+from .serializers import (
+    AnalyticsCubeSerializer,
+    DataExportSerializer,
+    ProjectScoreSummarySerializer,
+    SurveyResultSerializer,
+)
 
 
 class SurveyResultViewSet(
+    CSVExportMixin,
     mixins.RetrieveModelMixin,
     mixins.UpdateModelMixin,
     mixins.DestroyModelMixin,
@@ -20,6 +40,18 @@ class SurveyResultViewSet(
     serializer_class = SurveyResultSerializer
     permission_classes = [CanWriteSurveyOrReadOnly]
     filterset_class = SurveyResultFilter
+    csv_export_fields = [
+        "id",
+        "survey__project_id",
+        "survey_id",
+        "statement_id",
+        "statement__code",
+        "module_id",
+        "module__code",
+        "score",
+        "created_at",
+    ]
+    csv_export_filename = "survey_results.csv"
 
     def get_queryset(self):
         current_user = self.request.user
@@ -28,3 +60,78 @@ class SurveyResultViewSet(
             Q(project__in=projects) | Q(created_by=current_user)
         )
         return SurveyResult.objects.filter(survey__in=surveys)
+
+
+class ProjectScoreSummaryViewSet(viewsets.GenericViewSet):
+    serializer_class = ProjectScoreSummarySerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        return read_allowed_project_for_user(self.request.user)
+
+    def retrieve(self, request, *args, **kwargs):
+        project = self.get_object()
+        serializer = self.get_serializer(
+            {
+                "project": project.pk,
+                "statements": ProjectStatementScore.objects.filter(project=project),
+                "modules": ProjectModuleScore.objects.filter(project=project),
+            }
+        )
+        return Response(serializer.data)
+
+
+class AnalyticsCubeViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+    serializer_class = AnalyticsCubeSerializer
+    permission_classes = [permissions.IsAdminUser]
+    filterset_class = AnalyticsCubeFilter
+    filter_backends = [DjangoFilterBackend]
+    queryset = AnalyticsCube.objects.all()
+
+    def get_dimensions(self):
+        dimensions = self.request.query_params.getlist("dimensions")
+        dimensions = [
+            dimension
+            for value in dimensions
+            for dimension in value.split(",")
+            if dimension in ANALYTICS_CUBE_DIMENSIONS
+        ]
+        return list(dict.fromkeys(dimensions)) or ["statement"]
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        return query_analytics_cube(queryset, self.get_dimensions())
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "dimensions",
+                OpenApiTypes.STR,
+                description=_(
+                    "Comma separated dimensions by which cube is sliced. Allowed "
+                    "dimensions are context, module, statement, organization and "
+                    "month. Defaults to statement."
+                ),
+            )
+        ]
+    )
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+
+class DataExportViewSet(
+    mixins.CreateModelMixin,
+    mixins.RetrieveModelMixin,
+    mixins.ListModelMixin,
+    viewsets.GenericViewSet,
+):
+    serializer_class = DataExportSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    filterset_class = DataExportFilter
+
+    def get_queryset(self):
+        return DataExport.objects.filter(created_by=self.request.user)
+
+    def perform_create(self, serializer):
+        data_export = serializer.save(created_by=self.request.user)
+        transaction.on_commit(data_export.start)
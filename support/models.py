@@ -6,7 +6,7 @@ from django.template import Context, Template
 from django.utils.translation import gettext_lazy as _
 from ordered_model.models import OrderedModel
 
-from neatplus.models import TimeStampedModel, UserStampedModel
+from neatplus.models import DirtyFieldsMixin, TimeStampedModel, UserStampedModel
 
 
 class LegalDocumentTypeChoice(models.TextChoices):
@@ -15,7 +15,7 @@ class LegalDocumentTypeChoice(models.TextChoices):
     COOKIE_POLICY = "cookie-policy"
 
 
-class LegalDocument(UserStampedModel, TimeStampedModel):
+class LegalDocument(DirtyFieldsMixin, UserStampedModel, TimeStampedModel):
 
     document_type = models.CharField(
         _("document type"),
@@ -28,26 +28,6 @@ class LegalDocument(UserStampedModel, TimeStampedModel):
     def __str__(self):
         return self.document_type
 
-    def save(self, *args, **kwargs):
-        if self.pk:
-            cls = self.__class__
-            old = cls.objects.get(pk=self.pk)
-            changed_fields = []
-            for field in cls._meta.get_fields():
-                field_name = field.name
-                try:
-                    old_val = getattr(old, field_name)
-                    new_val = getattr(self, field_name)
-                    if hasattr(field, "is_custom_lower_field"):
-                        if field.is_custom_lower_field():
-                            new_val = new_val.lower()
-                    if old_val != new_val:
-                        changed_fields.append(field_name)
-                except Exception:
-                    pass
-            kwargs["update_fields"] = changed_fields
-        super().save(*args, **kwargs)
-
 
 class FrequentlyAskedQuestion(UserStampedModel, TimeStampedModel, OrderedModel):
     question = models.TextField(_("question"))
@@ -9,6 +9,7 @@ class APITest(FullTestCase):
         frequently_asked_question = cls.baker.make("support.FrequentlyAskedQuestion")
         resource_tag = cls.baker.make("support.ResourceTag")
         resource = cls.baker.make("support.Resource")
+        cls.resource = resource
         action = cls.baker.make("support.Action")
         cls.legal_document_list_url = cls.reverse(
             "legal-document-list", kwargs={"version": "v1"}
@@ -74,6 +75,17 @@ class APITest(FullTestCase):
         response = self.client.get(self.resource_detail_url)
         self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
 
+    def test_resource_list_conditional_get(self):
+        response = self.client.get(self.resource_list_url)
+        self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+        etag = response["ETag"]
+        response = self.client.get(self.resource_list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, self.status_code.HTTP_304_NOT_MODIFIED)
+        self.resource.tags.add(self.baker.make("support.ResourceTag"))
+        response = self.client.get(self.resource_list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
     def test_action_list(self):
         response = self.client.get(self.action_list_url)
         self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
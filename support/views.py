@@ -1,5 +1,8 @@
 from rest_framework import viewsets
 
+from context.models import Context
+from neatplus.views import ConditionalGetMixin
+
 from .filters import LegalDocumentFilter, ResourceFilter
 from .models import (
     Action,
@@ -17,28 +20,32 @@ from .serializers import (
 )
 
 
-class LegalDocumentViewSet(viewsets.ReadOnlyModelViewSet):
+class LegalDocumentViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = LegalDocument.objects.all()
     serializer_class = LegalDocumentSerializer
     filterset_class = LegalDocumentFilter
 
 
-class FrequentlyAskedQuestionViewSet(viewsets.ReadOnlyModelViewSet):
+class FrequentlyAskedQuestionViewSet(
+    ConditionalGetMixin, viewsets.ReadOnlyModelViewSet
+):
     queryset = FrequentlyAskedQuestion.objects.all()
     serializer_class = FrequentlyAskedQuestionSerializer
 
 
-class ResourceTagViewSet(viewsets.ReadOnlyModelViewSet):
+class ResourceTagViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = ResourceTag.objects.all()
     serializer_class = ResourceTagSerializer
 
 
-class ResourceViewSet(viewsets.ReadOnlyModelViewSet):
+class ResourceViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Resource.objects.all()
     serializer_class = ResourceSerializer
     filterset_class = ResourceFilter
+    conditional_get_dependencies = [Resource.tags.through.objects.all()]
 
 
-class ActionViewSet(viewsets.ReadOnlyModelViewSet):
+class ActionViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Action.objects.all()
     serializer_class = ActionSerializer
+    conditional_get_dependencies = [Context.objects.all()]
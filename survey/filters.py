@@ -1,6 +1,6 @@
 from django_filters.rest_framework import FilterSet
 
-from .models import Option, Question, Survey, SurveyAnswer
+from .models import Option, Question, Survey, SurveyAnswer, SurveySubmissionJob
 
 
 class QuestionFilter(FilterSet):
@@ -37,4 +37,18 @@ class SurveyAnswerFilter(FilterSet):
             "survey__project": ["exact"],
             "question": ["exact"],
             "answer_type": ["exact"],
+            "answer_number": ["exact", "gte", "lte"],
+            "answer_date": ["exact", "gte", "lte"],
+            "answer_boolean": ["exact"],
+        }
+
+
+class SurveySubmissionJobFilter(FilterSet):
+    class Meta:
+        model = SurveySubmissionJob
+        fields = {
+            "project": ["exact"],
+            "survey": ["exact"],
+            "submission_type": ["exact"],
+            "status": ["exact"],
         }
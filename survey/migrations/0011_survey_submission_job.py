@@ -0,0 +1,39 @@
+# Generated by Django 3.2.25 on 2026-10-18 17:13
+
+from django.conf import settings
+import django.core.serializers.json
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('project', '0004_add_verbose_name'),
+        ('survey', '0010_add_verbose_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SurveySubmissionJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+                ('modified_at', models.DateTimeField(auto_now=True, verbose_name='modified at')),
+                ('submission_type', models.CharField(choices=[('create_survey', 'Create Survey'), ('add_answers', 'Add Answers'), ('add_results', 'Add Results')], max_length=13, verbose_name='submission type')),
+                ('payload', models.JSONField(verbose_name='payload')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', max_length=10, verbose_name='status')),
+                ('total_items', models.PositiveIntegerField(default=0, verbose_name='total items')),
+                ('processed_items', models.PositiveIntegerField(default=0, verbose_name='processed items')),
+                ('errors', models.JSONField(blank=True, default=None, encoder=django.core.serializers.json.DjangoJSONEncoder, null=True, verbose_name='errors')),
+                ('created_by', models.ForeignKey(blank=True, default=None, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='created by')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='submission_jobs', to='project.project', verbose_name='project')),
+                ('survey', models.ForeignKey(blank=True, default=None, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='submission_jobs', to='survey.survey', verbose_name='survey')),
+                ('updated_by', models.ForeignKey(blank=True, default=None, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='updated by')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 3.2.25 on 2026-10-18 17:16
+
+import django.contrib.gis.db.models.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('survey', '0011_survey_submission_job'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='surveyanswer',
+            name='answer_boolean',
+            field=models.BooleanField(blank=True, default=None, editable=False, null=True, verbose_name='boolean answer'),
+        ),
+        migrations.AddField(
+            model_name='surveyanswer',
+            name='answer_date',
+            field=models.DateField(blank=True, default=None, editable=False, null=True, verbose_name='date answer'),
+        ),
+        migrations.AddField(
+            model_name='surveyanswer',
+            name='answer_images',
+            field=models.JSONField(blank=True, default=None, editable=False, null=True, verbose_name='image answer'),
+        ),
+        migrations.AddField(
+            model_name='surveyanswer',
+            name='answer_location',
+            field=django.contrib.gis.db.models.fields.GeometryField(blank=True, default=None, editable=False, null=True, srid=4326, verbose_name='location answer'),
+        ),
+        migrations.AddField(
+            model_name='surveyanswer',
+            name='answer_number',
+            field=models.FloatField(blank=True, default=None, editable=False, null=True, verbose_name='number answer'),
+        ),
+        migrations.AddIndex(
+            model_name='surveyanswer',
+            index=models.Index(fields=['question', 'answer_number'], name='survey_answer_number_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='surveyanswer',
+            index=models.Index(fields=['question', 'answer_date'], name='survey_answer_date_idx'),
+        ),
+    ]
@@ -0,0 +1,68 @@
+from django.contrib.gis.gdal import GDALException
+from django.contrib.gis.geos import GEOSException, GEOSGeometry
+from django.db import migrations
+from django.utils.dateparse import parse_date
+
+BATCH_SIZE = 1000
+TRUE_ANSWER_VALUES = ["t", "y", "yes", "true", "on", "1"]
+FALSE_ANSWER_VALUES = ["f", "n", "no", "false", "off", "0"]
+TYPED_FIELDS = [
+    "answer_number",
+    "answer_date",
+    "answer_boolean",
+    "answer_location",
+    "answer_images",
+]
+
+
+def populate_typed_answer(survey_answer):
+    answer = str(survey_answer.answer)
+    answer_type = survey_answer.answer_type
+    try:
+        if answer_type == "number":
+            survey_answer.answer_number = float(answer)
+        elif answer_type == "date":
+            survey_answer.answer_date = parse_date(answer)
+        elif answer_type == "boolean":
+            if answer.lower() in TRUE_ANSWER_VALUES:
+                survey_answer.answer_boolean = True
+            elif answer.lower() in FALSE_ANSWER_VALUES:
+                survey_answer.answer_boolean = False
+        elif answer_type == "location":
+            survey_answer.answer_location = GEOSGeometry(answer, srid=4326)
+        elif answer_type in ["single_image", "multiple_image"]:
+            survey_answer.answer_images = answer.split(",")
+    except (ValueError, GEOSException, GDALException):
+        pass
+
+
+def forward_migration(apps, schema_editor):
+    SurveyAnswer = apps.get_model('survey', 'SurveyAnswer')
+    survey_answers = SurveyAnswer.objects.exclude(answer__isnull=True).exclude(
+        answer_type__in=["text", "single_option", "multiple_option"]
+    )
+    batch = []
+    for survey_answer in survey_answers.iterator(chunk_size=BATCH_SIZE):
+        populate_typed_answer(survey_answer)
+        batch.append(survey_answer)
+        if len(batch) >= BATCH_SIZE:
+            SurveyAnswer.objects.bulk_update(batch, TYPED_FIELDS)
+            batch = []
+    if batch:
+        SurveyAnswer.objects.bulk_update(batch, TYPED_FIELDS)
+
+
+def backward_migration(apps, schema_editor):
+    SurveyAnswer = apps.get_model('survey', 'SurveyAnswer')
+    SurveyAnswer.objects.update(**{field: None for field in TYPED_FIELDS})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('survey', '0012_survey_answer_typed_columns'),
+    ]
+
+    operations = [
+        migrations.RunPython(forward_migration, backward_migration)
+    ]
@@ -1,10 +1,18 @@
 from ckeditor_uploader.fields import RichTextUploadingField
+from django.conf import settings
+from django.contrib.gis.db import models as gis_models
+from django.contrib.gis.gdal import GDALException
+from django.contrib.gis.geos import GEOSException, GEOSGeometry
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.utils.dateparse import parse_date
 from django.utils.translation import gettext_lazy as _
 from ordered_model.models import OrderedModel
 
 from neatplus.models import CodeModel, TimeStampedModel, UserStampedModel
 
+from .tasks import process_survey_submission_job
+
 
 class QuestionGroup(CodeModel, UserStampedModel, TimeStampedModel, OrderedModel):
     title = models.CharField(_("title"), max_length=255)
@@ -17,6 +25,17 @@ class QuestionGroup(CodeModel, UserStampedModel, TimeStampedModel, OrderedModel)
         pass
 
 
+TRUE_ANSWER_VALUES = ["t", "y", "yes", "true", "on", "1"]
+FALSE_ANSWER_VALUES = ["f", "n", "no", "false", "off", "0"]
+TYPED_ANSWER_FIELDS = (
+    "answer_number",
+    "answer_date",
+    "answer_boolean",
+    "answer_location",
+    "answer_images",
+)
+
+
 class AnswerTypeChoices(models.TextChoices):
     BOOLEAN = "boolean"
     DATE = "date"
@@ -127,3 +146,127 @@ class SurveyAnswer(UserStampedModel, TimeStampedModel):
         _("answer type"), max_length=15, choices=AnswerTypeChoices.choices
     )
     options = models.ManyToManyField("Option", blank=True, verbose_name=_("options"))
+    answer_number = models.FloatField(
+        _("number answer"), null=True, blank=True, default=None, editable=False
+    )
+    answer_date = models.DateField(
+        _("date answer"), null=True, blank=True, default=None, editable=False
+    )
+    answer_boolean = models.BooleanField(
+        _("boolean answer"), null=True, blank=True, default=None, editable=False
+    )
+    answer_location = gis_models.GeometryField(
+        _("location answer"),
+        srid=4326,
+        null=True,
+        blank=True,
+        default=None,
+        editable=False,
+    )
+    answer_images = models.JSONField(
+        _("image answer"), null=True, blank=True, default=None, editable=False
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["question", "answer_number"],
+                name="survey_answer_number_idx",
+            ),
+            models.Index(
+                fields=["question", "answer_date"], name="survey_answer_date_idx"
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.populate_typed_answer()
+        super().save(*args, **kwargs)
+
+    def populate_typed_answer(self):
+        """
+        Store answer in typed column of its answer type so that answer doesn't need
+        to be parsed on every read and can be aggregated by database
+        """
+        self.answer_number = None
+        self.answer_date = None
+        self.answer_boolean = None
+        self.answer_location = None
+        self.answer_images = None
+        if self.answer is None:
+            return
+        answer = str(self.answer)
+        try:
+            if self.answer_type == AnswerTypeChoices.NUMBER:
+                self.answer_number = float(answer)
+            elif self.answer_type == AnswerTypeChoices.DATE:
+                self.answer_date = parse_date(answer)
+            elif self.answer_type == AnswerTypeChoices.BOOLEAN:
+                if answer.lower() in TRUE_ANSWER_VALUES:
+                    self.answer_boolean = True
+                elif answer.lower() in FALSE_ANSWER_VALUES:
+                    self.answer_boolean = False
+            elif self.answer_type == AnswerTypeChoices.LOCATION:
+                self.answer_location = GEOSGeometry(answer, srid=4326)
+            elif self.answer_type in [
+                AnswerTypeChoices.SINGLE_IMAGE,
+                AnswerTypeChoices.MULTIPLE_IMAGE,
+            ]:
+                self.answer_images = answer.split(",")
+        except (ValueError, GEOSException, GDALException):
+            pass
+
+
+class SurveySubmissionJob(UserStampedModel, TimeStampedModel):
+    class SubmissionTypeChoices(models.TextChoices):
+        CREATE_SURVEY = "create_survey"
+        ADD_ANSWERS = "add_answers"
+        ADD_RESULTS = "add_results"
+
+    class StatusChoices(models.TextChoices):
+        PENDING = "pending"
+        PROCESSING = "processing"
+        COMPLETED = "completed"
+        FAILED = "failed"
+
+    submission_type = models.CharField(
+        _("submission type"), max_length=13, choices=SubmissionTypeChoices.choices
+    )
+    project = models.ForeignKey(
+        "project.Project",
+        on_delete=models.CASCADE,
+        related_name="submission_jobs",
+        verbose_name=_("project"),
+    )
+    survey = models.ForeignKey(
+        "Survey",
+        on_delete=models.CASCADE,
+        related_name="submission_jobs",
+        null=True,
+        blank=True,
+        default=None,
+        verbose_name=_("survey"),
+    )
+    payload = models.JSONField(_("payload"))
+    status = models.CharField(
+        _("status"),
+        max_length=10,
+        choices=StatusChoices.choices,
+        default=StatusChoices.PENDING,
+    )
+    total_items = models.PositiveIntegerField(_("total items"), default=0)
+    processed_items = models.PositiveIntegerField(_("processed items"), default=0)
+    errors = models.JSONField(
+        _("errors"), null=True, blank=True, default=None, encoder=DjangoJSONEncoder
+    )
+
+    def __str__(self):
+        return f"{self.submission_type}-{self.pk}"
+
+    def start(self, context=None):
+        if settings.ENABLE_CELERY:
+            process_survey_submission_job.delay(self.pk)
+        else:
+            from .submission import process_submission_job
+
+            # request context is available only when job is processed in request
+            process_submission_job(self, context)
@@ -1,47 +1,23 @@
 from rest_framework import permissions
 
-from project.models import ProjectUser
+from project.access import WRITE_ACCESS_LEVELS, get_project_access_resolver
+
+
+def get_project_id(obj):
+    # answers and results belong to project of their survey
+    survey = getattr(obj, "survey", obj)
+    return survey.project_id
 
 
 class CanWriteSurvey(permissions.IsAuthenticated):
     def has_object_permission(self, request, view, obj):
-        project = obj.project
-        user = request.user
-        if project.organization:
-            return (
-                user == obj.created_by
-                or user in project.organization.admins.all()
-                or ProjectUser.objects.filter(
-                    project=project, user=user, permission="write"
-                ).exists()
-            )
-        else:
-            return (
-                user == obj.created_by
-                or ProjectUser.objects.filter(
-                    project=project, user=user, permission="write"
-                ).exists()
-            )
+        return request.user == obj.created_by or get_project_access_resolver(
+            request
+        ).has_level(get_project_id(obj), WRITE_ACCESS_LEVELS)
 
 
-class CanWriteSurveyOrReadOnly(permissions.IsAuthenticated):
+class CanWriteSurveyOrReadOnly(CanWriteSurvey):
     def has_object_permission(self, request, view, obj):
         if request.method in permissions.SAFE_METHODS:
             return True
-        project = obj.project
-        user = request.user
-        if project.organization:
-            return (
-                user == obj.created_by
-                or user in project.organization.admins.all()
-                or ProjectUser.objects.filter(
-                    project=project, user=user, permission="write"
-                ).exists()
-            )
-        else:
-            return (
-                user == obj.created_by
-                or ProjectUser.objects.filter(
-                    project=project, user=user, permission="write"
-                ).exists()
-            )
+        return super().has_object_permission(request, view, obj)
@@ -1,20 +1,23 @@
 from django.contrib.gis.geos import GEOSGeometry
-from django.core.files.storage import default_storage
+from django.db import models
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 from rest_framework.fields import ImageField
 from rest_framework_gis.fields import GeometryField
 
 from neatplus.serializers import RichTextUploadingModelSerializer
+from neatplus.utils import get_invalid_image_paths, get_storage_urls
 from summary.serializers import SurveyResultSerializer, WritableSurveyResultSerializer
 
 from .models import (
+    TYPED_ANSWER_FIELDS,
     AnswerTypeChoices,
     Option,
     Question,
     QuestionGroup,
     Survey,
     SurveyAnswer,
+    SurveySubmissionJob,
 )
 
 
@@ -46,7 +49,96 @@ class ImageListField(serializers.ListField):
     child = serializers.ImageField()
 
 
+ANSWER_LOOKUP_CONTEXT_KEY = "survey_answer_lookup"
+IMAGE_URL_CONTEXT_KEY = "survey_answer_image_urls"
+
+
+def get_image_paths(survey_answer):
+    if survey_answer.answer_type not in [
+        AnswerTypeChoices.SINGLE_IMAGE,
+        AnswerTypeChoices.MULTIPLE_IMAGE,
+    ]:
+        return []
+    if survey_answer.answer_images is not None:
+        return survey_answer.answer_images
+    return survey_answer.answer.split(",") if survey_answer.answer else []
+
+
+def get_lookup_pks(values):
+    pks = set()
+    for value in values:
+        try:
+            pks.add(int(value))
+        except (TypeError, ValueError):
+            pass
+    return pks
+
+
+class AnswerLookupRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    Primary key related field which resolves object from lookup loaded by
+    SurveyAnswerListSerializer for whole payload before querying database.
+    """
+
+    def __init__(self, lookup_name=None, **kwargs):
+        self.lookup_name = lookup_name
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        lookup = self.context.get(ANSWER_LOOKUP_CONTEXT_KEY, {}).get(self.lookup_name)
+        if lookup and not isinstance(data, bool):
+            pks = get_lookup_pks([data])
+            if pks and pks.issubset(lookup):
+                return lookup[pks.pop()]
+        return super().to_internal_value(data)
+
+
+class SurveyAnswerListSerializer(serializers.ListSerializer):
+    """
+    List serializer for survey answers which loads all questions and options
+    referenced by payload with two queries so that validation of each answer
+    doesn't query database for its question and options.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            items = [item for item in data if isinstance(item, dict)]
+            question_pks = get_lookup_pks(item.get("question") for item in items)
+            option_pks = get_lookup_pks(
+                option
+                for item in items
+                if isinstance(item.get("options"), list)
+                for option in item["options"]
+            )
+            self.context[ANSWER_LOOKUP_CONTEXT_KEY] = {
+                "question": Question.objects.in_bulk(question_pks),
+                "options": Option.objects.in_bulk(option_pks),
+            }
+        return super().to_internal_value(data)
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.Manager) else data
+        survey_answers = list(iterable)
+        image_paths = [
+            image_path
+            for survey_answer in survey_answers
+            for image_path in get_image_paths(survey_answer)
+        ]
+        image_urls = self.context.setdefault(IMAGE_URL_CONTEXT_KEY, {})
+        image_urls.update(get_storage_urls(set(image_paths) - set(image_urls)))
+        return super().to_representation(survey_answers)
+
+
 class SurveyAnswerSerializer(serializers.ModelSerializer):
+    question = AnswerLookupRelatedField(
+        lookup_name="question", queryset=Question.objects.all()
+    )
+    options = AnswerLookupRelatedField(
+        lookup_name="options",
+        queryset=Option.objects.all(),
+        many=True,
+        required=False,
+    )
     formatted_answer = serializers.SerializerMethodField()
 
     answer_type_serializer_mapping = {
@@ -64,7 +156,8 @@ class SurveyAnswerSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = SurveyAnswer
-        fields = "__all__"
+        exclude = TYPED_ANSWER_FIELDS
+        list_serializer_class = SurveyAnswerListSerializer
 
     def validate(self, attrs):
         data = super().validate(attrs)
@@ -93,7 +186,7 @@ class SurveyAnswerSerializer(serializers.ModelSerializer):
                     {"options": _("options should be present for provided answer_type")}
                 )
             for option in options:
-                if option.question != question_obj:
+                if option.question_id != question_obj.pk:
                     raise serializers.ValidationError(
                         {"options": _("Invalid option for question")}
                     )
@@ -118,17 +211,10 @@ class SurveyAnswerSerializer(serializers.ModelSerializer):
                 raise serializers.ValidationError(
                     {"answer": _("Only one image is supported for question")}
                 )
-            if serializer_class == ImageField:
-                serializer_class_object = serializer_class()
-            elif serializer_class == ImageListField:
-                serializer_class_object = serializer_class.child
-            errors = {}
-            for i, image_path in enumerate(image_paths):
-                try:
-                    with default_storage.open(image_path) as file:
-                        serializer_class_object.run_validation(file)
-                except Exception:
-                    errors[image_path] = "Invalid image file or image doesn't exists"
+            errors = {
+                image_path: "Invalid image file or image doesn't exists"
+                for image_path in get_invalid_image_paths(image_paths)
+            }
             if errors:
                 raise serializers.ValidationError({"answer": errors})
             validation_data = None
@@ -143,21 +229,32 @@ class SurveyAnswerSerializer(serializers.ModelSerializer):
         if serializer_class is None:
             representation_val = None
         elif serializer_class == GeometryField:
-            representation_val = GEOSGeometry(instance.answer, srid=4326)
-        elif serializer_class == ImageField:
-            return self.context["request"].build_absolute_uri(
-                default_storage.url(instance.answer)
-            )
-        elif serializer_class == ImageListField:
-            image_paths = instance.answer.split(",")
-            urls = []
-            for image_path in image_paths:
-                urls.append(
-                    self.context["request"].build_absolute_uri(
-                        default_storage.url(image_path)
-                    )
-                )
+            representation_val = instance.answer_location
+            if representation_val is None:
+                representation_val = GEOSGeometry(instance.answer, srid=4326)
+        elif serializer_class in [ImageField, ImageListField]:
+            image_paths = get_image_paths(instance)
+            image_urls = self.context.get(IMAGE_URL_CONTEXT_KEY, {})
+            missing_paths = set(image_paths) - set(image_urls)
+            if missing_paths:
+                image_urls = {**image_urls, **get_storage_urls(missing_paths)}
+            urls = [
+                self.context["request"].build_absolute_uri(image_urls[image_path])
+                for image_path in image_paths
+            ]
+            if serializer_class == ImageField:
+                return urls[0] if urls else None
             return urls
+        elif serializer_class == serializers.FloatField:
+            representation_val = instance.answer_number
+            if representation_val is None:
+                representation_val = instance.answer
+        elif serializer_class == serializers.DateField:
+            representation_val = instance.answer_date or instance.answer
+        elif serializer_class == serializers.BooleanField:
+            representation_val = instance.answer_boolean
+            if representation_val is None:
+                representation_val = instance.answer
         else:
             representation_val = instance.answer
         if representation_val is not None:
@@ -169,7 +266,8 @@ class SurveyAnswerSerializer(serializers.ModelSerializer):
 class WritableSurveyAnswerSerializer(SurveyAnswerSerializer):
     class Meta:
         model = SurveyAnswer
-        exclude = ("survey",)
+        exclude = ("survey", *TYPED_ANSWER_FIELDS)
+        list_serializer_class = SurveyAnswerListSerializer
 
 
 class WritableSurveySerializer(SurveySerializer):
@@ -184,3 +282,9 @@ class WritableSurveySerializer(SurveySerializer):
 class SharedSurveySerializer(SurveySerializer):
     answers = SurveyAnswerSerializer(many=True)
     results = SurveyResultSerializer(many=True)
+
+
+class SurveySubmissionJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = SurveySubmissionJob
+        exclude = ("payload",)
@@ -0,0 +1,256 @@
+import logging
+
+from django.db import IntegrityError, transaction
+from django.utils.translation import gettext_lazy as _
+
+from context.models import Module
+from statement.models import Statement
+from summary.serializers import WritableSurveyResultSerializer
+
+from .models import Option, Question, Survey, SurveySubmissionJob
+from .serializers import WritableSurveyAnswerSerializer, WritableSurveySerializer
+from .utils import bulk_create_survey_answers, bulk_create_survey_results
+
+SUBMISSION_JOB_CHUNK_SIZE = 100
+
+logger = logging.getLogger(__name__)
+
+
+class SurveySubmissionError(Exception):
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__(errors)
+
+
+class SurveySubmission:
+    """
+    Submission pipeline for survey along with its answers and results.
+
+    Payload is validated only once. Survey, answers, options of answers and results
+    are then inserted in bulk inside single transaction. Errors are reported per item
+    in same format as serializer errors so client knows which answer or result failed.
+    """
+
+    def __init__(self, project, user, data, context=None):
+        self.project = project
+        self.user = user
+        self.serializer = WritableSurveySerializer(data=data, context=context or {})
+        self.errors = {}
+
+    def is_valid(self):
+        if not self.serializer.is_valid():
+            self.errors = self.serializer.errors
+        return not self.errors
+
+    def save(self):
+        validated_data = dict(self.serializer.validated_data)
+        answers = validated_data.pop("answers", [])
+        results = validated_data.pop("results", [])
+        try:
+            return save_submission(
+                self.user,
+                answers,
+                results,
+                project=self.project,
+                survey_data=validated_data,
+            )
+        except SurveySubmissionError as err:
+            self.errors = err.errors
+            raise
+
+
+def save_submission(
+    user, answers, results, survey=None, project=None, survey_data=None
+):
+    """
+    Create survey for project if survey is not provided and bulk insert answers and
+    results for survey inside single transaction.
+    """
+    try:
+        with transaction.atomic():
+            if survey is None:
+                survey = Survey.objects.create(
+                    **survey_data, created_by=user, project=project
+                )
+            bulk_create_survey_answers(survey, answers, user)
+            bulk_create_survey_results(survey, results, user)
+    except IntegrityError:
+        raise SurveySubmissionError(get_integrity_errors(answers, results))
+    return survey
+
+
+def get_integrity_errors(answers, results):
+    """
+    Find out answers and results which references object deleted after payload
+    was validated. Existence of all referenced objects is checked with one query
+    per model instead of inserting items one by one.
+    """
+    question_ids = set(
+        Question.objects.filter(
+            pk__in=[answer["question"].pk for answer in answers]
+        ).values_list("pk", flat=True)
+    )
+    option_ids = set(
+        Option.objects.filter(
+            pk__in=[
+                option.pk
+                for answer in answers
+                for option in answer.get("options") or []
+            ]
+        ).values_list("pk", flat=True)
+    )
+    statement_ids = set(
+        Statement.objects.filter(
+            pk__in=[result["statement"].pk for result in results]
+        ).values_list("pk", flat=True)
+    )
+    module_ids = set(
+        Module.objects.filter(
+            pk__in=[result["module"].pk for result in results]
+        ).values_list("pk", flat=True)
+    )
+    answer_errors = []
+    for answer in answers:
+        answer_error = {}
+        if answer["question"].pk not in question_ids:
+            answer_error["question"] = [_("Question doesn't exist")]
+        if any(option.pk not in option_ids for option in answer.get("options") or []):
+            answer_error["options"] = [_("Option doesn't exist")]
+        answer_errors.append(answer_error)
+    result_errors = []
+    for result in results:
+        result_error = {}
+        if result["statement"].pk not in statement_ids:
+            result_error["statement"] = [_("Statement doesn't exist")]
+        if result["module"].pk not in module_ids:
+            result_error["module"] = [_("Module doesn't exist")]
+        result_errors.append(result_error)
+    errors = {}
+    if any(answer_errors):
+        errors["answers"] = answer_errors
+    if any(result_errors):
+        errors["results"] = result_errors
+    if not errors:
+        errors["non_field_errors"] = [
+            _("Failed to create survey or survey answer due to invalid data")
+        ]
+    return errors
+
+
+def get_submission_job_context():
+    """
+    Serializer context for job processed outside of request. It has same keys as
+    context of view so that serializers behave same as synchronous submission.
+    """
+    return {"request": None, "format": None, "view": None}
+
+
+def validate_in_chunks(serializer_class, items, job, context):
+    """
+    Validate list of items in chunks and update processed items count of job after
+    every chunk. Returns validated items and list of errors for each item.
+    """
+    validated_items = []
+    errors = []
+    for start in range(0, len(items), SUBMISSION_JOB_CHUNK_SIZE):
+        chunk = items[start : start + SUBMISSION_JOB_CHUNK_SIZE]
+        serializer = serializer_class(data=chunk, many=True, context=context)
+        if serializer.is_valid():
+            validated_items.extend(serializer.validated_data)
+            errors.extend({} for _item in chunk)
+        else:
+            errors.extend(serializer.errors)
+        job.processed_items += len(chunk)
+        job.save(update_fields=["processed_items", "modified_at"])
+    return validated_items, errors
+
+
+def process_submission_job(job, context=None):
+    """
+    Process persisted survey submission job. Job is marked as failed along with
+    per item errors if any answer or result is invalid otherwise all answers and
+    results are saved in bulk and job is marked as completed. Unexpected error also
+    marks job as failed so that it isn't left in processing state.
+    """
+    if context is None:
+        context = get_submission_job_context()
+    try:
+        run_submission_job(job, context)
+    except Exception as err:
+        logger.exception("Failed to process survey submission job %s", job.pk)
+        job.status = SurveySubmissionJob.StatusChoices.FAILED
+        job.errors = {"non_field_errors": [str(err)]}
+        job.save(update_fields=["status", "errors", "modified_at"])
+
+
+def run_submission_job(job, context):
+    job.status = SurveySubmissionJob.StatusChoices.PROCESSING
+    job.processed_items = 0
+    job.errors = None
+    errors = {}
+    survey_data = None
+    payload = job.payload
+    if job.submission_type == SurveySubmissionJob.SubmissionTypeChoices.CREATE_SURVEY:
+        survey_payload = dict(payload) if isinstance(payload, dict) else {}
+        answers = survey_payload.pop("answers", [])
+        results = survey_payload.pop("results", [])
+        serializer = WritableSurveySerializer(
+            data={**survey_payload, "answers": [], "results": []}, context=context
+        )
+        if serializer.is_valid():
+            survey_data = dict(serializer.validated_data)
+            survey_data.pop("answers")
+            survey_data.pop("results")
+        else:
+            errors.update(serializer.errors)
+    elif job.submission_type == SurveySubmissionJob.SubmissionTypeChoices.ADD_ANSWERS:
+        answers = payload if isinstance(payload, list) else [payload]
+        results = []
+    else:
+        answers = []
+        results = payload if isinstance(payload, list) else [payload]
+    for key, items in [("answers", answers), ("results", results)]:
+        if not isinstance(items, list):
+            errors[key] = [_("Expected a list of items")]
+    if errors:
+        answers, results = [], []
+    job.total_items = len(answers) + len(results)
+    job.save(
+        update_fields=[
+            "status",
+            "total_items",
+            "processed_items",
+            "errors",
+            "modified_at",
+        ]
+    )
+
+    validated_answers, answer_errors = validate_in_chunks(
+        WritableSurveyAnswerSerializer, answers, job, context
+    )
+    validated_results, result_errors = validate_in_chunks(
+        WritableSurveyResultSerializer, results, job, context
+    )
+    if any(answer_errors):
+        errors["answers"] = answer_errors
+    if any(result_errors):
+        errors["results"] = result_errors
+
+    if not errors:
+        try:
+            job.survey = save_submission(
+                job.created_by,
+                validated_answers,
+                validated_results,
+                survey=job.survey,
+                project=job.project,
+                survey_data=survey_data,
+            )
+        except SurveySubmissionError as err:
+            errors = err.errors
+    if errors:
+        job.status = SurveySubmissionJob.StatusChoices.FAILED
+        job.errors = errors
+    else:
+        job.status = SurveySubmissionJob.StatusChoices.COMPLETED
+    job.save(update_fields=["status", "errors", "survey", "modified_at"])
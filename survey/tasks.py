@@ -0,0 +1,12 @@
+from celery import shared_task
+
+from neatplus.celery import no_simultaneous_execution
+
+
+@shared_task(bind=True)
+@no_simultaneous_execution
+def process_survey_submission_job(self, job_id):
+    from .models import SurveySubmissionJob
+    from .submission import process_submission_job
+
+    process_submission_job(SurveySubmissionJob.objects.get(pk=job_id))
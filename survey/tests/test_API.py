@@ -1,7 +1,25 @@
+import csv
+import io
+
 from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from model_bakery import random_gen
+from PIL import Image
 
 from neatplus.tests import FullTestCase
+from neatplus.utils import get_storage_url_cache_key
+from survey.models import Survey, SurveyAnswer, SurveySubmissionJob
+from survey.serializers import WritableSurveyAnswerSerializer
+from survey.submission import (
+    SurveySubmission,
+    SurveySubmissionError,
+    process_submission_job,
+)
+from survey.utils import bulk_create_survey_answers
 
 
 class APITest(FullTestCase):
@@ -180,6 +198,102 @@ class APITest(FullTestCase):
         response = self.client.get(url)
         self.assertEqual(response.status_code, self.status_code.HTTP_404_NOT_FOUND)
 
+    def test_get_identifier_survey_cache(self):
+        shared_link_identifier = random_gen.gen_string(10)
+        survey = self.baker.make(
+            "survey.Survey",
+            is_shared_publicly=True,
+            shared_link_identifier=shared_link_identifier,
+        )
+        url = self.reverse(
+            "survey-identifier",
+            kwargs={
+                "version": "v1",
+                "shared_link_identifier": shared_link_identifier,
+            },
+        )
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+        self.assertIn("public", response["Cache-Control"])
+        etag = response["ETag"]
+        self.assertTrue(etag.startswith('W/"'))
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, self.status_code.HTTP_304_NOT_MODIFIED)
+        # compressed response has same weak ETag which client sends back
+        response = self.client.get(
+            url, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, self.status_code.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        # version is read from database so no invalidation is needed after commit
+        self.baker.make(
+            "survey.SurveyAnswer",
+            survey=survey,
+            question=self.question,
+            answer_type="text",
+            answer="cached",
+        )
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(len(response.data["answers"]), 1)
+
+    def make_survey_with_answers(self, count, **kwargs):
+        survey = self.baker.make("survey.Survey", created_by=self.user, **kwargs)
+        options = self.baker.make("survey.Option", question=self.question, _quantity=2)
+        for _ in range(count):
+            self.baker.make(
+                "survey.SurveyAnswer",
+                survey=survey,
+                answer_type="single_option",
+                question=self.question,
+                options=options,
+            )
+            self.baker.make(
+                "summary.SurveyResult",
+                survey=survey,
+                module=self.question.module,
+                score=0.5,
+            )
+        return survey
+
+    def test_get_identifier_survey_query_count(self):
+        query_counts = []
+        for count in [1, 5]:
+            shared_link_identifier = random_gen.gen_string(10)
+            self.make_survey_with_answers(
+                count,
+                is_shared_publicly=True,
+                shared_link_identifier=shared_link_identifier,
+            )
+            url = self.reverse(
+                "survey-identifier",
+                kwargs={
+                    "version": "v1",
+                    "shared_link_identifier": shared_link_identifier,
+                },
+            )
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+            self.assertEqual(len(response.data["answers"]), count)
+            self.assertEqual(len(response.data["results"]), count)
+            query_counts.append(len(queries))
+        self.assertEqual(query_counts[0], query_counts[1])
+
+    def test_list_survey_answers_query_count(self):
+        self.client.force_authenticate(self.user)
+        query_counts = []
+        for count in [1, 5]:
+            survey = self.make_survey_with_answers(count)
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(
+                    self.survey_answer_list_url, {"survey": survey.pk}
+                )
+            self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+            query_counts.append(len(queries))
+        self.assertEqual(query_counts[0], query_counts[1])
+
     def test_add_survey_answers(self):
         url = self.reverse(
             "survey-add-answers", kwargs={"version": "v1", "pk": self.survey.pk}
@@ -258,3 +372,289 @@ class APITest(FullTestCase):
         )
         single_response = self.client.post(url, single_data)
         self.assertEqual(single_response.status_code, self.status_code.HTTP_201_CREATED)
+
+    def test_bulk_create_survey_answers_query_count(self):
+        question = self.baker.make("survey.Question", answer_type="multiple_option")
+        options = self.baker.make("survey.Option", question=question, _quantity=2)
+        answers = [
+            {"question": question, "answer_type": "multiple_option", "options": options}
+            for _ in range(20)
+        ]
+        with CaptureQueriesContext(connection) as loop_queries:
+            for answer in answers:
+                answer = dict(answer)
+                answer_options = answer.pop("options")
+                survey_answer = SurveyAnswer.objects.create(
+                    **answer, survey=self.survey, created_by=self.user
+                )
+                survey_answer.options.add(*answer_options)
+        with CaptureQueriesContext(connection) as bulk_queries:
+            survey_answers = bulk_create_survey_answers(self.survey, answers, self.user)
+        self.assertLess(len(bulk_queries), len(loop_queries))
+        self.assertEqual(len(survey_answers), len(answers))
+        for survey_answer in survey_answers:
+            self.assertEqual(survey_answer.options.count(), len(options))
+
+    def test_async_add_survey_answers(self):
+        url = self.reverse(
+            "survey-add-answers",
+            kwargs={"version": "v1", "pk": self.survey.pk},
+            params={"async": "true"},
+        )
+        question = self.baker.make("survey.Question", answer_type="number")
+        data = [{"question": question.pk, "answer": 2, "answerType": "number"}]
+        self.client.force_authenticate(self.user)
+        response = self.client.post(url, data=data, format="json")
+        self.assertEqual(response.status_code, self.status_code.HTTP_202_ACCEPTED)
+        job_url = self.reverse(
+            "survey-submission-job-detail",
+            kwargs={"version": "v1", "pk": response.json()["id"]},
+        )
+        job_response = self.client.get(job_url)
+        self.assertEqual(job_response.status_code, self.status_code.HTTP_200_OK)
+
+    def test_process_submission_job(self):
+        question = self.baker.make("survey.Question", answer_type="number")
+        job = self.baker.make(
+            "survey.SurveySubmissionJob",
+            submission_type="add_answers",
+            project=self.survey.project,
+            survey=self.survey,
+            payload=[
+                {"question": question.pk, "answer": 2, "answer_type": "number"},
+                {"question": question.pk, "answer": 2, "answer_type": "text"},
+            ],
+            created_by=self.user,
+        )
+        process_submission_job(job)
+        self.assertEqual(job.status, SurveySubmissionJob.StatusChoices.FAILED)
+        self.assertEqual(job.processed_items, 2)
+        self.assertFalse(job.errors["answers"][0])
+        self.assertTrue(job.errors["answers"][1])
+        job.payload = job.payload[:1]
+        process_submission_job(job)
+        self.assertEqual(job.status, SurveySubmissionJob.StatusChoices.COMPLETED)
+        self.assertTrue(
+            SurveyAnswer.objects.filter(survey=self.survey, question=question).exists()
+        )
+
+    def test_process_submission_job_unexpected_error(self):
+        question = self.baker.make("survey.Question", answer_type="number")
+        # answers job without survey fails while saving instead of validating
+        job = self.baker.make(
+            "survey.SurveySubmissionJob",
+            submission_type="add_answers",
+            project=self.survey.project,
+            survey=None,
+            payload=[{"question": question.pk, "answer": 2, "answer_type": "number"}],
+            created_by=self.user,
+        )
+        process_submission_job(job)
+        job.refresh_from_db()
+        self.assertEqual(job.status, SurveySubmissionJob.StatusChoices.FAILED)
+        self.assertTrue(job.errors["non_field_errors"])
+        self.assertFalse(SurveyAnswer.objects.filter(question=question).exists())
+
+    def test_survey_submission_integrity_error(self):
+        question = self.baker.make("survey.Question", answer_type="number")
+        submission = SurveySubmission(
+            self.survey.project,
+            self.user,
+            {
+                "title": random_gen.gen_string(255),
+                "answers": [
+                    {"question": question.pk, "answer": 2, "answer_type": "number"}
+                ],
+                "results": [],
+            },
+        )
+        self.assertTrue(submission.is_valid())
+        # question is deleted after payload is validated but before it is saved
+        question.delete()
+        with connection.cursor() as cursor:
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+        with self.assertRaises(SurveySubmissionError):
+            submission.save()
+        self.assertEqual(
+            submission.errors,
+            {"answers": [{"question": ["Question doesn't exist"]}]},
+        )
+        self.assertFalse(
+            Survey.objects.filter(
+                title=submission.serializer.validated_data["title"]
+            ).exists()
+        )
+
+    def test_survey_answer_validation_query_count(self):
+        question = self.baker.make("survey.Question", answer_type="multiple_option")
+        options = self.baker.make("survey.Option", question=question, _quantity=2)
+
+        def validation_queries(count):
+            data = [
+                {
+                    "question": question.pk,
+                    "answer_type": "multiple_option",
+                    "options": [option.pk for option in options],
+                }
+                for _ in range(count)
+            ]
+            serializer = WritableSurveyAnswerSerializer(data=data, many=True)
+            with CaptureQueriesContext(connection) as queries:
+                self.assertTrue(serializer.is_valid())
+            return len(queries)
+
+        self.assertEqual(validation_queries(5), validation_queries(50))
+
+    def test_add_survey_image_answers(self):
+        url = self.reverse(
+            "survey-add-answers", kwargs={"version": "v1", "pk": self.survey.pk}
+        )
+        question = self.baker.make("survey.Question", answer_type="multiple_image")
+        image_file = io.BytesIO()
+        Image.new("RGB", (1, 1)).save(image_file, "png")
+        image_path = default_storage.save(
+            "test_image.png", ContentFile(image_file.getvalue())
+        )
+        text_path = default_storage.save("test_text.png", ContentFile(b"text"))
+        self.client.force_authenticate(self.user)
+        data = {
+            "question": question.pk,
+            "answer": image_path,
+            "answerType": "multiple_image",
+        }
+        response = self.client.post(url, data=data, format="json")
+        self.assertEqual(response.status_code, self.status_code.HTTP_201_CREATED)
+        data["answer"] = ",".join([image_path, text_path, "missing_image.png"])
+        response = self.client.post(url, data=data, format="json")
+        self.assertEqual(response.status_code, self.status_code.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            set(response.json()["answer"]), {text_path, "missing_image.png"}
+        )
+        default_storage.delete(image_path)
+        default_storage.delete(text_path)
+
+    def test_survey_answer_typed_columns(self):
+        question = self.baker.make("survey.Question", answer_type="number")
+        answers = [
+            {"question": question, "answer_type": "number", "answer": str(answer)}
+            for answer in [2, 4.5, 6]
+        ]
+        survey_answers = bulk_create_survey_answers(self.survey, answers, self.user)
+        self.assertEqual(
+            [survey_answer.answer_number for survey_answer in survey_answers],
+            [2, 4.5, 6],
+        )
+        location_answer = self.baker.make(
+            "survey.SurveyAnswer",
+            survey=self.survey,
+            answer_type="location",
+            answer='{"type": "Point", "coordinates": [5.0, 23.0]}',
+        )
+        self.assertEqual(location_answer.answer_location.coords, (5.0, 23.0))
+        self.client.force_authenticate(self.user)
+        response = self.client.get(
+            self.reverse(
+                "survey-answer-statistics",
+                kwargs={"version": "v1"},
+                params={"question": question.pk},
+            )
+        )
+        self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 3)
+        self.assertEqual(response.json()["numberAvg"], 4.5)
+        self.assertEqual(response.json()["numberMax"], 6)
+
+    def test_survey_answer_location_filter(self):
+        question = self.baker.make("survey.Question", answer_type="location")
+        near_answer, _far_answer = [
+            self.baker.make(
+                "survey.SurveyAnswer",
+                survey=self.survey,
+                question=question,
+                answer_type="location",
+                answer='{"type": "Point", "coordinates": [%s, %s]}' % coordinates,
+            )
+            for coordinates in [(85.3, 27.7), (10.0, 50.0)]
+        ]
+        self.client.force_authenticate(self.user)
+        bbox_response = self.client.get(
+            self.survey_answer_list_url, {"in_bbox": "85,27,86,28"}
+        )
+        self.assertEqual(bbox_response.status_code, self.status_code.HTTP_200_OK)
+        self.assertEqual(
+            [answer["id"] for answer in bbox_response.json()["results"]],
+            [near_answer.pk],
+        )
+        distance_response = self.client.get(
+            self.survey_answer_list_url, {"point": "85.31,27.71", "dist": 5000}
+        )
+        self.assertEqual(distance_response.status_code, self.status_code.HTTP_200_OK)
+        self.assertEqual(
+            [answer["id"] for answer in distance_response.json()["results"]],
+            [near_answer.pk],
+        )
+
+    def test_survey_answer_image_urls(self):
+        question = self.baker.make("survey.Question", answer_type="multiple_image")
+        image_paths = ["images/first.png", "images/second.png"]
+        self.baker.make(
+            "survey.SurveyAnswer",
+            survey=self.survey,
+            question=question,
+            answer_type="multiple_image",
+            answer=",".join(image_paths),
+            _quantity=3,
+        )
+        self.client.force_authenticate(self.user)
+        response = self.client.get(
+            self.survey_answer_list_url, {"question": question.pk}
+        )
+        self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+        for answer in response.json()["results"]:
+            self.assertEqual(
+                answer["formattedAnswer"],
+                [
+                    response.wsgi_request.build_absolute_uri(
+                        default_storage.url(image_path)
+                    )
+                    for image_path in image_paths
+                ],
+            )
+        for image_path in image_paths:
+            self.assertEqual(
+                cache.get(get_storage_url_cache_key(image_path)),
+                default_storage.url(image_path),
+            )
+
+    def test_survey_answer_export(self):
+        question = self.baker.make("survey.Question", answer_type="multiple_option")
+        options = self.baker.make("survey.Option", question=question, _quantity=2)
+        survey_answer = self.baker.make(
+            "survey.SurveyAnswer",
+            survey=self.survey,
+            question=question,
+            answer_type="multiple_option",
+            options=options,
+        )
+        self.client.force_authenticate(self.user)
+        response = self.client.get(
+            self.reverse(
+                "survey-answer-export",
+                kwargs={"version": "v1"},
+                params={"survey": self.survey.pk},
+            )
+        )
+        self.assertEqual(response.status_code, self.status_code.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        rows = list(
+            csv.reader(
+                io.StringIO(b"".join(response.streaming_content).decode("utf-8"))
+            )
+        )
+        self.assertEqual(rows[0][0], "id")
+        self.assertEqual(rows[0][-1], "options")
+        self.assertEqual(len(rows), self.survey.answers.count() + 1)
+        exported_answer = next(row for row in rows if row[0] == str(survey_answer.pk))
+        self.assertEqual(
+            exported_answer[-1], ",".join(str(option.pk) for option in options)
+        )
@@ -0,0 +1,132 @@
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Count, Max, prefetch_related_objects
+from rest_framework.utils.encoders import JSONEncoder
+
+from summary.models import SurveyResult
+from summary.rollups import add_to_score_rollups
+
+from .models import SurveyAnswer
+
+SHARED_SURVEY_CACHE_TIMEOUT = 60
+
+
+def prefetch_shared_survey(survey):
+    """
+    Prefetch answers along with their options and results of survey so that
+    SharedSurveySerializer runs fixed number of queries regardless of number of
+    answers.
+    """
+    prefetch_related_objects([survey], "answers__options", "results")
+    return survey
+
+
+def get_shared_survey_version(survey):
+    """
+    Return version of shared survey derived from database so that change committed
+    by any process is seen by every process without invalidating cache. Number of
+    rows and latest id of answers, options of answers and results also change when
+    rows are deleted or created in bulk.
+    """
+    parts = [survey.modified_at.isoformat()]
+    for queryset, has_modified_at in [
+        (SurveyAnswer.objects.filter(survey=survey), True),
+        (
+            SurveyAnswer.options.through.objects.filter(surveyanswer__survey=survey),
+            False,
+        ),
+        (SurveyResult.objects.filter(survey=survey), True),
+    ]:
+        aggregates = {"count": Count("pk"), "max_pk": Max("pk")}
+        if has_modified_at:
+            aggregates["last_modified"] = Max("modified_at")
+        validators = queryset.order_by().aggregate(**aggregates)
+        parts.extend(
+            value.isoformat() if hasattr(value, "isoformat") else value
+            for _name, value in sorted(validators.items())
+        )
+    return ":".join(map(str, parts))
+
+
+def get_shared_survey_payload(survey, variant, serialize):
+    """
+    Return ETag and serialized data of publicly shared survey.
+
+    Payload is cached per survey version and variant (identifier, language and
+    host of request) so it is only serialized again after survey, its answers or
+    its results are changed. Payload is cached for short period since it contains
+    signed urls of image answers.
+    """
+    version = get_shared_survey_version(survey)
+    cache_key = (
+        "shared-survey-"
+        + hashlib.sha256(f"{variant}:{survey.pk}:{version}".encode()).hexdigest()
+    )
+    payload = cache.get(cache_key)
+    if payload is None:
+        data = serialize()
+        etag = hashlib.sha256(
+            json.dumps(data, cls=JSONEncoder, sort_keys=True).encode()
+        ).hexdigest()
+        payload = (etag, data)
+        cache.set(cache_key, payload, timeout=SHARED_SURVEY_CACHE_TIMEOUT)
+    return payload
+
+
+def bulk_create_survey_answers(survey, validated_answers, created_by):
+    """
+    Create survey answers along with their options for survey.
+
+    All answers are inserted with single bulk insert and all selected options are
+    inserted into SurveyAnswer.options through table with another bulk insert so
+    number of queries doesn't grow with number of answers. Whole batch is created
+    inside single transaction so either all answers are created or none of them.
+    """
+    answer_options = []
+    survey_answers = []
+    for validated_answer in validated_answers:
+        answer_data = dict(validated_answer)
+        options = answer_data.pop("options", None) or []
+        # same option can be passed multiple times which is ignored by options.add()
+        answer_options.append(list(dict.fromkeys(options)))
+        survey_answer = SurveyAnswer(
+            **answer_data, survey=survey, created_by=created_by
+        )
+        # bulk_create doesn't call save() so typed answer needs to be set manually
+        survey_answer.populate_typed_answer()
+        survey_answers.append(survey_answer)
+    with transaction.atomic():
+        if connection.features.can_return_rows_from_bulk_insert:
+            SurveyAnswer.objects.bulk_create(survey_answers)
+        else:
+            # primary key of bulk created objects are not set by database backend
+            # which doesn't support returning rows so save answers one by one
+            for survey_answer in survey_answers:
+                survey_answer.save()
+        SurveyAnswerOption = SurveyAnswer.options.through
+        SurveyAnswerOption.objects.bulk_create(
+            [
+                SurveyAnswerOption(surveyanswer=survey_answer, option=option)
+                for survey_answer, options in zip(survey_answers, answer_options)
+                for option in options
+            ]
+        )
+    return survey_answers
+
+
+def bulk_create_survey_results(survey, validated_results, created_by):
+    """
+    Create survey results for survey with single bulk insert inside transaction and
+    add their scores to score rollups of project.
+    """
+    survey_results = [
+        SurveyResult(**validated_result, survey=survey, created_by=created_by)
+        for validated_result in validated_results
+    ]
+    with transaction.atomic():
+        SurveyResult.objects.bulk_create(survey_results)
+        add_to_score_rollups(survey_results)
+    return survey_results
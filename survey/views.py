@@ -1,21 +1,40 @@
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
 
-from django.db.models import Q
+from django.db.models import Avg, Count, Max, Min, Q
+from django.http import QueryDict
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
-from drf_spectacular.utils import extend_schema, inline_serializer
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema, inline_serializer
 from rest_framework import mixins, permissions, serializers, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework_gis.filters import DistanceToPointFilter, InBBoxFilter
 
 from neatplus.permissions import IsOwner, IsOwnerOrReadOnly
 from neatplus.utils import gen_random_string
-from neatplus.views import UserStampedModelViewSetMixin
+from neatplus.views import CSVExportMixin, UserStampedModelViewSetMixin
 from project.utils import read_allowed_project_for_user
-from summary.models import SurveyResult
-from summary.serializers import WritableSurveyResultSerializer
+from summary.scoring import save_survey_scores
+from summary.serializers import SurveyResultSerializer, WritableSurveyResultSerializer
 
-from .filters import OptionFilter, QuestionFilter, SurveyAnswerFilter, SurveyFilter
-from .models import Option, Question, QuestionGroup, Survey, SurveyAnswer
+from .filters import (
+    OptionFilter,
+    QuestionFilter,
+    SurveyAnswerFilter,
+    SurveyFilter,
+    SurveySubmissionJobFilter,
+)
+from .models import (
+    Option,
+    Question,
+    QuestionGroup,
+    Survey,
+    SurveyAnswer,
+    SurveySubmissionJob,
+)
 from .permissions import CanWriteSurvey, CanWriteSurveyOrReadOnly
 from .serializers import (
     OptionSerializer,
@@ -24,8 +43,47 @@ from .serializers import (
     SharedSurveySerializer,
     SurveyAnswerSerializer,
     SurveySerializer,
+    SurveySubmissionJobSerializer,
     WritableSurveyAnswerSerializer,
 )
+from .utils import (
+    SHARED_SURVEY_CACHE_TIMEOUT,
+    bulk_create_survey_answers,
+    bulk_create_survey_results,
+    get_shared_survey_payload,
+    prefetch_shared_survey,
+)
+
+ASYNC_SUBMISSION_PARAMETER = OpenApiParameter(
+    "async",
+    OpenApiTypes.BOOL,
+    description=_(
+        "Process submission in background and return submission job with 202 status"
+    ),
+)
+
+
+class AsyncSubmissionMixin:
+    def is_async_submission(self):
+        return self.request.query_params.get("async", "").lower() in ["1", "true"]
+
+    def start_submission_job(self, submission_type, project, survey=None):
+        if isinstance(self.request.data, QueryDict):
+            return Response(
+                {"error": _("Asynchronous submission only supports JSON payload")},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        job = SurveySubmissionJob.objects.create(
+            submission_type=submission_type,
+            project=project,
+            survey=survey,
+            payload=self.request.data,
+            created_by=self.request.user,
+        )
+        job.start(self.get_serializer_context())
+        job.refresh_from_db()
+        serializer = SurveySubmissionJobSerializer(job)
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
 
 
 class QuestionGroupViewSet(UserStampedModelViewSetMixin, viewsets.ModelViewSet):
@@ -46,6 +104,7 @@ class OptionViewSet(UserStampedModelViewSetMixin, viewsets.ModelViewSet):
 
 
 class SurveyViewSet(
+    AsyncSubmissionMixin,
     mixins.RetrieveModelMixin,
     mixins.UpdateModelMixin,
     mixins.DestroyModelMixin,
@@ -156,23 +215,37 @@ class SurveyViewSet(
         survey = Survey.objects.filter(
             shared_link_identifier=identifier, is_shared_publicly=True
         ).first()
-        if survey:
-            serializer = self.get_serializer(survey)
-            return Response(serializer.data)
-        else:
+        if not survey:
             return Response(
                 {"error": _("Identifier not found")}, status=status.HTTP_404_NOT_FOUND
             )
+        etag, data = get_shared_survey_payload(
+            survey,
+            f"{identifier}:{get_language()}:{request.get_host()}",
+            lambda: self.get_serializer(prefetch_shared_survey(survey)).data,
+        )
+        # payload is served compressed by GZipMiddleware which weakens strong ETag
+        etag = f'W/"{etag}"'
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = Response(data)
+        response["ETag"] = etag
+        patch_cache_control(response, public=True, max_age=SHARED_SURVEY_CACHE_TIMEOUT)
+        return response
 
     @extend_schema(
-        responses=inline_serializer(
-            name="AddSurveyAnswerResponseSerializer",
-            fields={
-                "detail": serializers.CharField(
-                    default=_("Successfully added survey answers")
-                )
-            },
-        )
+        parameters=[ASYNC_SUBMISSION_PARAMETER],
+        responses={
+            201: inline_serializer(
+                name="AddSurveyAnswerResponseSerializer",
+                fields={
+                    "detail": serializers.CharField(
+                        default=_("Successfully added survey answers")
+                    )
+                },
+            ),
+            202: SurveySubmissionJobSerializer,
+        },
     )
     @action(
         methods=["post"],
@@ -182,6 +255,12 @@ class SurveyViewSet(
     )
     def add_answers(self, request, *args, **kwargs):
         survey = self.get_object()
+        if self.is_async_submission():
+            return self.start_submission_job(
+                SurveySubmissionJob.SubmissionTypeChoices.ADD_ANSWERS,
+                survey.project,
+                survey=survey,
+            )
         user = self.request.user
         data = request.data
         if isinstance(data, dict):
@@ -195,27 +274,25 @@ class SurveyViewSet(
         if isinstance(validated_data, OrderedDict):
             validated_data = [validated_data]
 
-        for validated_datum in validated_data:
-            options = validated_datum.pop("options", None)
-            survey_answer = SurveyAnswer.objects.create(
-                **validated_datum, survey=survey, created_by=user
-            )
-            if options:
-                survey_answer.options.add(*options)
+        bulk_create_survey_answers(survey, validated_data, user)
         return Response(
             {"detail": _("Successfully added survey answers")},
             status=status.HTTP_201_CREATED,
         )
 
     @extend_schema(
-        responses=inline_serializer(
-            name="AddSurveyResultResponseSerializer",
-            fields={
-                "detail": serializers.CharField(
-                    default=_("Successfully added survey results")
-                )
-            },
-        )
+        parameters=[ASYNC_SUBMISSION_PARAMETER],
+        responses={
+            201: inline_serializer(
+                name="AddSurveyResultResponseSerializer",
+                fields={
+                    "detail": serializers.CharField(
+                        default=_("Successfully added survey results")
+                    )
+                },
+            ),
+            202: SurveySubmissionJobSerializer,
+        },
     )
     @action(
         methods=["post"],
@@ -225,6 +302,12 @@ class SurveyViewSet(
     )
     def add_results(self, request, *args, **kwargs):
         survey = self.get_object()
+        if self.is_async_submission():
+            return self.start_submission_job(
+                SurveySubmissionJob.SubmissionTypeChoices.ADD_RESULTS,
+                survey.project,
+                survey=survey,
+            )
         user = self.request.user
         data = request.data
 
@@ -240,17 +323,30 @@ class SurveyViewSet(
         if isinstance(validated_data, OrderedDict):
             validated_data = [validated_data]
 
-        for validated_datum in validated_data:
-            SurveyResult.objects.create(
-                **validated_datum, survey=survey, created_by=user
-            )
+        bulk_create_survey_results(survey, validated_data, user)
         return Response(
             {"detail": _("Successfully added survey results")},
             status=status.HTTP_201_CREATED,
         )
 
+    @extend_schema(responses={201: SurveyResultSerializer(many=True)})
+    @action(
+        methods=["post"],
+        detail=True,
+        permission_classes=[CanWriteSurvey],
+        serializer_class=serializers.Serializer,
+    )
+    def calculate_results(self, request, *args, **kwargs):
+        survey = self.get_object()
+        survey_results = save_survey_scores([survey.pk], user=request.user)
+        return Response(
+            SurveyResultSerializer(survey_results, many=True).data,
+            status=status.HTTP_201_CREATED,
+        )
+
 
 class SurveyAnswerViewSet(
+    CSVExportMixin,
     mixins.RetrieveModelMixin,
     mixins.UpdateModelMixin,
     mixins.DestroyModelMixin,
@@ -259,7 +355,27 @@ class SurveyAnswerViewSet(
 ):
     serializer_class = SurveyAnswerSerializer
     permission_classes = [CanWriteSurveyOrReadOnly]
+    filter_backends = [
+        *api_settings.DEFAULT_FILTER_BACKENDS,
+        InBBoxFilter,
+        DistanceToPointFilter,
+    ]
     filterset_class = SurveyAnswerFilter
+    csv_export_fields = [
+        "id",
+        "survey__project_id",
+        "survey_id",
+        "question_id",
+        "question__title",
+        "answer_type",
+        "answer",
+        "created_at",
+    ]
+    csv_export_filename = "survey_answers.csv"
+    bbox_filter_field = "answer_location"
+    bbox_filter_include_overlapping = True
+    distance_filter_field = "answer_location"
+    distance_filter_convert_meters = True
 
     def get_queryset(self):
         current_user = self.request.user
@@ -267,4 +383,64 @@ class SurveyAnswerViewSet(
         surveys = Survey.objects.filter(
             Q(project__in=projects) | Q(created_by=current_user)
         )
-        return SurveyAnswer.objects.filter(survey__in=surveys)
+        return SurveyAnswer.objects.filter(survey__in=surveys).prefetch_related(
+            "options"
+        )
+
+    def get_csv_export_header(self):
+        return [*self.csv_export_fields, "options"]
+
+    def get_csv_export_chunk(self, rows):
+        survey_answer_options = defaultdict(list)
+        for survey_answer_id, option_id in (
+            SurveyAnswer.options.through.objects.filter(
+                surveyanswer_id__in=[row[0] for row in rows]
+            )
+            .order_by("pk")
+            .values_list("surveyanswer_id", "option_id")
+        ):
+            survey_answer_options[survey_answer_id].append(str(option_id))
+        return [[*row, ",".join(survey_answer_options[row[0]])] for row in rows]
+
+    @extend_schema(
+        responses=inline_serializer(
+            name="SurveyAnswerStatisticsResponseSerializer",
+            fields={
+                "count": serializers.IntegerField(),
+                "number_avg": serializers.FloatField(allow_null=True),
+                "number_min": serializers.FloatField(allow_null=True),
+                "number_max": serializers.FloatField(allow_null=True),
+                "date_min": serializers.DateField(allow_null=True),
+                "date_max": serializers.DateField(allow_null=True),
+                "boolean_true_count": serializers.IntegerField(),
+                "boolean_false_count": serializers.IntegerField(),
+            },
+        )
+    )
+    @action(methods=["get"], detail=False)
+    def statistics(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        statistics = queryset.aggregate(
+            count=Count("pk"),
+            number_avg=Avg("answer_number"),
+            number_min=Min("answer_number"),
+            number_max=Max("answer_number"),
+            date_min=Min("answer_date"),
+            date_max=Max("answer_date"),
+            boolean_true_count=Count("pk", filter=Q(answer_boolean=True)),
+            boolean_false_count=Count("pk", filter=Q(answer_boolean=False)),
+        )
+        return Response(statistics, status=status.HTTP_200_OK)
+
+
+class SurveySubmissionJobViewSet(
+    mixins.RetrieveModelMixin,
+    mixins.ListModelMixin,
+    viewsets.GenericViewSet,
+):
+    serializer_class = SurveySubmissionJobSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    filterset_class = SurveySubmissionJobFilter
+
+    def get_queryset(self):
+        return SurveySubmissionJob.objects.filter(created_by=self.request.user)
@@ -1,20 +1,18 @@
-from django.apps import apps
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import MaxLengthValidator, MinLengthValidator
 from django.db import models
-from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from neatplus.auth_validators import CustomASCIIUsernameValidator
 from neatplus.fields import LowerCharField, LowerEmailField
 from neatplus.managers import CustomUserManager
-from neatplus.models import TimeStampedModel
+from neatplus.models import DirtyFieldsMixin, TimeStampedModel
 
 from .tasks import send_user_mail
 
 
-class User(AbstractUser):
+class User(DirtyFieldsMixin, AbstractUser):
     username_validator = CustomASCIIUsernameValidator()
 
     # Abstract user modification
@@ -61,32 +59,12 @@ class User(AbstractUser):
 
     objects = CustomUserManager()
 
-    def save(self, *args, **kwargs):
-        if self.pk:
-            cls = self.__class__
-            old = cls.objects.get(pk=self.pk)
-            changed_fields = []
-            for field in cls._meta.get_fields():
-                field_name = field.name
-                try:
-                    old_val = getattr(old, field_name)
-                    new_val = getattr(self, field_name)
-                    if hasattr(field, "is_custom_lower_field"):
-                        if field.is_custom_lower_field():
-                            new_val = new_val.lower()
-                    if old_val != new_val:
-                        changed_fields.append(field_name)
-                except Exception:
-                    pass
-            kwargs["update_fields"] = changed_fields
-        super().save(*args, **kwargs)
-
     def notify(
         self,
         actor,
         verb,
         notification_type=None,
-        timestamp=timezone.now(),
+        timestamp=None,
         action_object=None,
         target=None,
         description=None,
@@ -107,24 +85,17 @@ class User(AbstractUser):
 
         Use '{actor} {verb} {action_object(optional)} on {target(optional)}' as description if description is not provided
         """
-        if not description:
-            extra_content = ""
-            if action_object:
-                extra_content += f" {action_object}"
-            if target:
-                extra_content += f" on {target}"
-
-        description = f"{actor} {verb}{extra_content}"
-        NotificationModel = apps.get_model("notification", "Notification")
-        NotificationModel.objects.create(
-            recipient=self,
-            actor_content_object=actor,
-            verb=verb,
-            description=description,
+        from notification.dispatch import notification
+
+        notification(
+            self,
+            actor,
+            verb,
             notification_type=notification_type,
             timestamp=timestamp,
-            action_object_content_object=action_object,
-            target_content_object=target,
+            action_object=action_object,
+            target=target,
+            description=description,
         )
 
     def celery_email_user(self, subject, message, from_email=None, **kwargs):
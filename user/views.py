@@ -11,7 +11,7 @@ from rest_framework import mixins, permissions, serializers, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
-from neatplus.utils import gen_random_number, gen_random_string
+from neatplus.utils import gen_random_number, gen_random_string, mark_images_validated
 from support.models import EmailTemplate
 
 from .models import EmailChangePin, EmailConfirmationPin, PasswordResetPin, User
@@ -666,6 +666,7 @@ class UserViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
             "user_uploaded_file", f"{username}", upload_file_name
         )
         saved_file = default_storage.save(upload_path, file)
+        mark_images_validated([saved_file])
         url = request.build_absolute_uri(default_storage.url(saved_file))
         data = {"name": saved_file, "url": url}
         return Response(data)